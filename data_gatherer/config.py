@@ -4,12 +4,21 @@ import yaml
 from dataclasses import dataclass, field
 from typing import List, Optional, Set, Dict
 import fnmatch
+import re
+from functools import lru_cache
 
 DEFAULT_CONFIG_FILE = 'config.yaml'
 DEFAULT_INCLUDE_KINDS = [
     'Deployment', 'StatefulSet', 'DaemonSet', 'CronJob', 'DeploymentConfig', 'Node'
 ]
 
+@lru_cache(maxsize=32)
+def _compile_namespace_patterns(patterns: tuple) -> Optional[re.Pattern]:
+    """One regex matching any of the glob ``patterns`` (None when empty)."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(fnmatch.translate(pat) for pat in patterns))
+
 @dataclass
 class ClusterCredentials:
     host: str
@@ -37,10 +46,10 @@ class ClusterConfig:
     def is_namespace_excluded(self, namespace: str) -> bool:
         if namespace in self.exclude_namespaces:
             return True
-        for pat in self.exclude_namespace_patterns:
-            if fnmatch.fnmatch(namespace, pat):
-                return True
-        return False
+        # Called for every listed item; the glob patterns are compiled into a
+        # single regex once per distinct pattern list
+        pattern = _compile_namespace_patterns(tuple(self.exclude_namespace_patterns))
+        return pattern is not None and pattern.match(namespace) is not None
 
 @dataclass
 class StorageConfig:
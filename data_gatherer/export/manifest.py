@@ -13,6 +13,12 @@ from typing import Iterable, Dict, Any, Literal, Optional
 import yaml
 
 
+def _target_order(item: Dict[str, Any], namespaced: bool):
+    meta = item.get('metadata', {})
+    ns = meta.get('namespace', 'default') if namespaced else ''
+    return ns, meta.get('name') or ''
+
+
 class ManifestExporter:
     def __init__(self, base_dir: str, enabled: bool = True, skip_if_exists: bool = False,
                  fmt: Literal['json','yaml'] = 'json', archive: Optional[str] = None):
@@ -27,6 +33,9 @@ class ManifestExporter:
         self.fmt = fmt
         self.archive_path = archive
         self._tar: tarfile.TarFile | None = None
+        # Directories already created by this exporter; avoids a makedirs
+        # syscall per written file
+        self._created_dirs: set[str] = set()
         if self.enabled and not self.archive_path:
             os.makedirs(self.base_dir, exist_ok=True)
 
@@ -48,6 +57,10 @@ class ManifestExporter:
             return 0
         self._open_archive()
         count = 0
+        ext = 'json' if self.fmt == 'json' else 'yaml'
+        # Write in target path order so each directory is filled in one run.
+        # Sorts a copy: sync hands the same list to the database writer.
+        items = sorted(items, key=lambda it: _target_order(it, namespaced))
         for item in items:
             meta = item.get('metadata', {})
             name = meta.get('name')
@@ -58,19 +71,20 @@ class ManifestExporter:
                 rel_dir = os.path.join(kind, ns)
             else:
                 rel_dir = kind
-            ext = 'json' if self.fmt == 'json' else 'yaml'
-            rel_path = os.path.join(rel_dir, f'{name}.{ext}')
-            full_dir = os.path.join(self.base_dir, rel_dir)
-            data = self._serialize(item)
             if self.archive_path:
-                info = tarfile.TarInfo(rel_path)
+                data = self._serialize(item)
+                info = tarfile.TarInfo(os.path.join(rel_dir, f'{name}.{ext}'))
                 info.size = len(data)
                 self._tar.addfile(info, io.BytesIO(data))
             else:
-                os.makedirs(full_dir, exist_ok=True)
+                full_dir = os.path.join(self.base_dir, rel_dir)
+                if full_dir not in self._created_dirs:
+                    os.makedirs(full_dir, exist_ok=True)
+                    self._created_dirs.add(full_dir)
                 full_path = os.path.join(full_dir, f'{name}.{ext}')
                 if self.skip_if_exists and os.path.exists(full_path):
                     continue
+                data = self._serialize(item)
                 with open(full_path, 'wb') as f:
                     f.write(data)
             count += 1
@@ -2,7 +2,9 @@ from __future__ import annotations
 from typing import Dict, Any, List, Tuple, Iterable
 from kubernetes import config as k8s_config, client as k8s_client
 from kubernetes.client.exceptions import ApiException
-import urllib3, time, json
+import urllib3, time, json, socket
+from urllib3.connection import HTTPConnection
+from urllib.parse import urlencode
 from ..util import logging as log
 urllib3.disable_warnings()
 
@@ -28,6 +30,24 @@ def configure_from_credentials(credentials) -> k8s_client.Configuration:
     if not credentials.verify_ssl: log.warn('ssl_verification_disabled', host=credentials.host)
     return cfg
 
+# TCP keepalive probing: first probe after KEEPIDLE idle seconds, then every
+# KEEPINTVL seconds; the connection is dropped after KEEPCNT failed probes
+_TCP_KEEPALIVE = (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 15), ('TCP_KEEPCNT', 4))
+
+def enable_tcp_keepalive(api_client: k8s_client.ApiClient) -> None:
+    """Turn on TCP keepalive for the connections ``api_client`` opens.
+
+    Set on the client's urllib3 pool manager rather than through
+    Configuration.keep_alive, which older kubernetes client releases ignore.
+    Must be called before the first request; socket options already set
+    through the configuration are kept.
+    """
+    options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in _TCP_KEEPALIVE:
+        if hasattr(socket, name):  # not available on every platform
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    api_client.rest_client.pool_manager.connection_pool_kw.setdefault('socket_options', options)
+
 STATIC_KIND_MAP: Dict[str, Tuple[str, str, bool]] = {
     'Deployment': ('apps/v1', 'deployments', True),
     'StatefulSet': ('apps/v1', 'statefulsets', True),
@@ -40,19 +60,33 @@ STATIC_KIND_MAP: Dict[str, Tuple[str, str, bool]] = {
     'Node': ('v1', 'nodes', False),
 }
 
+# Items requested per list call; the apiserver hands out the rest through
+# `continue` tokens, so only one page of JSON is held in memory at a time
+LIST_PAGE_SIZE = 500
+
+def _page_query(cont: str | None) -> str:
+    params = {'limit': LIST_PAGE_SIZE}
+    if cont:
+        params['continue'] = cont
+    return '?' + urlencode(params)
+
 def _split_api_version(api_version: str) -> Tuple[str | None, str]:
     if '/' in api_version:
         group, version = api_version.split('/', 1)
         return group, version
     return None, api_version
 
-def list_resources(api_client: k8s_client.ApiClient, api_version: str, plural: str, max_retries: int = 4, backoff_base: float = 0.5) -> Iterable[Dict[str, Any]]:
-    group, version = _split_api_version(api_version)
-    base = f"/api/{version}/{plural}" if group is None else f"/apis/{group}/{version}/{plural}"
+def _list_pages(api_client: k8s_client.ApiClient, base: str, skip_event: str, scope: str, max_retries: int,
+                backoff_base: float, **ctx) -> Iterable[Dict[str, Any]]:
+    """Yield the items of a list endpoint one page at a time.
+
+    Follows `continue` tokens until the apiserver reports no more pages;
+    transient errors are retried with exponential backoff. ``ctx`` is added
+    to every log event.
+    """
     cont = None
     while True:
-        query = f"?continue={cont}" if cont else ''
-        url = base + query
+        url = base + _page_query(cont)
         attempt = 0
         while True:
             try:
@@ -62,20 +96,20 @@ def list_resources(api_client: k8s_client.ApiClient, api_version: str, plural: s
             except ApiException as e:
                 status = getattr(e, 'status', None)
                 if status in (403, 404):
-                    log.warn('skipping kind due to access/availability', api_version=api_version, plural=plural, status=status)
+                    log.warn(skip_event, **ctx, status=status)
                     return
                 if status in (429, 500, 502, 503, 504) and attempt < max_retries:
                     sleep_for = backoff_base * (2 ** attempt)
-                    log.warn('transient error, retrying', api_version=api_version, plural=plural, status=status, attempt=attempt+1, sleep=sleep_for)
+                    log.warn('transient error, retrying', **ctx, status=status, attempt=attempt+1, sleep=sleep_for)
                     time.sleep(sleep_for); attempt += 1; continue
-                log.error('failed listing resources', api_version=api_version, plural=plural, status=status, reason=str(e))
+                log.error(f'failed listing {scope}', **ctx, status=status, reason=str(e))
                 return
             except Exception as e:
                 if attempt < max_retries:
                     sleep_for = backoff_base * (2 ** attempt)
-                    log.warn('generic error, retrying', api_version=api_version, plural=plural, attempt=attempt+1, sleep=sleep_for, error=str(e))
+                    log.warn('generic error, retrying', **ctx, attempt=attempt+1, sleep=sleep_for, error=str(e))
                     time.sleep(sleep_for); attempt += 1; continue
-                log.error('unhandled error listing resources', api_version=api_version, plural=plural, error=str(e))
+                log.error(f'unhandled error listing {scope}', **ctx, error=str(e))
                 return
         for item in payload.get('items', []):
             yield item
@@ -83,6 +117,12 @@ def list_resources(api_client: k8s_client.ApiClient, api_version: str, plural: s
         if not cont:
             break
 
+def list_resources(api_client: k8s_client.ApiClient, api_version: str, plural: str, max_retries: int = 4, backoff_base: float = 0.5) -> Iterable[Dict[str, Any]]:
+    group, version = _split_api_version(api_version)
+    base = f"/api/{version}/{plural}" if group is None else f"/apis/{group}/{version}/{plural}"
+    return _list_pages(api_client, base, 'skipping kind due to access/availability', 'resources',
+                       max_retries, backoff_base, api_version=api_version, plural=plural)
+
 def resolve_kinds(include_kinds: List[str]) -> Dict[str, Tuple[str, str, bool]]:
     return {k: STATIC_KIND_MAP[k] for k in include_kinds if k in STATIC_KIND_MAP}
 
@@ -90,36 +130,5 @@ def list_namespaced_resources(api_client: k8s_client.ApiClient, api_version: str
     """List resources restricted to a given namespace (namespace-scoped mode)."""
     group, version = _split_api_version(api_version)
     base = f"/api/{version}/namespaces/{namespace}/{plural}" if group is None else f"/apis/{group}/{version}/namespaces/{namespace}/{plural}"
-    cont = None
-    while True:
-        query = f"?continue={cont}" if cont else ''
-        url = base + query
-        attempt = 0
-        while True:
-            try:
-                resp = api_client.call_api(url, 'GET', response_type='object', _preload_content=False, auth_settings=['BearerToken'])
-                payload = json.loads(resp[0].data)
-                break
-            except ApiException as e:
-                status = getattr(e, 'status', None)
-                if status in (403, 404):
-                    log.warn('skipping namespace due to access/availability', api_version=api_version, plural=plural, namespace=namespace, status=status)
-                    return
-                if status in (429, 500, 502, 503, 504) and attempt < max_retries:
-                    sleep_for = backoff_base * (2 ** attempt)
-                    log.warn('transient error, retrying', api_version=api_version, plural=plural, namespace=namespace, status=status, attempt=attempt+1, sleep=sleep_for)
-                    time.sleep(sleep_for); attempt += 1; continue
-                log.error('failed listing namespaced resources', api_version=api_version, plural=plural, namespace=namespace, status=status, reason=str(e))
-                return
-            except Exception as e:
-                if attempt < max_retries:
-                    sleep_for = backoff_base * (2 ** attempt)
-                    log.warn('generic error, retrying', api_version=api_version, plural=plural, namespace=namespace, attempt=attempt+1, sleep=sleep_for, error=str(e))
-                    time.sleep(sleep_for); attempt += 1; continue
-                log.error('unhandled error listing namespaced resources', api_version=api_version, plural=plural, namespace=namespace, error=str(e))
-                return
-        for item in payload.get('items', []):
-            yield item
-        cont = payload.get('metadata', {}).get('continue')
-        if not cont:
-            break
+    return _list_pages(api_client, base, 'skipping namespace due to access/availability', 'namespaced resources',
+                       max_retries, backoff_base, api_version=api_version, plural=plural, namespace=namespace)
@@ -3,8 +3,9 @@ import sqlite3
 import os
 import json
 from dataclasses import dataclass
-from typing import Optional, Iterable, Tuple, List
+from typing import Optional, Iterable, Tuple, List, Dict, Any
 from contextlib import contextmanager
+from pathlib import Path
 from datetime import datetime, timezone
 
 SCHEMA = """
@@ -50,6 +51,7 @@ CREATE TABLE IF NOT EXISTS node_capacity (
 );
 CREATE UNIQUE INDEX IF NOT EXISTS node_capacity_identity ON node_capacity(cluster, node_name);
 CREATE INDEX IF NOT EXISTS node_capacity_deleted ON node_capacity(deleted);
+CREATE INDEX IF NOT EXISTS node_capacity_role ON node_capacity(cluster, node_role, node_name);
 CREATE TABLE IF NOT EXISTS cluster_meta (
   cluster TEXT NOT NULL,
   key TEXT NOT NULL,
@@ -65,9 +67,23 @@ class UpsertResult:
     unchanged: int = 0
 
 class WorkloadDB:
-    def __init__(self, path: str):
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+    def __init__(self, path: str, read_only: bool = False):
+        """Open (creating if needed) the database at ``path``.
+
+        With ``read_only`` the existing file is opened with ``mode=ro`` and
+        ``query_only`` and the schema setup is skipped; used by the commands
+        that only read (status, report, nodes).
+        """
         self.path = path
+        # Set while batch() is open; row writes then leave committing to it
+        self._batching = False
+        if read_only:
+            uri = Path(os.path.abspath(path)).as_uri() + '?mode=ro'
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute('PRAGMA query_only=ON')
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
         self._conn = sqlite3.connect(path, check_same_thread=False)
         self._conn.row_factory = sqlite3.Row
         cur = self._conn.cursor()
@@ -85,11 +101,47 @@ class WorkloadDB:
             raise
         finally:
             cur.close()
+    @contextmanager
+    def batch(self):
+        """Run writes in one write transaction, committed when the block exits."""
+        if not self._conn.in_transaction:
+            self._conn.execute('BEGIN IMMEDIATE')
+        self._batching = True
+        try:
+            yield
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        finally:
+            self._batching = False
+    @contextmanager
+    def savepoint(self, name: str):
+        """Nest a block inside the open transaction; only the block is undone if it raises."""
+        self._conn.execute(f'SAVEPOINT {name}')
+        try:
+            yield
+        except Exception:
+            self._conn.execute(f'ROLLBACK TO {name}')
+            self._conn.execute(f'RELEASE {name}')
+            raise
+        self._conn.execute(f'RELEASE {name}')
+    def _commit(self):
+        if not self._batching:
+            self._conn.commit()
     def upsert_workload(self, cluster: str, api_version: str, kind: str, namespace: str, name: str,
                         resource_version: Optional[str], uid: Optional[str], manifest: dict,
-                        manifest_hash: str, now: Optional[datetime] = None) -> Tuple[str, bool]:
+                        manifest_hash: str, now: Optional[datetime] = None,
+                        manifest_json: Optional[str] = None) -> Tuple[str, bool]:
+        """Insert or update one workload row.
+
+        ``manifest_json`` may carry the manifest already serialized as
+        canonical JSON (sorted keys, compact separators) to avoid encoding it
+        a second time.
+        """
         now_s = (now or datetime.now(timezone.utc)).isoformat()
-        manifest_json = json.dumps(manifest, separators=(',', ':'), sort_keys=True)
+        if manifest_json is None:
+            manifest_json = json.dumps(manifest, separators=(',', ':'), sort_keys=True)
         cur = self._conn.cursor()
         cur.execute("SELECT manifest_hash, deleted FROM workload WHERE cluster=? AND kind=? AND namespace=? AND name=?", (
             cluster, kind, namespace, name
@@ -100,7 +152,7 @@ class WorkloadDB:
                 cur.execute("""INSERT INTO workload(cluster, api_version, kind, namespace, name, resource_version, uid, first_seen, last_seen, deleted, manifest_json, manifest_hash)
                              VALUES(?,?,?,?,?,?,?,?,?,0,?,?)""",
                             (cluster, api_version, kind, namespace, name, resource_version, uid, now_s, now_s, manifest_json, manifest_hash))
-                self._conn.commit()
+                self._commit()
                 return ('inserted', True)
             except sqlite3.IntegrityError:
                 cur.execute("SELECT manifest_hash, deleted FROM workload WHERE cluster=? AND kind=? AND namespace=? AND name= ?", (
@@ -114,14 +166,62 @@ class WorkloadDB:
             cur.execute("UPDATE workload SET last_seen=?, deleted=0 WHERE cluster=? AND kind=? AND namespace=? AND name=?", (
                 now_s, cluster, kind, namespace, name
             ))
-            self._conn.commit()
+            self._commit()
             return ('unchanged', was_deleted == 1)
         else:
             cur.execute("UPDATE workload SET api_version=?, resource_version=?, uid=?, last_seen=?, manifest_json=?, manifest_hash=?, deleted=0 WHERE cluster=? AND kind=? AND namespace=? AND name= ?", (
                 api_version, resource_version, uid, now_s, manifest_json, manifest_hash, cluster, kind, namespace, name
             ))
-            self._conn.commit()
+            self._commit()
             return ('updated', True)
+
+    def load_resource_versions(self, cluster: str, kind: str) -> Dict[Tuple[str, str], Tuple[Optional[str], str]]:
+        """Stored (resource_version, manifest_hash) of every workload of ``kind``, by (namespace, name)."""
+        cur = self._conn.execute(
+            "SELECT namespace, name, resource_version, manifest_hash FROM workload WHERE cluster=? AND kind=?",
+            (cluster, kind)
+        )
+        return {(ns, name): (rv, manifest_hash) for ns, name, rv, manifest_hash in cur}
+
+    def upsert_workloads(self, cluster: str, api_version: str, kind: str,
+                         rows: Iterable[Tuple[str, str, Optional[str], Optional[str], Optional[str], str]],
+                         now: Optional[datetime] = None,
+                         stored: Optional[Dict[Tuple[str, str], Tuple[Optional[str], str]]] = None) -> UpsertResult:
+        """Upsert many workloads of one kind, as upsert_workload does row by row.
+
+        ``rows`` are (namespace, name, resource_version, uid, manifest_json,
+        manifest_hash) with manifest_json already canonical; it may be None
+        when manifest_hash is the stored one. The kind's stored hashes are
+        read with one query, or taken from ``stored`` as returned by
+        load_resource_versions(), and the writes go out as one executemany
+        per outcome; a repeated (namespace, name) keeps its last row.
+        """
+        now_s = (now or datetime.now(timezone.utc)).isoformat()
+        latest = {(row[0], row[1]): row for row in rows}
+        cur = self._conn.cursor()
+        if stored is None:
+            stored = self.load_resource_versions(cluster, kind)
+        inserts, unchanged, updates = [], [], []
+        for key, (namespace, name, resource_version, uid, manifest_json, manifest_hash) in latest.items():
+            if key not in stored:
+                inserts.append((cluster, api_version, kind, namespace, name, resource_version, uid,
+                                now_s, now_s, manifest_json, manifest_hash))
+            elif stored[key][1] == manifest_hash:
+                unchanged.append((now_s, cluster, kind, namespace, name))
+            else:
+                updates.append((api_version, resource_version, uid, now_s, manifest_json, manifest_hash,
+                                cluster, kind, namespace, name))
+        if inserts:
+            cur.executemany("""INSERT INTO workload(cluster, api_version, kind, namespace, name, resource_version, uid, first_seen, last_seen, deleted, manifest_json, manifest_hash)
+                             VALUES(?,?,?,?,?,?,?,?,?,0,?,?)""", inserts)
+        if unchanged:
+            cur.executemany("UPDATE workload SET last_seen=?, deleted=0 WHERE cluster=? AND kind=? AND namespace=? AND name=?",
+                            unchanged)
+        if updates:
+            cur.executemany("UPDATE workload SET api_version=?, resource_version=?, uid=?, last_seen=?, manifest_json=?, manifest_hash=?, deleted=0 WHERE cluster=? AND kind=? AND namespace=? AND name=?",
+                            updates)
+        self._commit()
+        return UpsertResult(inserted=len(inserts), updated=len(updates), unchanged=len(unchanged))
     def mark_deleted(self, cluster: str, alive_keys: Iterable[Tuple[str,str,str]], kinds_scope: Optional[Iterable[str]] = None):
         alive_set = set(alive_keys)
         cur = self._conn.cursor()
@@ -139,7 +239,7 @@ class WorkloadDB:
             if (k, ns, n) not in alive_set:
                 cur.execute("DELETE FROM workload WHERE cluster=? AND kind=? AND namespace=? AND name=?", (cluster, k, ns, n))
                 removed += 1
-        self._conn.commit()
+        self._commit()
         return removed
     def cleanup_obsolete_kinds(self, cluster: str, obsolete_kinds: List[str]) -> int:
         if not obsolete_kinds:
@@ -151,7 +251,7 @@ class WorkloadDB:
         if removed > 0:
             delete_query = f"DELETE FROM workload WHERE cluster=? AND kind IN ({placeholders})"
             cur.execute(delete_query, (cluster, *obsolete_kinds))
-            self._conn.commit()
+            self._commit()
         return removed
     def summary(self, cluster: str) -> dict:
         cur = self._conn.cursor()
@@ -223,7 +323,7 @@ class WorkloadDB:
                 labels.get('topology.kubernetes.io/zone'), node_info.get('osImage'),
                 node_info.get('kernelVersion'), node_info.get('containerRuntimeVersion')
             ))
-            self._conn.commit()
+            self._commit()
             return ('inserted', True)
         else:
             cur.execute("""UPDATE node_capacity SET 
@@ -238,7 +338,7 @@ class WorkloadDB:
                 node_info.get('kernelVersion'), node_info.get('containerRuntimeVersion'),
                 cluster, node_name
             ))
-            self._conn.commit()
+            self._commit()
             return ('updated', True)
     def mark_nodes_deleted(self, cluster: str, alive_nodes: Iterable[str]):
         cur = self._conn.cursor()
@@ -249,7 +349,7 @@ class WorkloadDB:
             if node_name not in alive_set:
                 cur.execute("DELETE FROM node_capacity WHERE cluster=? AND node_name=?", (cluster, node_name))
                 removed += 1
-        self._conn.commit()
+        self._commit()
         return removed
     def set_meta(self, cluster: str, key: str, value: str):
         cur = self._conn.cursor()
@@ -1,6 +1,15 @@
 from __future__ import annotations
 """Query helpers for workload table to avoid scattering raw SQL."""
-from typing import List, Dict, Any
+import json
+from typing import List, Dict, Any, Iterator
+
+# Pod template spec of a workload row, as extract_pod_spec() finds it; CronJobs
+# nest it under jobTemplate. Malformed JSON yields NULL instead of an error.
+_POD_SPEC_SQL = (
+    "CASE WHEN json_valid(manifest_json) THEN json_extract(manifest_json, "
+    "CASE kind WHEN 'CronJob' THEN '$.spec.jobTemplate.spec.template.spec' "
+    "ELSE '$.spec.template.spec' END) END"
+)
 
 
 class WorkloadQueries:
@@ -13,7 +22,6 @@ class WorkloadQueries:
             "SELECT namespace, name, api_version, manifest_json FROM workload WHERE cluster=? AND kind=?",
             (cluster, kind)
         ).fetchall()
-        import json
         result = []
         for namespace, name, api_version, manifest_json in rows:
             result.append({
@@ -36,48 +44,68 @@ class WorkloadQueries:
 
     def list_all(self, cluster: str):
         """Return all workloads with parsed manifest ordered by kind, namespace, name."""
-        cur = self._conn.cursor()
-        rows = cur.execute(
+        return list(self.iter_all(cluster))
+
+    def iter_all(self, cluster: str) -> Iterator[Dict[str, Any]]:
+        """Yield every workload of ``cluster`` one at a time; same rows and order as list_all()."""
+        return self._iter_rows(
             "SELECT kind, namespace, name, api_version, manifest_json FROM workload WHERE cluster=? ORDER BY kind, namespace, name",
             (cluster,)
-        ).fetchall()
-        import json
-        out = []
-        for kind, namespace, name, api_version, manifest_json in rows:
-            try:
-                manifest = json.loads(manifest_json)
-            except Exception:
-                manifest = {'_raw': manifest_json}
-            out.append({
-                'kind': kind,
-                'namespace': namespace,
-                'name': name,
-                'apiVersion': api_version,
-                'manifest': manifest
-            })
-        return out
+        )
+
+    def iter_by_namespace(self, cluster: str) -> Iterator[Dict[str, Any]]:
+        """Like iter_all(), but ordered by namespace, kind, name.
+
+        Cluster-scoped workloads (empty namespace) come first, so callers can
+        group consecutive rows instead of collecting and sorting them.
+        """
+        return self._iter_rows(
+            "SELECT kind, namespace, name, api_version, manifest_json FROM workload WHERE cluster=? ORDER BY namespace, kind, name",
+            (cluster,)
+        )
 
     def list_for_kinds(self, cluster: str, kinds: List[str]):
+        return list(self.iter_for_kinds(cluster, kinds))
+
+    def iter_for_kinds(self, cluster: str, kinds: List[str]) -> Iterator[Dict[str, Any]]:
+        """Yield workloads of the given kinds one at a time, straight from the cursor.
+
+        Same rows and order as list_for_kinds(), without building the result list,
+        so callers that aggregate in a single pass never hold every row dict.
+        """
+        return self._iter_kinds(cluster, kinds, '')
+
+    def iter_with_pod_spec(self, cluster: str, kinds: List[str]) -> Iterator[Dict[str, Any]]:
+        """Like iter_for_kinds(), but skip rows whose manifest has no pod template spec.
+
+        The check runs in SQLite with json_extract(), so workloads without
+        containers are never fetched or parsed. Rows that do come back still
+        need extract_pod_spec(); an empty spec object is not filtered here.
+        """
+        return self._iter_kinds(cluster, kinds, f" AND {_POD_SPEC_SQL} IS NOT NULL")
+
+    def _iter_kinds(self, cluster: str, kinds: List[str], extra_where: str) -> Iterator[Dict[str, Any]]:
         if not kinds:
-            return []
+            return iter(())
         placeholders = ','.join(['?'] * len(kinds))
-        cur = self._conn.cursor()
-        rows = cur.execute(
-            f"SELECT kind, namespace, name, api_version, manifest_json FROM workload WHERE cluster=? AND kind IN ({placeholders}) ORDER BY kind, namespace, name",
+        return self._iter_rows(
+            f"SELECT kind, namespace, name, api_version, manifest_json FROM workload WHERE cluster=? AND kind IN ({placeholders}){extra_where} ORDER BY kind, namespace, name",
             (cluster, *kinds)
-        ).fetchall()
-        import json
-        out = []
-        for kind, namespace, name, api_version, manifest_json in rows:
+        )
+
+    def _iter_rows(self, sql: str, params: tuple) -> Iterator[Dict[str, Any]]:
+        """Yield workload dicts for a (kind, namespace, name, api_version, manifest_json) query."""
+        cur = self._conn.cursor()
+        cur.execute(sql, params)
+        for kind, namespace, name, api_version, manifest_json in cur:
             try:
                 manifest = json.loads(manifest_json)
             except Exception:
                 manifest = {'_raw': manifest_json}
-            out.append({
+            yield {
                 'kind': kind,
                 'namespace': namespace,
                 'name': name,
                 'apiVersion': api_version,
                 'manifest': manifest
-            })
-        return out
+            }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from importlib import import_module
 from typing import Dict, Type, List
 
 
@@ -25,21 +26,43 @@ class ReportGenerator(ABC):
 
 _registry: Dict[str, Type[ReportGenerator]] = {}
 
+# Modules registering the built-in report types; each is imported the first
+# time its type is requested, so a run only loads the generators it uses
+_BUILTIN_REPORT_MODULES: Dict[str, str] = {
+    'summary': 'data_gatherer.reporting.summary_report',
+    'containers-config': 'data_gatherer.reporting.containers_config_report',
+    'nodes': 'data_gatherer.reporting.nodes_report',
+    'cluster-capacity': 'data_gatherer.reporting.cluster_capacity_report',
+}
+
 
 def register(generator_cls: Type[ReportGenerator]):
     name = getattr(generator_cls, 'type_name', None)
     if not name:
         raise ValueError('ReportGenerator subclass must define type_name')
+    existing = _registry.get(name)
+    # Re-registering the same class (e.g. on module reload) is allowed
+    if existing is not None and _qualified_name(existing) != _qualified_name(generator_cls):
+        raise ValueError(f'Report type {name!r} already registered by {_qualified_name(existing)}')
     _registry[name] = generator_cls
     return generator_cls
 
 
+def _qualified_name(cls: type) -> str:
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
 def get_report_types():
+    for module in _BUILTIN_REPORT_MODULES.values():
+        import_module(module)
     return sorted(_registry.keys())
 
 
 def get_generator(type_name: str) -> ReportGenerator:
     cls = _registry.get(type_name)
+    if not cls and type_name in _BUILTIN_REPORT_MODULES:
+        import_module(_BUILTIN_REPORT_MODULES[type_name])
+        cls = _registry.get(type_name)
     if not cls:
         raise ValueError(f'Unknown report type: {type_name}. Available: {", ".join(get_report_types())}')
     return cls()
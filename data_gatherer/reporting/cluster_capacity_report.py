@@ -1,14 +1,74 @@
 from __future__ import annotations
 import html
-from typing import List, Dict, Any, Tuple, Optional
+import io
+import sys
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Optional, TextIO
 from data_gatherer.reporting.base import ReportGenerator, register
 from data_gatherer.persistence.db import WorkloadDB
 from data_gatherer.persistence.workload_queries import WorkloadQueries
 from data_gatherer.reporting.common import (
     CONTAINER_WORKLOAD_KINDS, cpu_to_milli, mem_to_mi,
     extract_pod_spec, calculate_effective_replicas,
-    build_legend_html, wrap_html_document,
-    format_cell_with_condition
+    build_legend_html, write_html_prologue, write_html_epilogue,
+    escape_cell, HTML_WRITE_BUFFER
+)
+
+
+_CAPACITY_LEGEND_HTML = build_legend_html([
+    {
+        'title': 'Columns',
+        'items': [
+            "Namespace: OpenShift projects",
+            'CPU/Memory Requests: Sum of all main containers requests x replica number',
+            'CPU/Memory Limits: Sum of all main containers limits x replica number',
+            '% CPU/Memory allocated on Cluster: Percentage of Allocatable resources consumed',
+            'Totals: Aggregated namespace requests & limits (percent uses requests)',
+            'Container Requests vs Allocatable resources on Worker Nodes: Allocatable baseline, requests, free allocatable, limits'
+        ]
+    }
+])
+
+
+@dataclass(frozen=True)
+class ContainerCapacityRow:
+    """One main container in the per-namespace detail tables.
+
+    Slotted, as a report holds one per container in the cluster.
+    """
+    __slots__ = (
+        'kind', 'name', 'container', 'replicas',
+        'cpu_req', 'mem_req', 'cpu_lim', 'mem_lim',
+        'cpu_req_total', 'mem_req_total', 'cpu_lim_total', 'mem_lim_total',
+    )
+    kind: str
+    name: str
+    container: str
+    replicas: int
+    cpu_req: int
+    mem_req: int
+    cpu_lim: int
+    mem_lim: int
+    cpu_req_total: int
+    mem_req_total: int
+    cpu_lim_total: int
+    mem_lim_total: int
+
+
+# Namespace detail totals row: the leading label cell and the opening tag of
+# each value cell are fixed, so they are built once at import time.
+_NS_TOTALS_ROW_START = '<tr style="background-color: #eaeaea;"><td colspan="4"><strong>Totals</strong></td>'
+_NS_TOTALS_CELLS = tuple(
+    f'<td data-tooltip="{tooltip}">' for tooltip in (
+        'Sum of CPU requests for all containers',
+        'Sum of Memory requests for all containers',
+        'Sum of CPU limits for all containers',
+        'Sum of Memory limits for all containers',
+        'Sum of CPU requests × replicas',
+        'Sum of Memory requests × replicas',
+        'Sum of CPU limits × replicas',
+        'Sum of Memory limits × replicas',
+    )
 )
 
 
@@ -43,9 +103,8 @@ class ClusterCapacityReport(ReportGenerator):
             self._generate_excel_report(title, capacity_data, out_path)
         else:
             # Default to HTML
-            html_content = self._generate_html_report(title, capacity_data, cluster)
-            with open(out_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            with open(out_path, 'w', encoding='utf-8', buffering=HTML_WRITE_BUFFER) as f:
+                self._generate_html_report(title, capacity_data, cluster, f)
 
     def _generate_capacity_data(self, db: WorkloadDB, cluster: str) -> Dict[str, Any]:
         """
@@ -60,16 +119,18 @@ class ClusterCapacityReport(ReportGenerator):
         """
         # Process workload data and collect details
         wq = WorkloadQueries(db)
-        rows = wq.list_for_kinds(cluster, list(CONTAINER_WORKLOAD_KINDS))
+        rows = wq.iter_with_pod_spec(cluster, list(CONTAINER_WORKLOAD_KINDS))
         node_capacity = self._get_node_capacity(db, cluster)
         worker_node_count = node_capacity.get('worker_node_count', 0)
 
         ns_totals: Dict[str, Dict[str, int]] = {}
-        ns_details: Dict[str, List[Dict[str, Any]]] = {}
+        ns_details: Dict[str, List[ContainerCapacityRow]] = {}
 
+        intern = sys.intern
         for rec in rows:
-            kind = rec['kind']
-            namespace = rec['namespace'] or ''
+            # Interned so the many detail rows share one object per kind/namespace
+            kind = intern(rec['kind'])
+            namespace = intern(rec['namespace'] or '')
             name = rec['name']
             manifest = rec['manifest']
             pod_spec = extract_pod_spec(kind, manifest)
@@ -94,20 +155,11 @@ class ClusterCapacityReport(ReportGenerator):
                 ns_totals[namespace]['mem'] += mem_req * replicas
                 ns_totals[namespace]['cpu_lim'] += cpu_lim * replicas
                 ns_totals[namespace]['mem_lim'] += mem_lim * replicas
-                ns_details[namespace].append({
-                    'kind': kind,
-                    'name': name,
-                    'container': cdef.get('name', ''),
-                    'replicas': replicas,
-                    'cpu_req': cpu_req,
-                    'mem_req': mem_req,
-                    'cpu_lim': cpu_lim,
-                    'mem_lim': mem_lim,
-                    'cpu_req_total': cpu_req * replicas,
-                    'mem_req_total': mem_req * replicas,
-                    'cpu_lim_total': cpu_lim * replicas,
-                    'mem_lim_total': mem_lim * replicas,
-                })
+                ns_details[namespace].append(ContainerCapacityRow(
+                    kind, name, cdef.get('name', ''), replicas,
+                    cpu_req, mem_req, cpu_lim, mem_lim,
+                    cpu_req * replicas, mem_req * replicas, cpu_lim * replicas, mem_lim * replicas,
+                ))
         summary_totals = self._calculate_summary_totals(ns_totals)
         return {
             'ns_totals': ns_totals,
@@ -132,7 +184,7 @@ class ClusterCapacityReport(ReportGenerator):
             Dictionary mapping namespace names to resource totals
         """
         wq = WorkloadQueries(db)
-        rows = wq.list_for_kinds(cluster, list(CONTAINER_WORKLOAD_KINDS))
+        rows = wq.iter_with_pod_spec(cluster, list(CONTAINER_WORKLOAD_KINDS))
         
         # Get worker node count for DaemonSet calculations
         node_capacity = self._get_node_capacity(db, cluster)
@@ -251,11 +303,17 @@ class ClusterCapacityReport(ReportGenerator):
         Returns:
             Dictionary with cluster-wide totals
         """
+        req_cpu = req_mem = lim_cpu = lim_mem = 0
+        for v in ns_totals.values():
+            req_cpu += v['cpu']
+            req_mem += v['mem']
+            lim_cpu += v['cpu_lim']
+            lim_mem += v['mem_lim']
         return {
-            'total_req_cpu': sum(v['cpu'] for v in ns_totals.values()),
-            'total_req_mem': sum(v['mem'] for v in ns_totals.values()),
-            'total_lim_cpu': sum(v['cpu_lim'] for v in ns_totals.values()),
-            'total_lim_mem': sum(v['mem_lim'] for v in ns_totals.values())
+            'total_req_cpu': req_cpu,
+            'total_req_mem': req_mem,
+            'total_lim_cpu': lim_cpu,
+            'total_lim_mem': lim_mem
         }
 
     def _generate_excel_report(self, title: str, capacity_data: Dict[str, Any], out_path: str) -> None:
@@ -269,8 +327,12 @@ class ClusterCapacityReport(ReportGenerator):
         """
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.utils import get_column_letter
+            from data_gatherer.reporting.excel_styles import (
+                ALIGN_CENTER, ALIGN_WRAP, BOLD_FONT, CAPACITY_HEADER_FILL, HEADER_FONT,
+                ITALIC_FONT, LEGEND_FONT, THIN_BORDER, TITLE_FONT, TOTALS_FILL, add_named_style
+            )
         except ImportError as e:
             raise ImportError("openpyxl is required for Excel output. Install with: pip install openpyxl") from e
 
@@ -285,25 +347,67 @@ class ClusterCapacityReport(ReportGenerator):
         wb = Workbook()
         ws = wb.active
         ws.title = "Cluster Capacity Report"
-
-        # Styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="343A40", end_color="343A40", fill_type="solid")
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        cell_style = add_named_style(wb, 'capacity_cell', border=THIN_BORDER)
+        label_style = add_named_style(wb, 'capacity_label', font=BOLD_FONT, border=THIN_BORDER)
+        totals_style = add_named_style(wb, 'capacity_totals', font=BOLD_FONT, fill=TOTALS_FILL, border=THIN_BORDER)
+        header_style = add_named_style(
+            wb, 'capacity_header', font=HEADER_FONT, fill=CAPACITY_HEADER_FILL, border=THIN_BORDER, alignment=ALIGN_CENTER
         )
-        # Use a common light grey for totals rows
-        totals_fill = PatternFill(start_color="EAEAEA", end_color="EAEAEA", fill_type="solid")
+        # Longest str(value) per column, tracked as rows are appended
+        widths = [0] * 13
+
+        def track_widths(values) -> None:
+            for i, value in enumerate(values):
+                if value is None:
+                    continue
+                # Labels are already str; only numbers need converting
+                length = len(value) if type(value) is str else len(str(value))
+                if length > widths[i]:
+                    widths[i] = length
+
+        def append_row(values, style: str = cell_style, first_style: Optional[str] = None) -> None:
+            """Write a whole bordered row with a single ws.append() call.
+
+            Cells are styled before being handed to the worksheet, so no
+            per-cell ws.cell() coordinate lookups are needed. Every row of the
+            sheet is appended in order; current_row mirrors the next row number
+            so merged ranges can be placed.
+            """
+            cells = []
+            for value in values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style
+                cells.append(cell)
+            if first_style is not None and cells:
+                cells[0].style = first_style
+            ws.append(cells)
+            track_widths(values)
+
+        def append_header(labels) -> None:
+            cells = []
+            for label in labels:
+                cell = WriteOnlyCell(ws, value=label)
+                cell.style = header_style
+                cells.append(cell)
+            ws.append(cells)
+            track_widths(labels)
+
+        def append_merged(row: int, value, font, last_column: int = 7, alignment=None) -> None:
+            """Append a single-value row and merge it across ``last_column`` columns."""
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = font
+            if alignment is not None:
+                cell.alignment = alignment
+            ws.append([cell])
+            track_widths([value])
+            ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=last_column)
+
+        def append_blank(count: int) -> None:
+            for _ in range(count):
+                ws.append([])
 
         # Title
-        ws.merge_cells('A1:G1')
-        title_cell = ws['A1']
-        title_cell.value = title
-        title_cell.font = Font(bold=True, size=16)
-        title_cell.alignment = Alignment(horizontal="center")
+        append_merged(1, title, TITLE_FONT, alignment=ALIGN_CENTER)
 
         current_row = 2
         # Legend (as a note, not collapsible)
@@ -312,27 +416,16 @@ class ClusterCapacityReport(ReportGenerator):
             "CPU/Memory Limits: Sum of all main containers limits x replica number; % CPU/Memory allocated on Cluster: Percentage of Allocatable resources consumed; "
             "Totals: Aggregated namespace requests & limits (percent uses requests); Container Requests vs Allocatable resources on Worker Nodes: Allocatable baseline, requests, free allocatable, limits."
         )
-        ws.merge_cells(f'A{current_row}:G{current_row}')
-        cell = ws.cell(row=current_row, column=1)
-        cell.value = legend_note
-        cell.font = Font(italic=True, size=10)
-        cell.alignment = Alignment(wrap_text=True)
+        append_merged(current_row, legend_note, LEGEND_FONT, alignment=ALIGN_WRAP)
+        append_blank(1)
         current_row += 2
 
         # Section: Container Requests vs Allocatable resources on Worker Nodes
-        ws.cell(row=current_row, column=1, value="Container Requests vs Allocatable resources on Worker Nodes").font = Font(bold=True)
-        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=7)
+        append_merged(current_row, "Container Requests vs Allocatable resources on Worker Nodes", BOLD_FONT)
         current_row += 1
-        summary_headers = [
+        append_header([
             "Scope", "CPU (m)", "CPU % Allocatable", "Memory (Mi)", "Memory % Allocatable"
-        ]
-        for col, header in enumerate(summary_headers, 1):
-            cell = ws.cell(row=current_row, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal="center")
+        ])
         current_row += 1
 
         total_req_cpu = summary_totals['total_req_cpu']
@@ -352,43 +445,25 @@ class ClusterCapacityReport(ReportGenerator):
             ["Main Containers Limits", total_lim_cpu, _pct(total_lim_cpu, total_cpu_alloc), total_lim_mem, _pct(total_lim_mem, total_mem_alloc)]
         ]
         for row in summary_rows:
-            for col, value in enumerate(row, 1):
-                cell = ws.cell(row=current_row, column=col)
-                cell.value = value
-                cell.border = border
-                if col == 1:
-                    cell.font = Font(bold=True)
+            append_row(row, first_style=label_style)
             current_row += 1
 
+        append_blank(2)
         current_row += 2
         # Section: Namespace capacity vs Cluster capacity
-        ws.cell(row=current_row, column=1, value="Namespace capacity vs Cluster capacity").font = Font(bold=True)
-        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=7)
+        append_merged(current_row, "Namespace capacity vs Cluster capacity", BOLD_FONT)
         current_row += 1
-        headers = [
+        append_header([
             "Namespace", "CPU Requests (m)", "Memory Requests (Mi)",
             "CPU Limits (m)", "Memory Limits (Mi)", "% CPU allocated on Cluster", "% Memory allocated on Cluster"
-        ]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=current_row, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal="center")
+        ])
         current_row += 1
 
         if not ns_totals:
-            ws.merge_cells(f'A{current_row}:G{current_row}')
-            cell = ws.cell(row=current_row, column=1)
-            cell.value = "No workloads found"
-            cell.font = Font(italic=True)
+            append_merged(current_row, "No workloads found", ITALIC_FONT)
             current_row += 1
         elif total_cpu_alloc == 0 and total_mem_alloc == 0:
-            ws.merge_cells(f'A{current_row}:G{current_row}')
-            cell = ws.cell(row=current_row, column=1)
-            cell.value = "No worker node capacity data"
-            cell.font = Font(italic=True)
+            append_merged(current_row, "No worker node capacity data", ITALIC_FONT)
             current_row += 1
         else:
             sorted_ns = sorted(ns_totals.items(), key=lambda x: (
@@ -402,111 +477,92 @@ class ClusterCapacityReport(ReportGenerator):
                 mem_lim_ns = totals['mem_lim']
                 cpu_pct = f"{cpu / total_cpu_alloc * 100:.1f}%" if total_cpu_alloc else 'N/A'
                 mem_pct = f"{mem / total_mem_alloc * 100:.1f}%" if total_mem_alloc else 'N/A'
-                row_values = [ns, cpu, mem, cpu_lim_ns, mem_lim_ns, cpu_pct, mem_pct]
-                for col, value in enumerate(row_values, 1):
-                    cell = ws.cell(row=current_row, column=col)
-                    cell.value = value
-                    cell.border = border
-                current_row += 1
-            # Totals row
-            if ns_totals:
-                all_req_cpu = sum(v['cpu'] for v in ns_totals.values())
-                all_req_mem = sum(v['mem'] for v in ns_totals.values())
-                all_lim_cpu = sum(v['cpu_lim'] for v in ns_totals.values())
-                all_lim_mem = sum(v['mem_lim'] for v in ns_totals.values())
-                cpu_pct_total = f"{all_req_cpu / total_cpu_alloc * 100:.1f}%" if total_cpu_alloc else 'N/A'
-                mem_pct_total = f"{all_req_mem / total_mem_alloc * 100:.1f}%" if total_mem_alloc else 'N/A'
-                for col, value in enumerate([
-                    "Totals", all_req_cpu, all_req_mem, all_lim_cpu, all_lim_mem, cpu_pct_total, mem_pct_total
-                ], 1):
-                    cell = ws.cell(row=current_row, column=col)
-                    cell.value = value
-                    cell.font = Font(bold=True)
-                    cell.fill = totals_fill
-                    cell.border = border
+                append_row([ns, cpu, mem, cpu_lim_ns, mem_lim_ns, cpu_pct, mem_pct])
                 current_row += 1
+            # Totals row (already aggregated in summary_totals)
+            cpu_pct_total = f"{total_req_cpu / total_cpu_alloc * 100:.1f}%" if total_cpu_alloc else 'N/A'
+            mem_pct_total = f"{total_req_mem / total_mem_alloc * 100:.1f}%" if total_mem_alloc else 'N/A'
+            append_row(
+                ["Totals", total_req_cpu, total_req_mem, total_lim_cpu, total_lim_mem, cpu_pct_total, mem_pct_total],
+                style=totals_style
+            )
+            current_row += 1
 
+        append_blank(2)
         current_row += 2
         # Section: Namespace detailed tables
+        detail_headers = [
+            "Kind", "Workload Name", "Container", "Replicas",
+            "CPU Request (m)", "Memory Request (Mi)", "CPU Limit (m)", "Memory Limit (Mi)",
+            "CPU Request × Replicas", "Memory Request × Replicas", "CPU Limit × Replicas", "Memory Limit × Replicas"
+        ]
         for ns, details in ns_details.items():
-            ws.cell(row=current_row, column=1, value=f"Namespace: {ns}").font = Font(bold=True)
-            ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=13)
+            append_merged(current_row, f"Namespace: {ns}", BOLD_FONT, last_column=13)
             current_row += 1
-            detail_headers = [
-                "Kind", "Workload Name", "Container", "Replicas",
-                "CPU Request (m)", "Memory Request (Mi)", "CPU Limit (m)", "Memory Limit (Mi)",
-                "CPU Request × Replicas", "Memory Request × Replicas", "CPU Limit × Replicas", "Memory Limit × Replicas"
-            ]
-            for col, header in enumerate(detail_headers, 1):
-                cell = ws.cell(row=current_row, column=col)
-                cell.value = header
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = border
-                cell.alignment = Alignment(horizontal="center")
+            append_header(detail_headers)
             current_row += 1
             ns_cpu_req = ns_mem_req = ns_cpu_lim = ns_mem_lim = ns_cpu_req_total = ns_mem_req_total = ns_cpu_lim_total = ns_mem_lim_total = 0
             for row in details:
-                ns_cpu_req += row["cpu_req"]
-                ns_mem_req += row["mem_req"]
-                ns_cpu_lim += row["cpu_lim"]
-                ns_mem_lim += row["mem_lim"]
-                ns_cpu_req_total += row["cpu_req_total"]
-                ns_mem_req_total += row["mem_req_total"]
-                ns_cpu_lim_total += row["cpu_lim_total"]
-                ns_mem_lim_total += row["mem_lim_total"]
-                row_values = [
-                    row["kind"], row["name"], row["container"], row["replicas"],
-                    row["cpu_req"], row["mem_req"], row["cpu_lim"], row["mem_lim"],
-                    row["cpu_req_total"], row["mem_req_total"], row["cpu_lim_total"], row["mem_lim_total"]
-                ]
-                for col, value in enumerate(row_values, 1):
-                    cell = ws.cell(row=current_row, column=col)
-                    cell.value = value
-                    cell.border = border
+                ns_cpu_req += row.cpu_req
+                ns_mem_req += row.mem_req
+                ns_cpu_lim += row.cpu_lim
+                ns_mem_lim += row.mem_lim
+                ns_cpu_req_total += row.cpu_req_total
+                ns_mem_req_total += row.mem_req_total
+                ns_cpu_lim_total += row.cpu_lim_total
+                ns_mem_lim_total += row.mem_lim_total
+                append_row([
+                    row.kind, row.name, row.container, row.replicas,
+                    row.cpu_req, row.mem_req, row.cpu_lim, row.mem_lim,
+                    row.cpu_req_total, row.mem_req_total, row.cpu_lim_total, row.mem_lim_total
+                ])
                 current_row += 1
             # Totals row for namespace
-            for col, value in enumerate([
+            append_row([
                 "Totals", "", "", "",
                 ns_cpu_req, ns_mem_req, ns_cpu_lim, ns_mem_lim,
                 ns_cpu_req_total, ns_mem_req_total, ns_cpu_lim_total, ns_mem_lim_total
-            ], 1):
-                cell = ws.cell(row=current_row, column=col)
-                cell.value = value
-                cell.font = Font(bold=True)
-                cell.fill = totals_fill
-                cell.border = border
+            ], style=totals_style)
+            append_blank(1)
             current_row += 2
 
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Column widths from the longest value written to each column; columns
+        # only spanned by merged rows keep the default width
+        for column_index, width in enumerate(widths, 1):
+            if width:
+                ws.column_dimensions[get_column_letter(column_index)].width = min(width + 2, 50)
 
         wb.save(out_path)
 
 
 
-    def _generate_html_report(self, title: str, capacity_data: Dict[str, Any], cluster: str) -> str:
+    def _generate_html_report(self, title: str, capacity_data: Dict[str, Any], cluster: str,
+                              fp: Optional[TextIO] = None) -> Optional[str]:
         """
         Generate HTML report from processed capacity data.
         
+        Output is written incrementally to ``fp`` so large reports never have to be
+        held in memory as a single string.
+        
         Args:
             title: Report title
             capacity_data: Processed capacity data
             cluster: Cluster name
+            fp: Open text stream to write to; when omitted the document is
+                rendered into memory and returned
             
         Returns:
-            Complete HTML document as string
+            Complete HTML document as string when ``fp`` is None, otherwise None
         """
+        if fp is None:
+            buf = io.StringIO()
+            self._generate_html_report(title, capacity_data, cluster, buf)
+            return buf.getvalue()
+
+        def emit(line: str) -> None:
+            fp.write(line)
+            fp.write('\n')
+
         # Extract data from processed capacity data
         ns_totals = capacity_data['ns_totals']
         node_capacity = capacity_data['node_capacity']
@@ -516,16 +572,61 @@ class ClusterCapacityReport(ReportGenerator):
         total_cpu_alloc = node_capacity['total_cpu_alloc']
         total_mem_alloc = node_capacity['total_mem_alloc']
 
-        table = [
-            '<table border=1 cellpadding=4 cellspacing=0>',
+        total_req_cpu = summary_totals['total_req_cpu']
+        total_req_mem = summary_totals['total_req_mem']
+        total_lim_cpu = summary_totals['total_lim_cpu']
+        total_lim_mem = summary_totals['total_lim_mem']
+
+        def _pct(v: int, d: int) -> str:
+            return 'N/A' if d <= 0 else f"{v / d * 100:.1f}%"
+
+        write_html_prologue(fp, title)
+        emit(_CAPACITY_LEGEND_HTML)
+
+        # Cluster-wide totals table
+        emit('<h2>Container Requests vs Allocatable resources on Worker Nodes</h2>')
+        emit('<table border=1 cellpadding=4 cellspacing=0>')
+        emit('<tr><th>Scope</th><th>CPU (m)</th><th>CPU % Allocatable</th><th>Memory (Mi)</th><th>Memory % Allocatable</th></tr>')
+        # Baseline cluster worker allocatable (always 100% when >0)
+        alloc_cpu_pct = '100.0%' if total_cpu_alloc > 0 else 'N/A'
+        alloc_mem_pct = '100.0%' if total_mem_alloc > 0 else 'N/A'
+        emit(
+            '<tr>'
+            f'<td>Total resources allocatable on Worker nodes</td><td>{total_cpu_alloc:,}</td><td>{alloc_cpu_pct}</td>'
+            f'<td>{total_mem_alloc:,}</td><td>{alloc_mem_pct}</td></tr>'
+        )
+        emit(
+            '<tr>'
+            f'<td>Main Containers Requests</td><td>{total_req_cpu:,}</td><td>{_pct(total_req_cpu, total_cpu_alloc)}</td>'
+            f'<td>{total_req_mem:,}</td><td>{_pct(total_req_mem, total_mem_alloc)}</td></tr>'
+        )
+        # Free allocatable (clamped to 0 for overcommit)
+        free_cpu = max(0, total_cpu_alloc - total_req_cpu)
+        free_mem = max(0, total_mem_alloc - total_req_mem)
+        emit(
+            '<tr>'
+            f'<td>Free resources (Allocatable - Requests)</td><td>{free_cpu:,}</td><td>{_pct(free_cpu, total_cpu_alloc)}</td>'
+            f'<td>{free_mem:,}</td><td>{_pct(free_mem, total_mem_alloc)}</td></tr>'
+        )
+        emit(
+            '<tr>'
+            f'<td>Main Containers Limits</td><td>{total_lim_cpu:,}</td><td>{_pct(total_lim_cpu, total_cpu_alloc)}</td>'
+            f'<td>{total_lim_mem:,}</td><td>{_pct(total_lim_mem, total_mem_alloc)}</td></tr>'
+        )
+        emit('</table>')
+
+        # Namespace capacity table
+        emit('<h2>Namespace capacity vs Cluster capacity</h2>')
+        emit('<table border=1 cellpadding=4 cellspacing=0>')
+        emit(
             '<tr><th>Namespace</th><th>CPU Requests (m)</th><th>Memory Requests (Mi)</th>'
             '<th>CPU Limits (m)</th><th>Memory Limits (Mi)</th>'
             '<th>% CPU allocated on Cluster</th><th>% Memory allocated on Cluster</th></tr>'
-        ]
+        )
         if not ns_totals:
-            table.append('<tr><td colspan="6" style="text-align:center; font-style:italic;">No workloads found</td></tr>')
+            emit('<tr><td colspan="6" style="text-align:center; font-style:italic;">No workloads found</td></tr>')
         elif total_cpu_alloc == 0 and total_mem_alloc == 0:
-            table.append('<tr><td colspan="6" style="text-align:center; font-style:italic;">No worker node capacity data</td></tr>')
+            emit('<tr><td colspan="6" style="text-align:center; font-style:italic;">No worker node capacity data</td></tr>')
         else:
             for ns, totals in sorted(ns_totals.items(), key=lambda x: (
                 (x[1]['cpu'] / total_cpu_alloc * 100 if total_cpu_alloc else 0) +
@@ -537,35 +638,29 @@ class ClusterCapacityReport(ReportGenerator):
                 mem_lim_ns = totals['mem_lim']
                 cpu_pct_str = f"{cpu / total_cpu_alloc * 100:.1f}%" if total_cpu_alloc else 'N/A'
                 mem_pct_str = f"{mem / total_mem_alloc * 100:.1f}%" if total_mem_alloc else 'N/A'
-                table.append(
+                emit(
                     f'<tr><td>{html.escape(ns)}</td><td>{cpu:,}</td><td>{mem:,}</td>'
                     f'<td>{cpu_lim_ns:,}</td><td>{mem_lim_ns:,}</td>'
                     f'<td>{cpu_pct_str}</td><td>{mem_pct_str}</td></tr>'
                 )
             # Totals row summarizing all namespaces
-            if ns_totals:
-                all_req_cpu = summary_totals['total_req_cpu']
-                all_req_mem = summary_totals['total_req_mem']
-                all_lim_cpu = summary_totals['total_lim_cpu']
-                all_lim_mem = summary_totals['total_lim_mem']
-                cpu_pct_total = f"{all_req_cpu / total_cpu_alloc * 100:.1f}%" if total_cpu_alloc else 'N/A'
-                mem_pct_total = f"{all_req_mem / total_mem_alloc * 100:.1f}%" if total_mem_alloc else 'N/A'
-                table.append(
-                    '<tr style="background-color: #eaeaea;">'
-                    f'<td><strong>Totals</strong></td><td><strong>{all_req_cpu:,}</strong></td>'
-                    f'<td><strong>{all_req_mem:,}</strong></td>'
-                    f'<td><strong>{all_lim_cpu:,}</strong></td><td><strong>{all_lim_mem:,}</strong></td>'
-                    f'<td><strong>{cpu_pct_total}</strong></td><td><strong>{mem_pct_total}</strong></td>'
-                    '</tr>'
-                )
-        table.append('</table>')
+            cpu_pct_total = f"{total_req_cpu / total_cpu_alloc * 100:.1f}%" if total_cpu_alloc else 'N/A'
+            mem_pct_total = f"{total_req_mem / total_mem_alloc * 100:.1f}%" if total_mem_alloc else 'N/A'
+            emit(
+                '<tr style="background-color: #eaeaea;">'
+                f'<td><strong>Totals</strong></td><td><strong>{total_req_cpu:,}</strong></td>'
+                f'<td><strong>{total_req_mem:,}</strong></td>'
+                f'<td><strong>{total_lim_cpu:,}</strong></td><td><strong>{total_lim_mem:,}</strong></td>'
+                f'<td><strong>{cpu_pct_total}</strong></td><td><strong>{mem_pct_total}</strong></td>'
+                '</tr>'
+            )
+        emit('</table>')
 
-        # Namespace detailed tables (new)
-        details_tables = []
+        # Namespace detailed tables
         for ns, details in ns_details.items():
-            details_tables.append(f'<h3>Namespace: {html.escape(ns)}</h3>')
-            details_tables.append('<table border=1 cellpadding=4 cellspacing=0>')
-            details_tables.append('<tr>'
+            emit(f'<h3>Namespace: {html.escape(ns)}</h3>')
+            emit('<table border=1 cellpadding=4 cellspacing=0>')
+            emit('<tr>'
                 '<th>Kind</th><th>Workload Name</th><th>Container</th><th>Replicas</th>'
                 '<th>CPU Request (m)</th><th>Memory Request (Mi)</th>'
                 '<th>CPU Limit (m)</th><th>Memory Limit (Mi)</th>'
@@ -575,110 +670,41 @@ class ClusterCapacityReport(ReportGenerator):
             # Accumulate totals for this namespace
             ns_cpu_req = ns_mem_req = ns_cpu_lim = ns_mem_lim = ns_cpu_req_total = ns_mem_req_total = ns_cpu_lim_total = ns_mem_lim_total = 0
             for row in details:
-                ns_cpu_req += row["cpu_req"]
-                ns_mem_req += row["mem_req"]
-                ns_cpu_lim += row["cpu_lim"]
-                ns_mem_lim += row["mem_lim"]
-                ns_cpu_req_total += row["cpu_req_total"]
-                ns_mem_req_total += row["mem_req_total"]
-                ns_cpu_lim_total += row["cpu_lim_total"]
-                ns_mem_lim_total += row["mem_lim_total"]
-                details_tables.append(
+                ns_cpu_req += row.cpu_req
+                ns_mem_req += row.mem_req
+                ns_cpu_lim += row.cpu_lim
+                ns_mem_lim += row.mem_lim
+                ns_cpu_req_total += row.cpu_req_total
+                ns_mem_req_total += row.mem_req_total
+                ns_cpu_lim_total += row.cpu_lim_total
+                ns_mem_lim_total += row.mem_lim_total
+                emit(
                     f'<tr>'
-                    f'<td>{html.escape(row["kind"])}</td>'
-                    f'<td>{html.escape(row["name"])}</td>'
-                    f'<td>{html.escape(row["container"])}</td>'
-                    f'<td>{row["replicas"]}</td>'
-                    f'<td>{row["cpu_req"]}</td>'
-                    f'<td>{row["mem_req"]}</td>'
-                    f'<td>{row["cpu_lim"]}</td>'
-                    f'<td>{row["mem_lim"]}</td>'
-                    f'<td>{row["cpu_req_total"]}</td>'
-                    f'<td>{row["mem_req_total"]}</td>'
-                    f'<td>{row["cpu_lim_total"]}</td>'
-                    f'<td>{row["mem_lim_total"]}</td>'
+                    f'<td>{escape_cell(row.kind)}</td>'
+                    f'<td>{html.escape(row.name)}</td>'
+                    f'<td>{escape_cell(row.container)}</td>'
+                    f'<td>{row.replicas}</td>'
+                    f'<td>{row.cpu_req}</td>'
+                    f'<td>{row.mem_req}</td>'
+                    f'<td>{row.cpu_lim}</td>'
+                    f'<td>{row.mem_lim}</td>'
+                    f'<td>{row.cpu_req_total}</td>'
+                    f'<td>{row.mem_req_total}</td>'
+                    f'<td>{row.cpu_lim_total}</td>'
+                    f'<td>{row.mem_lim_total}</td>'
                     '</tr>'
                 )
             # Totals row with balloon tooltips
-            details_tables.append(
-                '<tr style="background-color: #eaeaea;">'
-                '<td colspan="4"><strong>Totals</strong></td>'
-                f'<td data-tooltip="Sum of CPU requests for all containers">{ns_cpu_req}</td>'
-                f'<td data-tooltip="Sum of Memory requests for all containers">{ns_mem_req}</td>'
-                f'<td data-tooltip="Sum of CPU limits for all containers">{ns_cpu_lim}</td>'
-                f'<td data-tooltip="Sum of Memory limits for all containers">{ns_mem_lim}</td>'
-                f'<td data-tooltip="Sum of CPU requests × replicas">{ns_cpu_req_total}</td>'
-                f'<td data-tooltip="Sum of Memory requests × replicas">{ns_mem_req_total}</td>'
-                f'<td data-tooltip="Sum of CPU limits × replicas">{ns_cpu_lim_total}</td>'
-                f'<td data-tooltip="Sum of Memory limits × replicas">{ns_mem_lim_total}</td>'
-                '</tr>'
+            totals = (
+                ns_cpu_req, ns_mem_req, ns_cpu_lim, ns_mem_lim,
+                ns_cpu_req_total, ns_mem_req_total, ns_cpu_lim_total, ns_mem_lim_total
             )
-            details_tables.append('</table>')
-
-        total_req_cpu = summary_totals['total_req_cpu']
-        total_req_mem = summary_totals['total_req_mem']
-        total_lim_cpu = summary_totals['total_lim_cpu']
-        total_lim_mem = summary_totals['total_lim_mem']
-
-        def _pct(v: int, d: int) -> str:
-            return 'N/A' if d <= 0 else f"{v / d * 100:.1f}%"
-
-        totals_table: List[str] = [
-            '<table border=1 cellpadding=4 cellspacing=0>',
-            '<tr><th>Scope</th><th>CPU (m)</th><th>CPU % Allocatable</th><th>Memory (Mi)</th><th>Memory % Allocatable</th></tr>'
-        ]
-        # Baseline cluster worker allocatable (always 100% when >0)
-        alloc_cpu_pct = '100.0%' if total_cpu_alloc > 0 else 'N/A'
-        alloc_mem_pct = '100.0%' if total_mem_alloc > 0 else 'N/A'
-        totals_table.append(
-            '<tr>'
-            f'<td>Total resources allocatable on Worker nodes</td><td>{total_cpu_alloc:,}</td><td>{alloc_cpu_pct}</td>'
-            f'<td>{total_mem_alloc:,}</td><td>{alloc_mem_pct}</td></tr>'
-        )
-        totals_table.append(
-            '<tr>'
-            f'<td>Main Containers Requests</td><td>{total_req_cpu:,}</td><td>{_pct(total_req_cpu, total_cpu_alloc)}</td>'
-            f'<td>{total_req_mem:,}</td><td>{_pct(total_req_mem, total_mem_alloc)}</td></tr>'
-        )
-        # Free allocatable (clamped to 0 for overcommit)
-        free_cpu = max(0, total_cpu_alloc - total_req_cpu)
-        free_mem = max(0, total_mem_alloc - total_req_mem)
-        totals_table.append(
-            '<tr>'
-            f'<td>Free resources (Allocatable - Requests)</td><td>{free_cpu:,}</td><td>{_pct(free_cpu, total_cpu_alloc)}</td>'
-            f'<td>{free_mem:,}</td><td>{_pct(free_mem, total_mem_alloc)}</td></tr>'
-        )
-        totals_table.append(
-            '<tr>'
-            f'<td>Main Containers Limits</td><td>{total_lim_cpu:,}</td><td>{_pct(total_lim_cpu, total_cpu_alloc)}</td>'
-            f'<td>{total_lim_mem:,}</td><td>{_pct(total_lim_mem, total_mem_alloc)}</td></tr>'
-        )
-        totals_table.append('</table>')
-
-        legend_sections = [
-            {
-                'title': 'Columns',
-                'items': [
-                    "Namespace: OpenShift projects",
-                    'CPU/Memory Requests: Sum of all main containers requests x replica number',
-                    'CPU/Memory Limits: Sum of all main containers limits x replica number',
-                    '% CPU/Memory allocated on Cluster: Percentage of Allocatable resources consumed',
-                    'Totals: Aggregated namespace requests & limits (percent uses requests)',
-                    'Container Requests vs Allocatable resources on Worker Nodes: Allocatable baseline, requests, free allocatable, limits'
-                ]
-            }
-        ]
-        legend_html = build_legend_html(legend_sections)
-        # Insert details_tables after the main namespace table and before the totals table
-        return wrap_html_document(
-            title,
-            [
-                legend_html,
-                '<h2>Container Requests vs Allocatable resources on Worker Nodes</h2>',
-                *totals_table,
-                '<h2>Namespace capacity vs Cluster capacity</h2>',
-                *table,
-                *details_tables
-            ]
-        )
+            emit(
+                _NS_TOTALS_ROW_START
+                + ''.join([f'{cell}{value}</td>' for cell, value in zip(_NS_TOTALS_CELLS, totals)])
+                + '</tr>'
+            )
+            emit('</table>')
 
+        write_html_epilogue(fp)
+        return None
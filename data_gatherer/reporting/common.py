@@ -5,7 +5,8 @@ including resource parsing, pod spec extraction, and HTML generation utilities.
 """
 from __future__ import annotations
 import html
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, TextIO, Callable
 from data_gatherer.reporting.rules import RulesEngine, RuleRegistry, register_official_rules
 
 
@@ -15,6 +16,12 @@ CONTAINER_WORKLOAD_KINDS = {
 }
 
 
+# html.escape memoised for table cells: kinds, namespaces, quantities and
+# rule messages repeat across rows. Unique or long text (names, manifests)
+# should go through html.escape directly.
+escape_cell = lru_cache(maxsize=4096)(html.escape)
+
+
 # Global rules engine instance
 _rules_registry = None
 _rules_engine = None
@@ -65,29 +72,57 @@ def mem_to_mi(val: Optional[str]) -> Optional[int]:
         return None
 
 
+def _template_pod_spec(spec: dict) -> Optional[dict]:
+    return (spec.get('template') or {}).get('spec')
+
+
+def _cronjob_pod_spec(spec: dict) -> Optional[dict]:
+    return _template_pod_spec((spec.get('jobTemplate') or {}).get('spec') or {})
+
+
+def _spec_replicas(spec: dict) -> Optional[int]:
+    return spec.get('replicas', 1)
+
+
+def _job_replicas(spec: dict) -> Optional[int]:
+    return spec.get('parallelism', spec.get('completions', 1))
+
+
+def _cronjob_replicas(spec: dict) -> Optional[int]:
+    return _job_replicas((spec.get('jobTemplate') or {}).get('spec') or {})
+
+
+# Per-kind readers of a workload's ``spec``; kinds not listed yield None
+_POD_SPEC_EXTRACTORS: Dict[str, Callable[[dict], Optional[dict]]] = {
+    'Deployment': _template_pod_spec,
+    'StatefulSet': _template_pod_spec,
+    'DaemonSet': _template_pod_spec,
+    'DeploymentConfig': _template_pod_spec,
+    'Job': _template_pod_spec,
+    'CronJob': _cronjob_pod_spec,
+}
+_REPLICA_GETTERS: Dict[str, Callable[[dict], Optional[int]]] = {
+    'Deployment': _spec_replicas,
+    'StatefulSet': _spec_replicas,
+    'DeploymentConfig': _spec_replicas,
+    'Job': _job_replicas,
+    'CronJob': _cronjob_replicas,
+}
+
+
 def extract_pod_spec(kind: str, manifest: dict) -> Optional[dict]:
-    spec = manifest.get('spec') or {}
-    if kind in {"Deployment", "StatefulSet", "DaemonSet", "DeploymentConfig"}:
-        return (spec.get('template') or {}).get('spec')
-    if kind == 'Job':
-        return (spec.get('template') or {}).get('spec')
-    if kind == 'CronJob':
-        return (((spec.get('jobTemplate') or {}).get('spec') or {}).get('template') or {}).get('spec')
-    return None
+    extractor = _POD_SPEC_EXTRACTORS.get(kind)
+    if extractor is None:
+        return None
+    return extractor(manifest.get('spec') or {})
 
 
 def get_replicas_for_workload(kind: str, manifest: dict) -> Optional[int]:
-    spec = manifest.get('spec') or {}
-    if kind in {"Deployment", "StatefulSet", "DeploymentConfig"}:
-        return spec.get('replicas', 1)
-    if kind == 'Job':
-        return spec.get('parallelism', spec.get('completions', 1))
-    if kind == 'CronJob':
-        job_spec = (spec.get('jobTemplate') or {}).get('spec') or {}
-        return job_spec.get('parallelism', job_spec.get('completions', 1))
-    if kind == 'DaemonSet':
+    # DaemonSet replicas depend on node placement: see calculate_effective_replicas()
+    getter = _REPLICA_GETTERS.get(kind)
+    if getter is None:
         return None
-    return None
+    return getter(manifest.get('spec') or {})
 
 
 def will_run_on_worker(pod_spec: Dict[str, Any]) -> bool:
@@ -260,7 +295,7 @@ def is_error_condition(value: str, column_name: str, row_data: Optional[Dict[str
 
 
 def format_cell_with_condition(value: str, column_name: str, row_data: Optional[Dict[str, Any]] = None, report_type: str = 'generic') -> str:
-    escaped_value = html.escape(str(value))
+    escaped_value = escape_cell(str(value))
     rules_engine = get_rules_engine()
     context = {
         'cell_value': value,
@@ -274,7 +309,7 @@ def format_cell_with_condition(value: str, column_name: str, row_data: Optional[
     tooltip_text = ''
     if result and (result.message or result.matched_rule):
         tooltip_text = result.message or result.matched_rule
-        tooltip_text = html.escape(str(tooltip_text))
+        tooltip_text = escape_cell(str(tooltip_text))
 
     attrs = ''
     if tooltip_text:
@@ -287,7 +322,49 @@ def format_cell_with_condition(value: str, column_name: str, row_data: Optional[
     return f'<td>{escaped_value}</td>'
 
 
-def wrap_html_document(title: str, content_parts: List[str], additional_css: str = "") -> str:
+def get_rule_columns(report_type: str, columns: List[str]) -> set:
+    """Return the subset of ``columns`` that at least one enabled rule applies to.
+
+    Applicability is decided from the column name and report type, which is
+    what every registered rule keys on; cells in other columns can skip the
+    rules engine.
+    """
+    engine = get_rules_engine()
+    return {column for column in columns if engine.rules_for_column(report_type, column)}
+
+
+_EMPTY_TD = '<td></td>'
+
+
+def make_cell_formatter(report_type: str, columns: List[str]) -> Dict[str, Callable[[Any, Optional[Dict[str, Any]]], str]]:
+    """Specialize format_cell_with_condition() for one report's columns.
+
+    Rule applicability is resolved once per column via get_rule_columns().
+    Columns no rule applies to get a plain ``<td>`` renderer that skips the
+    rules engine entirely; the rest delegate to format_cell_with_condition().
+
+    Returns:
+        Mapping of column name to ``fn(value, row_data) -> '<td>...</td>'``
+    """
+    ruled_columns = get_rule_columns(report_type, columns)
+
+    def _plain(value: Any, row_data: Optional[Dict[str, Any]] = None) -> str:
+        if value == '' or value is None:
+            return _EMPTY_TD
+        return f'<td>{escape_cell(str(value))}</td>'
+
+    formatters: Dict[str, Callable[[Any, Optional[Dict[str, Any]]], str]] = {}
+    for column in columns:
+        if column in ruled_columns:
+            def _ruled(value: Any, row_data: Optional[Dict[str, Any]] = None, _column: str = column) -> str:
+                return format_cell_with_condition(value, _column, row_data, report_type)
+            formatters[column] = _ruled
+        else:
+            formatters[column] = _plain
+    return formatters
+
+
+def _html_prologue(title: str, additional_css: str = "") -> str:
     base_css = get_base_css_styles()
     full_css = base_css + ("\n" + additional_css if additional_css else "")
     return f"""<!doctype html>
@@ -300,6 +377,24 @@ def wrap_html_document(title: str, content_parts: List[str], additional_css: str
   </style>
 </head>
 <body>
-{chr(10).join(content_parts)}
-</body>
-</html>"""
+"""
+
+
+_HTML_EPILOGUE = "</body>\n</html>"
+
+# Buffer size used when streaming HTML reports straight to disk
+HTML_WRITE_BUFFER = 1 << 20
+
+
+def write_html_prologue(fp: TextIO, title: str, additional_css: str = "") -> None:
+    """Write the document head and opening body tag to an open text stream."""
+    fp.write(_html_prologue(title, additional_css))
+
+
+def write_html_epilogue(fp: TextIO) -> None:
+    """Close a document started with write_html_prologue()."""
+    fp.write(_HTML_EPILOGUE)
+
+
+def wrap_html_document(title: str, content_parts: List[str], additional_css: str = "") -> str:
+    return _html_prologue(title, additional_css) + "\n".join(content_parts) + "\n" + _HTML_EPILOGUE
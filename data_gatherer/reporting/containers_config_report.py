@@ -1,24 +1,146 @@
 from __future__ import annotations
+import json
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, TextIO, Tuple
 from data_gatherer.reporting.base import ReportGenerator, register
 from data_gatherer.persistence.db import WorkloadDB
 from data_gatherer.persistence.workload_queries import WorkloadQueries
 from data_gatherer.reporting.common import (
     CONTAINER_WORKLOAD_KINDS, cpu_to_milli, mem_to_mi,
     extract_pod_spec, calculate_effective_replicas,
-    build_legend_html, get_common_legend_sections, wrap_html_document,
-    format_cell_with_condition
+    build_legend_html, get_common_legend_sections, write_html_prologue,
+    write_html_epilogue, make_cell_formatter, get_rules_engine, get_rule_columns,
+    HTML_WRITE_BUFFER
 )
 import html
+import io
 import os
+import re
+import sys
 from data_gatherer.reporting.common import will_run_on_worker
 
+# ConfigMap (namespace, name) pairs per lookup query, two bound parameters each
+_CONFIGMAP_BATCH = 400
+# Shared empty ConfigMap map for containers without ConfigMap references
+_NO_CONFIGMAPS: Dict[Tuple[str, str], Dict[str, Any]] = {}
+# Java parameter names, any case: CATALINA_OPTS, or both JAVA and OPT in either order
+_JAVA_PARAM_RE = re.compile(r'CATALINA_OPTS|JAVA.*OPT|OPT.*JAVA', re.IGNORECASE | re.DOTALL)
+
+# Comprehensive column legend: every table header must be represented here
+_KEY_COLUMNS_SECTION = {
+    "title": "Key Columns",
+    "items": [
+        "<strong>Kind</strong>: Workload controller kind (Deployment / StatefulSet / etc.)",
+        "<strong>Namespace</strong>: Kubernetes namespace (blank if cluster‑scoped)",
+        "<strong>Name</strong>: Workload name",
+        "<strong>Container</strong>: Container name inside spec",
+        "<strong>Type</strong>: main or init",
+        "<strong>Image</strong>: Container image with tag",
+        "<strong>Replicas</strong>: Desired replicas (DaemonSet blank)",
+        "<strong>CPU_req_m</strong>: CPU requests in millicores",
+        "<strong>CPU_lim_m</strong>: CPU limits in millicores",
+        "<strong>Mem_req_Mi</strong>: Memory requests in MiB",
+        "<strong>Mem_lim_Mi</strong>: Memory limits in MiB",
+        "<strong>Readiness_Probe</strong>: timeout / initial delay or Not configured",
+        "<strong>Image_Pull_Policy</strong>: Container image pull policy",
+        "<strong>Node_Selectors</strong>: nodeSelector key=value list or None",
+        "<strong>Pod_Labels</strong>: Pod template labels key=value list or None",
+        "<strong>Java_Parameters</strong>: Discovered Java options including JAVA_OPTS, CATALINA_OPTS, and similar parameters (from env or ConfigMap) or Not configured"
+    ]
+}
+_CONTAINERS_LEGEND_HTML = build_legend_html(get_common_legend_sections() + [_KEY_COLUMNS_SECTION])
+
+_UNIFIED_CONTAINERS_CSS = """
+.report-table { font-size: 12px; }
+.report-table th { position: sticky; top: 0; z-index: 10; }
+.report-table td { word-wrap: break-word; word-break: break-word; white-space: normal; }
+.report-table td:nth-child(1) { font-weight: bold; }
+.report-table td:nth-child(2) { font-family: monospace; }
+.report-table td:nth-child(3) { font-weight: 500; }
+.report-table td:nth-child(4) { font-family: monospace; }
+.report-table td:nth-child(5) { font-weight: bold; text-align: center; }
+.report-table td:nth-child(6),
+.report-table td:nth-child(15),
+.report-table td:nth-child(16) { font-family: monospace; font-size: 10px; min-width: 200px; word-break: break-all; }
+.report-table td:nth-child(8),
+.report-table td:nth-child(9),
+.report-table td:nth-child(10),
+.report-table td:nth-child(11) { font-family: monospace; text-align: right; }
+.report-table td:nth-child(12) { font-size: 11px; }
+.report-table td:nth-child(13) { font-weight: 500; }
+.report-table td:nth-child(14) { font-size: 11px; }
+@media (max-width: 1400px) { .report-table { font-size: 11px; } .report-table td { padding: 6px; } .report-table td:nth-child(6), .report-table td:nth-child(15), .report-table td:nth-child(16) { min-width: 200px; } }
+.report-table td:nth-child(16) { font-family: monospace; font-size: 10px; min-width: 250px; }
+@media (max-width: 1400px) { .report-table { font-size: 11px; } .report-table td { padding: 6px; } .report-table td:nth-child(6), .report-table td:nth-child(15), .report-table td:nth-child(16) { min-width: 150px; } }
+@media (max-width: 900px) { .report-table { display: block; overflow-x: auto; white-space: nowrap; } }
+"""
+
+
+def _format_key_values(mapping) -> str:
+    """'k=v, k2=v2' for labels and node selectors, or 'None' when empty."""
+    if not mapping:
+        return "None"
+    if len(mapping) == 1:
+        # Most selectors and many label sets have a single entry
+        (key, value), = mapping.items()
+        return f"{key}={value}"
+    return ", ".join([f"{k}={v}" for k, v in mapping.items()])
+
+
+class ContainerConfigRow(NamedTuple):
+    """One container of the report, in table column order.
+
+    A tuple rather than a list: a report holds one per container in the
+    cluster, and every writer only iterates or indexes it.
+    """
+    kind: str
+    namespace: str
+    name: str
+    container: str
+    type: str
+    image: str
+    # Numeric columns stay int-or-None; renderers show None as blank
+    replicas: Optional[int]
+    cpu_req_m: Optional[int]
+    cpu_lim_m: Optional[int]
+    mem_req_mi: Optional[int]
+    mem_lim_mi: Optional[int]
+    readiness_probe: str
+    image_pull_policy: str
+    node_selectors: str
+    pod_labels: str
+    java_parameters: Optional[str]
+
+
+class _RowDicts(Sequence):
+    """``table_rows`` seen as header -> value dicts, each built on access."""
+
+    def __init__(self, headers: List[str], rows: Sequence[Sequence[Any]]):
+        self._headers = headers
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return dict(zip(self._headers, self._rows[index]))
+
+
+def _evaluate_rule_columns(headers: List[str], table_rows: Sequence[Sequence[Any]], ruled_columns: set) -> Dict[int, list]:
+    """Rule results per ruled column index, one per row, evaluated column by column."""
+    engine = get_rules_engine()
+    rows = _RowDicts(headers, table_rows)
+    return {
+        index: engine.evaluate_column('containers', header, [row[index] for row in table_rows], rows)
+        for index, header in enumerate(headers) if header in ruled_columns
+    }
+
 
 @register
 class ContainerConfigurationReport(ReportGenerator):
     type_name = 'containers-config'
     file_extension = '.html'
     filename_prefix = 'containers-config-'
-    supported_formats = ['html', 'excel']
+    supported_formats = ['html', 'excel', 'excel-fast']
 
     def generate(self, db: WorkloadDB, cluster: str, out_path: str, format: str = 'html') -> None:
         # Generate the core data
@@ -27,24 +149,41 @@ class ContainerConfigurationReport(ReportGenerator):
         
         if format.lower() == 'excel':
             self._generate_excel(title, headers, table_rows, out_path)
+        elif format.lower() == 'excel-fast':
+            self._generate_excel_fast(title, headers, table_rows, out_path)
         else:
             # Default to HTML
-            html_content = self._build_html_document(title, headers, table_rows, cluster)
-            with open(out_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            with open(out_path, 'w', encoding='utf-8', buffering=HTML_WRITE_BUFFER) as f:
+                self._build_html_document(title, headers, table_rows, cluster, f)
 
     def _generate_data(self, db: WorkloadDB, cluster: str):
         """Generate the core data structure used by both HTML and Excel formats."""
         wq = WorkloadQueries(db)
-        rows = wq.list_for_kinds(cluster, list(CONTAINER_WORKLOAD_KINDS))
+        rows = wq.iter_with_pod_spec(cluster, list(CONTAINER_WORKLOAD_KINDS))
         
         # Get worker node count for DaemonSet calculations
         worker_node_count = self._get_worker_node_count(db, cluster)
         
         table_rows = []
+        # Rows whose Java options come from ConfigMaps are resolved after the
+        # scan, with a single query for every referenced ConfigMap
+        needed_configmaps = set()
+        pending_java_opts = []
+        # Hot-loop callables bound to locals once instead of looked up per container
+        intern = sys.intern
+        append_row = table_rows.append
+        to_milli = cpu_to_milli
+        to_mi = mem_to_mi
+        readiness_timeout = self._extract_readiness_probe_timeout
+        configmap_refs = self._configmap_refs
+        extract_java_opts = self._extract_java_opts
         for rec in rows:
-            kind = rec['kind']
+            # kind/namespace repeat across thousands of rows; intern them so
+            # every row shares one string object
+            kind = intern(rec['kind'])
             namespace = rec['namespace']
+            if namespace:
+                namespace = intern(namespace)
             name = rec['name']
             manifest = rec['manifest']
             pod_spec = extract_pod_spec(kind, manifest)
@@ -69,32 +208,45 @@ class ContainerConfigurationReport(ReportGenerator):
                 resources = cdef.get('resources', {})
                 requests = resources.get('requests', {})
                 limits = resources.get('limits', {})
-                cpu_req = cpu_to_milli(requests.get('cpu'))
-                cpu_lim = cpu_to_milli(limits.get('cpu'))
-                mem_req = mem_to_mi(requests.get('memory'))
-                mem_lim = mem_to_mi(limits.get('memory'))
-                readiness_probe = self._extract_readiness_probe_timeout(cdef)
+                cpu_req = to_milli(requests.get('cpu'))
+                cpu_lim = to_milli(limits.get('cpu'))
+                mem_req = to_mi(requests.get('memory'))
+                mem_lim = to_mi(limits.get('memory'))
+                readiness_probe = readiness_timeout(cdef)
                 image_pull_policy = cdef.get('imagePullPolicy', 'IfNotPresent')
-                java_opts = self._extract_java_opts(cdef, namespace, db)
-                row = [
+                configmap_names = configmap_refs(cdef)
+                if configmap_names:
+                    needed_configmaps.update((namespace, cm_name) for cm_name in configmap_names)
+                    java_opts = None
+                else:
+                    java_opts = extract_java_opts(cdef, namespace, _NO_CONFIGMAPS)
+                if java_opts is None:
+                    pending_java_opts.append((len(table_rows), cdef, namespace))
+                append_row(ContainerConfigRow(
                     kind,
                     namespace,
                     name,
                     container_name,
                     ctype,
                     image,
-                    replicas if replicas is not None else '',
-                    cpu_req if cpu_req is not None else '',
-                    cpu_lim if cpu_lim is not None else '',
-                    mem_req if mem_req is not None else '',
-                    mem_lim if mem_lim is not None else '',
+                    replicas,
+                    cpu_req,
+                    cpu_lim,
+                    mem_req,
+                    mem_lim,
                     readiness_probe,
                     image_pull_policy,
                     node_selector,
                     pod_labels,
                     java_opts
-                ]
-                table_rows.append(row)
+                ))
+
+        if pending_java_opts:
+            configmaps = self._load_configmaps(db, cluster, needed_configmaps)
+            for index, cdef, namespace in pending_java_opts:
+                table_rows[index] = table_rows[index]._replace(
+                    java_parameters=extract_java_opts(cdef, namespace, configmaps)
+                )
         
         headers = [
             "Kind", "Namespace", "Name", "Container", "Type", "Image",
@@ -104,136 +256,227 @@ class ContainerConfigurationReport(ReportGenerator):
         return table_rows, headers
 
     def _generate_excel(self, title: str, headers: list, table_rows: list, out_path: str) -> None:
-        """Generate Excel output with formatting and conditional highlighting."""
+        """Generate Excel output with formatting and conditional highlighting.
+
+        Uses openpyxl's write-only mode: each row is built from pre-styled
+        WriteOnlyCell objects and streamed to the sheet XML as it is appended,
+        so memory does not grow with the number of containers.
+        """
         try:
             from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.utils import get_column_letter
-            from openpyxl.comments import Comment
+            from data_gatherer.reporting.excel_styles import (
+                ALIGN_CENTER, ALIGN_CENTER_MIDDLE, ALIGN_RIGHT, BOLD_FONT, HEADER_FILL,
+                HEADER_FONT, STYLE_BY_RULE, THIN_BORDER, TITLE_FONT, add_named_style,
+                containers_column_align, containers_column_width, rule_comment
+            )
         except ImportError:
             raise ImportError("openpyxl is required for Excel output. Install with: pip install openpyxl")
         
-        from data_gatherer.reporting.common import get_rules_engine
-        from data_gatherer.reporting.rules.base import RuleType
-        
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Container Configuration"
-        
-        # Set up styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Container Configuration")
         
-        # Error/Warning styles for conditional formatting
-        error_fill = PatternFill(start_color="F8D7DA", end_color="F8D7DA", fill_type="solid")
-        warning_fill = PatternFill(start_color="FFF3CD", end_color="FFF3CD", fill_type="solid")
-        error_font = Font(color="721C24")
-        warning_font = Font(color="856404")
-        
-        # Get rules engine for consistent formatting
-        rules_engine = get_rules_engine()
+        # Column widths must be set before the first row is streamed
+        for col, header_name in enumerate(headers, 1):
+            ws.column_dimensions[get_column_letter(col)].width = containers_column_width(header_name)
         
         # Write title
-        ws.merge_cells('A1:P1')
-        title_cell = ws['A1']
-        title_cell.value = title
-        title_cell.font = Font(bold=True, size=16)
-        title_cell.alignment = Alignment(horizontal="center")
+        ws.merged_cells.add(f'A1:{get_column_letter(len(headers))}1')
+        title_cell = WriteOnlyCell(ws, value=title)
+        title_cell.font = TITLE_FONT
+        title_cell.alignment = ALIGN_CENTER
+        ws.append([title_cell])
+        ws.append([])
         
         # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+        header_style = add_named_style(
+            wb, 'containers_header', font=HEADER_FONT, fill=HEADER_FILL, border=THIN_BORDER, alignment=ALIGN_CENTER_MIDDLE
+        )
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.style = header_style
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # One named style per alignment, plain and for each highlighted rule type
+        cell_styles = {}
+        for align, alignment in ((None, None), ('right', ALIGN_RIGHT), ('center', ALIGN_CENTER)):
+            align_name = align or 'left'
+            extra = {'alignment': alignment} if alignment is not None else {}
+            styles = {None: add_named_style(wb, f'containers_{align_name}', border=THIN_BORDER, **extra)}
+            for rule_type, (fill, font) in STYLE_BY_RULE.items():
+                rule_extra = dict(extra, fill=fill) if fill is not None else extra
+                styles[rule_type] = add_named_style(
+                    wb, f'containers_{rule_type.value}_{align_name}', font=font, border=THIN_BORDER, **rule_extra
+                )
+            cell_styles[align] = styles
         
+        # Per-column dispatch, resolved once: (header, {rule type: style}, rules apply?)
+        ruled_columns = get_rule_columns('containers', headers)
+        column_specs = [
+            (header_name, cell_styles[containers_column_align(header_name)], header_name in ruled_columns)
+            for header_name in headers
+        ]
+        
+        # Rule results for every highlighted column, evaluated column by column
+        column_results = _evaluate_rule_columns(headers, table_rows, ruled_columns)
+
         # Write data rows with conditional formatting
-        for row_idx, row_data in enumerate(table_rows, 4):
-            # Build row_data dictionary for rules engine
-            row_dict = {headers[j]: row_data[j] for j in range(min(len(headers), len(row_data)))}
-            
-            for col_idx, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_idx, column=col_idx)
-                cell.value = value
-                cell.border = border
-                
-                # Apply conditional formatting based on column and value
-                header_name = headers[col_idx - 1] if col_idx <= len(headers) else ""
-                
-                # Use rules engine to determine formatting
-                context = {
-                    'cell_value': value,
-                    'column_name': header_name,
-                    'row_data': row_dict,
-                    'report_type': 'containers'
-                }
-                rule_result = rules_engine.evaluate_cell(context)
+        for row_index, row_data in enumerate(table_rows):
+            row_cells = []
+            for col_index, ((header_name, styles, has_rules), value) in enumerate(zip(column_specs, row_data)):
+                if not has_rules and (value is None or value == ''):
+                    # Nothing to show or highlight: leave the cell out of the sheet
+                    row_cells.append(None)
+                    continue
+                cell = WriteOnlyCell(ws, value=value)
+                style = styles[None]
                 
-                # Apply formatting based on rule result
-                if rule_result.rule_type == RuleType.ERROR_MISS:
-                    cell.fill = error_fill
-                    cell.font = error_font
-                    if rule_result.message:
-                        cell.comment = Comment(rule_result.message, "Copilot")
-                elif rule_result.rule_type == RuleType.WARNING_MISS:
-                    cell.fill = warning_fill
-                    cell.font = warning_font
-                    if rule_result.message:
-                        cell.comment = Comment(rule_result.message, "Copilot")
-                elif rule_result.rule_type == RuleType.ERROR_MISCONF:
-                    # For misconfiguration errors, use text color only (no background)
-                    cell.font = error_font
-                    if rule_result.message:
-                        cell.comment = Comment(rule_result.message, "Copilot")
-                elif rule_result.rule_type == RuleType.WARNING_MISCONF:
-                    # For misconfiguration warnings, use text color only (no background)
-                    cell.font = warning_font
-                    if rule_result.message:
-                        cell.comment = Comment(rule_result.message, "Copilot")
+                if has_rules:
+                    rule_result = column_results[col_index][row_index]
+                    
+                    # Apply formatting based on rule result
+                    if rule_result.rule_type in STYLE_BY_RULE:
+                        style = styles[rule_result.rule_type]
+                        if rule_result.message:
+                            cell.comment = rule_comment(rule_result.message)
                 
-                # Set alignment based on column type
-                if header_name in ["CPU_req_m", "CPU_lim_m", "Mem_req_Mi", "Mem_lim_Mi", "Replicas"]:
-                    cell.alignment = Alignment(horizontal="right")
-                elif header_name in ["Kind", "Type"]:
-                    cell.alignment = Alignment(horizontal="center")
+                cell.style = style
+                row_cells.append(cell)
+            ws.append(row_cells)
         
-        # Auto-adjust column widths
-        for col in range(1, len(headers) + 1):
-            column_letter = get_column_letter(col)
-            header_name = headers[col - 1]
-            
-            # Set specific widths for known columns
-            if header_name in ["Kind", "Type"]:
-                ws.column_dimensions[column_letter].width = 12
-            elif header_name in ["CPU_req_m", "CPU_lim_m", "Mem_req_Mi", "Mem_lim_Mi", "Replicas"]:
-                ws.column_dimensions[column_letter].width = 10
-            elif header_name in ["Node_Selectors", "Pod_Labels", "Java_Parameters"]:
-                ws.column_dimensions[column_letter].width = 40
-            elif header_name == "Image":
-                ws.column_dimensions[column_letter].width = 45
-            elif header_name in ["Namespace", "Name", "Container"]:
-                ws.column_dimensions[column_letter].width = 20
-            else:
-                ws.column_dimensions[column_letter].width = 15
-        
-        # Add summary row
-        summary_row = len(table_rows) + 5
-        ws.cell(row=summary_row, column=1, value="Total containers:")
-        ws.cell(row=summary_row, column=2, value=len(table_rows))
-        ws.cell(row=summary_row, column=1).font = Font(bold=True)
-        ws.cell(row=summary_row, column=2).font = Font(bold=True)
+        # Add summary row (one blank row after the data)
+        ws.append([])
+        label_cell = WriteOnlyCell(ws, value="Total containers:")
+        label_cell.font = BOLD_FONT
+        count_cell = WriteOnlyCell(ws, value=len(table_rows))
+        count_cell.font = BOLD_FONT
+        ws.append([label_cell, count_cell])
         
         # Save the workbook
         wb.save(out_path)
 
+    def _generate_excel_fast(self, title: str, headers: list, table_rows: list, out_path: str) -> None:
+        """Generate Excel output through xlsxwriter in constant-memory mode.
+
+        Intended for very large clusters: rows are flushed to disk as they are
+        written, so memory stays flat. Layout, fills and fonts match
+        _generate_excel(); rule messages are not attached as cell comments.
+        Without xlsxwriter installed the sheet XML is written directly by
+        _generate_excel_xml().
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            self._generate_excel_xml(title, headers, table_rows, out_path)
+            return
+
+        from data_gatherer.reporting.rules.base import RuleType
+        from data_gatherer.reporting.excel_styles import (
+            HEADER_COLOR, RULE_COLORS, containers_column_align, containers_column_width
+        )
+
+        wb = xlsxwriter.Workbook(out_path, {'constant_memory': True, 'strings_to_numbers': False})
+        try:
+            ws = wb.add_worksheet("Container Configuration")
+            for col, header_name in enumerate(headers):
+                ws.set_column(col, col, containers_column_width(header_name))
+
+            ws.merge_range(0, 0, 0, len(headers) - 1, title, wb.add_format({'bold': True, 'font_size': 16, 'align': 'center'}))
+            header_format = wb.add_format({
+                'bold': True, 'font_color': '#FFFFFF', 'bg_color': f'#{HEADER_COLOR}',
+                'border': 1, 'align': 'center', 'valign': 'vcenter'
+            })
+            ws.write_row(2, 0, headers, header_format)
+
+            style_by_rule = {
+                rule_type: {'font_color': f'#{font}', **({'bg_color': f'#{fill}'} if fill else {})}
+                for rule_type, (fill, font) in RULE_COLORS.items()
+            }
+            formats: dict = {}
+
+            def cell_format(rule_type, header_name):
+                align = containers_column_align(header_name)
+                key = (rule_type, align)
+                fmt = formats.get(key)
+                if fmt is None:
+                    props = {'border': 1, **style_by_rule.get(rule_type, {})}
+                    if align:
+                        props['align'] = align
+                    fmt = formats[key] = wb.add_format(props)
+                return fmt
+
+            column_results = _evaluate_rule_columns(headers, table_rows, get_rule_columns('containers', headers))
+            for row_idx, row_data in enumerate(table_rows):
+                # Rows are ContainerConfigRow tuples: always one value per header
+                for col_idx, (header_name, value) in enumerate(zip(headers, row_data)):
+                    results = column_results.get(col_idx)
+                    rule_type = results[row_idx].rule_type if results is not None else RuleType.NONE
+                    fmt = cell_format(rule_type, header_name)
+                    if value is None or value == '':
+                        ws.write_blank(row_idx + 3, col_idx, None, fmt)
+                    elif isinstance(value, str):
+                        # write_string: never let a value starting with '=' become a formula
+                        ws.write_string(row_idx + 3, col_idx, value, fmt)
+                    else:
+                        ws.write_number(row_idx + 3, col_idx, value, fmt)
+
+            bold = wb.add_format({'bold': True})
+            summary_row = len(table_rows) + 4
+            ws.write(summary_row, 0, "Total containers:", bold)
+            ws.write(summary_row, 1, len(table_rows), bold)
+        finally:
+            wb.close()
+
+    def _generate_excel_xml(self, title: str, headers: list, table_rows: list, out_path: str) -> None:
+        """Write the excel-fast layout as raw worksheet XML, without openpyxl or xlsxwriter.
+
+        Each row becomes one XML string, so no cell objects are created at all.
+        """
+        from data_gatherer.reporting.excel_styles import (
+            HEADER_COLOR, RULE_COLORS, containers_column_align, containers_column_width
+        )
+        from data_gatherer.reporting.xlsx_stream import XlsxSheetWriter, column_letter
+
+        with XlsxSheetWriter(out_path, "Container Configuration") as ws:
+            for col, header_name in enumerate(headers, 1):
+                ws.set_column_width(col, containers_column_width(header_name))
+
+            ws.merge(f'A1:{column_letter(len(headers))}1')
+            ws.write_row([title], ws.add_style(bold=True, font_size=16, align='center'))
+            ws.skip_row()
+            ws.write_row(headers, ws.add_style(
+                bold=True, font_color='FFFFFF', fill=HEADER_COLOR, border=True, align='center', valign='center'
+            ))
+
+            # Per column: (header, plain style, {rule type: style} or None when no rules apply)
+            ruled_columns = get_rule_columns('containers', headers)
+            column_specs = []
+            for header_name in headers:
+                align = containers_column_align(header_name)
+                rule_styles = None
+                if header_name in ruled_columns:
+                    rule_styles = {
+                        rule_type: ws.add_style(border=True, align=align, fill=fill, font_color=font)
+                        for rule_type, (fill, font) in RULE_COLORS.items()
+                    }
+                column_specs.append((header_name, ws.add_style(border=True, align=align), rule_styles))
+
+            column_results = _evaluate_rule_columns(headers, table_rows, ruled_columns)
+            for row_index, row_data in enumerate(table_rows):
+                styles = []
+                for col_index, ((header_name, plain_style, rule_styles), value) in enumerate(zip(column_specs, row_data)):
+                    style = plain_style
+                    if rule_styles is not None:
+                        style = rule_styles.get(column_results[col_index][row_index].rule_type, plain_style)
+                    styles.append(style)
+                ws.write_row(row_data, styles)
+
+            ws.skip_row()
+            ws.write_row(["Total containers:", len(table_rows)], ws.add_style(bold=True))
+
     def _get_worker_node_count(self, db: WorkloadDB, cluster: str) -> int:
         """
         Get the count of worker nodes in the cluster.
@@ -267,51 +510,60 @@ class ContainerConfigurationReport(ReportGenerator):
             return f"{timeout}s (initial: {initial_delay}s)"
         return "Not configured"
 
-    def _extract_java_opts(self, container_def, namespace: str, db: WorkloadDB):
+    def _extract_java_opts(self, container_def, namespace: str, configmaps):
         """
         Extract Java parameters from container environment.
         Searches for JAVA_OPTS, CATALINA_OPTS, and similar Java-related options.
         Returns all found parameters combined with their source names.
+
+        ``configmaps`` is the ``{(namespace, name): data}`` map built by
+        _load_configmaps(). A WorkloadDB is also accepted; the ConfigMaps this
+        container references are then loaded from it on the first lookup.
         """
         found_params = {}  # Dict to store param_name -> value
+
+        def configmap_data(cm_name):
+            nonlocal configmaps
+            if not cm_name:
+                return None
+            if not isinstance(configmaps, dict):
+                refs = {(namespace, ref) for ref in self._configmap_refs(container_def)}
+                configmaps = self._load_configmaps(configmaps, refs=refs)
+            return configmaps.get((namespace, cm_name))
         
-        # Direct env values first
-        env = container_def.get('env', [])
-        for env_var in env:
+        # One pass over env: direct values win over configMapKeyRef values for
+        # the same name, whatever their order in the list
+        from_configmaps = {}
+        for env_var in container_def.get('env', []):
             var_name = env_var.get('name', '')
-            var_name_upper = var_name.upper()
-            if self._is_java_param(var_name_upper):
-                value = env_var.get('value', '')
-                if value:
-                    found_params[var_name] = value
-        
-        # valueFrom -> configMapKeyRef
-        for env_var in env:
+            if not _JAVA_PARAM_RE.search(var_name):
+                continue
+            value = env_var.get('value', '')
+            if value:
+                found_params[var_name] = value
+                continue
             value_from = env_var.get('valueFrom', {})
             cm_ref = value_from.get('configMapKeyRef') if isinstance(value_from, dict) else None
-            if not cm_ref:
+            if not cm_ref or var_name in from_configmaps:
                 continue
-            key_name = env_var.get('name', '')
-            key_name_upper = key_name.upper()
-            if self._is_java_param(key_name_upper):
-                cm_name = cm_ref.get('name')
-                cm_key = cm_ref.get('key')
-                val = self._lookup_configmap_value(db, namespace, cm_name, cm_key)
-                if val and key_name not in found_params:
-                    found_params[key_name] = val
+            cm_key = cm_ref.get('key')
+            data = configmap_data(cm_ref.get('name')) if cm_key else None
+            val = data.get(cm_key) if data else None
+            if val:
+                from_configmaps[var_name] = val
+        for var_name, val in from_configmaps.items():
+            found_params.setdefault(var_name, val)
         
         # envFrom configMapRef entire data scan for likely JAVA options
         for env_from in container_def.get('envFrom', []) or []:
             cm_ref = env_from.get('configMapRef') if isinstance(env_from, dict) else None
             if not cm_ref:
                 continue
-            cm_name = cm_ref.get('name')
-            data = self._lookup_configmap_data(db, namespace, cm_name)
+            data = configmap_data(cm_ref.get('name'))
             if data:
                 # look for keys containing Java parameters
                 for k, v in data.items():
-                    ku = k.upper()
-                    if self._is_java_param(ku) and v and k not in found_params:
+                    if v and k not in found_params and _JAVA_PARAM_RE.search(k):
                         found_params[k] = v
         
         # Format the result
@@ -327,142 +579,116 @@ class ContainerConfigurationReport(ReportGenerator):
         parts = [f"{name}={value}" for name, value in sorted(found_params.items())]
         return "; ".join(parts)
     
-    def _is_java_param(self, var_name_upper: str) -> bool:
+    def _is_java_param(self, var_name: str) -> bool:
         """
         Check if an environment variable name represents a Java parameter.
-        Matches JAVA_OPTS, CATALINA_OPTS, and similar patterns.
+        Matches JAVA_OPTS, CATALINA_OPTS, and similar patterns, in any case.
         """
-        # Check for CATALINA_OPTS specifically (Tomcat-specific, doesn't follow JAVA_* naming)
-        if 'CATALINA_OPTS' in var_name_upper:
-            return True
-        # Check for patterns like JAVA_OPTS, JAVA_OPTIONS, etc. (contains both 'JAVA' and 'OPT')
-        if 'JAVA' in var_name_upper and 'OPT' in var_name_upper:
-            return True
-        return False
-
-    def _lookup_configmap_value(self, db: WorkloadDB, namespace: str, name: str, key: str):
-        if not (name and key):
-            return None
-        cur = db._conn.cursor()
-        row = cur.execute(
-            "SELECT manifest_json FROM workload WHERE kind=? AND namespace=? AND name=? LIMIT 1",
-            ('ConfigMap', namespace, name)
-        ).fetchone()
-        if not row:
-            return None
-        import json
-        try:
-            manifest = json.loads(row[0])
-            return (manifest.get('data') or {}).get(key)
-        except Exception:
-            return None
-
-    def _lookup_configmap_data(self, db: WorkloadDB, namespace: str, name: str):
-        if not name:
-            return None
-        cur = db._conn.cursor()
-        row = cur.execute(
-            "SELECT manifest_json FROM workload WHERE kind=? AND namespace=? AND name=? LIMIT 1",
-            ('ConfigMap', namespace, name)
-        ).fetchone()
-        if not row:
-            return None
-        import json
-        try:
-            manifest = json.loads(row[0])
-            return manifest.get('data') or {}
-        except Exception:
-            return None
+        # CATALINA_OPTS is Tomcat-specific and doesn't follow the JAVA_* naming;
+        # otherwise the name must contain both 'JAVA' and 'OPT'
+        return _JAVA_PARAM_RE.search(var_name) is not None
+
+    def _configmap_refs(self, container_def) -> set:
+        """Names of the ConfigMaps _extract_java_opts() would read for this container."""
+        names = set()
+        for env_var in container_def.get('env', []):
+            value_from = env_var.get('valueFrom', {})
+            cm_ref = value_from.get('configMapKeyRef') if isinstance(value_from, dict) else None
+            if cm_ref and cm_ref.get('name') and cm_ref.get('key') and _JAVA_PARAM_RE.search(env_var.get('name', '')):
+                names.add(cm_ref['name'])
+        for env_from in container_def.get('envFrom', []) or []:
+            cm_ref = env_from.get('configMapRef') if isinstance(env_from, dict) else None
+            if cm_ref and cm_ref.get('name'):
+                names.add(cm_ref['name'])
+        return names
+
+    def _load_configmaps(self, db: WorkloadDB, cluster: Optional[str] = None,
+                         refs: Optional[Iterable[Tuple[str, str]]] = None) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Load the data section of ConfigMaps into a ``{(namespace, name): data}`` map.
+
+        With ``refs`` only those (namespace, name) pairs are fetched, using a
+        row-value ``IN`` query per batch rather than one query per reference;
+        without it every ConfigMap is loaded. Each manifest is parsed exactly
+        once; unparsable ones are skipped.
+        """
+        sql = "SELECT namespace, name, manifest_json FROM workload WHERE kind='ConfigMap'"
+        params: List[Any] = []
+        if cluster is not None:
+            sql += " AND cluster=?"
+            params.append(cluster)
+        if refs is None:
+            batches = [(sql, params)]
+        else:
+            refs = sorted(refs, key=lambda ref: (ref[0] or '', ref[1]))
+            batches = []
+            for start in range(0, len(refs), _CONFIGMAP_BATCH):
+                batch = refs[start:start + _CONFIGMAP_BATCH]
+                values = ','.join(['(?,?)'] * len(batch))
+                batches.append((
+                    f"{sql} AND (namespace, name) IN (VALUES {values})",
+                    params + [part for ref in batch for part in ref]
+                ))
+        configmaps: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for batch_sql, batch_params in batches:
+            for namespace, name, manifest_json in db._conn.execute(batch_sql, batch_params):
+                if (namespace, name) in configmaps:
+                    continue
+                try:
+                    configmaps[(namespace, name)] = json.loads(manifest_json).get('data') or {}
+                except Exception:
+                    continue
+        return configmaps
 
     def _format_labels(self, labels_dict):
-        if not labels_dict:
-            return "None"
-        formatted_labels = [f"{k}={v}" for k, v in labels_dict.items()]
-        return ", ".join(formatted_labels)
+        return _format_key_values(labels_dict)
 
     def _format_node_selector(self, node_selector_dict):
-        if not node_selector_dict:
-            return "None"
-        selectors = [f"{k}={v}" for k, v in node_selector_dict.items()]
-        return ", ".join(selectors)
-
-    def _build_html_document(self, title, headers, table_rows, cluster):
-        parts = []
-        parts.append(f'<h1>{title}</h1>')
-        parts.append('<p>Complete container configuration analysis including resource allocation, health settings, and deployment configuration.</p>')
-        # Comprehensive column legend: every table header must be represented here
-        legend_sections = get_common_legend_sections() + [
-            {
-                "title": "Key Columns",
-                "items": [
-                    "<strong>Kind</strong>: Workload controller kind (Deployment / StatefulSet / etc.)",
-                    "<strong>Namespace</strong>: Kubernetes namespace (blank if cluster‑scoped)",
-                    "<strong>Name</strong>: Workload name",
-                    "<strong>Container</strong>: Container name inside spec",
-                    "<strong>Type</strong>: main or init",
-                    "<strong>Image</strong>: Container image with tag",
-                    "<strong>Replicas</strong>: Desired replicas (DaemonSet blank)",
-                    "<strong>CPU_req_m</strong>: CPU requests in millicores",
-                    "<strong>CPU_lim_m</strong>: CPU limits in millicores",
-                    "<strong>Mem_req_Mi</strong>: Memory requests in MiB",
-                    "<strong>Mem_lim_Mi</strong>: Memory limits in MiB",
-                    "<strong>Readiness_Probe</strong>: timeout / initial delay or Not configured",
-                    "<strong>Image_Pull_Policy</strong>: Container image pull policy",
-                    "<strong>Node_Selectors</strong>: nodeSelector key=value list or None",
-                    "<strong>Pod_Labels</strong>: Pod template labels key=value list or None",
-                    "<strong>Java_Parameters</strong>: Discovered Java options including JAVA_OPTS, CATALINA_OPTS, and similar parameters (from env or ConfigMap) or Not configured"
-                ]
-            }
-        ]
-        legend_html = build_legend_html(legend_sections)
-        parts.append(legend_html)
+        return _format_key_values(node_selector_dict)
+
+    def _build_html_document(self, title, headers, table_rows, cluster, fp: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Render the HTML report.
+
+        Rows are written straight to ``fp`` one ``<tr>`` at a time instead of
+        being collected as hundreds of thousands of small strings first. When
+        ``fp`` is omitted the document is rendered into memory and returned.
+        """
+        if fp is None:
+            buf = io.StringIO()
+            self._build_html_document(title, headers, table_rows, cluster, buf)
+            return buf.getvalue()
+
+        def emit(line: str) -> None:
+            fp.write(line)
+            fp.write('\n')
+
+        write_html_prologue(fp, title, self._get_unified_containers_css())
+        emit(f'<h1>{title}</h1>')
+        emit('<p>Complete container configuration analysis including resource allocation, health settings, and deployment configuration.</p>')
+        emit(_CONTAINERS_LEGEND_HTML)
         if not table_rows:
-            parts.append('<p>No container workloads found.</p>')
+            emit('<p>No container workloads found.</p>')
         else:
-            parts.append(f'<p><strong>Total containers:</strong> {len(table_rows)}</p>')
-            parts.append('<table class="report-table">')
-            parts.append('<thead><tr>')
-            for header in headers:
-                parts.append(f'<th>{html.escape(header)}</th>')
-            parts.append('</tr></thead>')
-            parts.append('<tbody>')
+            emit(f'<p><strong>Total containers:</strong> {len(table_rows)}</p>')
+            emit('<table class="report-table">')
+            emit('\n'.join(['<thead><tr>'] + [f'<th>{html.escape(header)}</th>' for header in headers] + ['</tr></thead>']))
+            emit('<tbody>')
+            formatters = make_cell_formatter('containers', headers)
+            column_formatters = [formatters[header] for header in headers]
             for row in table_rows:
-                parts.append('<tr>')
-                for i, cell in enumerate(row):
-                    cell_str = str(cell) if cell is not None else ''
-                    if i < len(headers):
-                        row_data = {headers[j]: row[j] for j in range(min(len(headers), len(row)))}
-                        parts.append(format_cell_with_condition(cell_str, headers[i], row_data, 'containers'))
-                    else:
-                        parts.append(f'<td>{html.escape(cell_str)}</td>')
-                parts.append('</tr>')
-            parts.append('</tbody>')
-            parts.append('</table>')
-        return wrap_html_document(title, parts, self._get_unified_containers_css())
+                # One row_data dict per row, shared by every rule-checked cell
+                row_data = dict(zip(headers, row))
+                cells = [
+                    fmt(str(cell) if cell is not None else '', row_data)
+                    for fmt, cell in zip(column_formatters, row)
+                ]
+                emit('<tr>\n' + '\n'.join(cells) + '\n</tr>')
+            emit('</tbody>')
+            emit('</table>')
+        write_html_epilogue(fp)
+        return None
+
 
     def _get_unified_containers_css(self):
-        return """
-        .report-table { font-size: 12px; }
-        .report-table th { position: sticky; top: 0; z-index: 10; }
-        .report-table td { word-wrap: break-word; word-break: break-word; white-space: normal; }
-        .report-table td:nth-child(1) { font-weight: bold; }
-        .report-table td:nth-child(2) { font-family: monospace; }
-        .report-table td:nth-child(3) { font-weight: 500; }
-        .report-table td:nth-child(4) { font-family: monospace; }
-        .report-table td:nth-child(5) { font-weight: bold; text-align: center; }
-        .report-table td:nth-child(6),
-        .report-table td:nth-child(15),
-        .report-table td:nth-child(16) { font-family: monospace; font-size: 10px; min-width: 200px; word-break: break-all; }
-        .report-table td:nth-child(8),
-        .report-table td:nth-child(9),
-        .report-table td:nth-child(10),
-        .report-table td:nth-child(11) { font-family: monospace; text-align: right; }
-        .report-table td:nth-child(12) { font-size: 11px; }
-        .report-table td:nth-child(13) { font-weight: 500; }
-        .report-table td:nth-child(14) { font-size: 11px; }
-        @media (max-width: 1400px) { .report-table { font-size: 11px; } .report-table td { padding: 6px; } .report-table td:nth-child(6), .report-table td:nth-child(15), .report-table td:nth-child(16) { min-width: 200px; } }
-        .report-table td:nth-child(16) { font-family: monospace; font-size: 10px; min-width: 250px; }
-        @media (max-width: 1400px) { .report-table { font-size: 11px; } .report-table td { padding: 6px; } .report-table td:nth-child(6), .report-table td:nth-child(15), .report-table td:nth-child(16) { min-width: 150px; } }
-        @media (max-width: 900px) { .report-table { display: block; overflow-x: auto; white-space: nowrap; } }
-        </style>
-        """
+        return _UNIFIED_CONTAINERS_CSS
@@ -0,0 +1,128 @@
+"""Shared style definitions for Excel report output.
+
+The plain values at the top (RRGGBB colors, containers-config column layout)
+are used by every Excel writer: openpyxl, xlsxwriter and the built-in XML
+writer. They need no third-party package.
+
+openpyxl deduplicates styles per workbook, so building Font/Fill/Border/
+Alignment objects inside cell loops only allocates garbage. The openpyxl
+objects below are created once from the plain values and reused by every
+writer. openpyxl stays an optional dependency: without it those names are
+not defined and importing them raises ImportError.
+"""
+from __future__ import annotations
+from typing import Optional
+from data_gatherer.reporting.rules.base import RuleType
+
+try:
+    from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+    from openpyxl.styles.fonts import DEFAULT_FONT
+    from openpyxl.comments import Comment
+except ImportError:  # optional; only the plain values are available
+    Font = None
+
+
+# Colors
+HEADER_COLOR = "366092"            # containers-config
+CAPACITY_HEADER_COLOR = "343A40"   # cluster-capacity
+TOTALS_COLOR = "EAEAEA"
+ERROR_BG_COLOR = "F8D7DA"
+WARNING_BG_COLOR = "FFF3CD"
+ERROR_TEXT_COLOR = "721C24"
+WARNING_TEXT_COLOR = "856404"
+
+# (fill color, font color) per rule type; misconfiguration results use text color only
+RULE_COLORS = {
+    RuleType.ERROR_MISS: (ERROR_BG_COLOR, ERROR_TEXT_COLOR),
+    RuleType.WARNING_MISS: (WARNING_BG_COLOR, WARNING_TEXT_COLOR),
+    RuleType.ERROR_MISCONF: (None, ERROR_TEXT_COLOR),
+    RuleType.WARNING_MISCONF: (None, WARNING_TEXT_COLOR),
+}
+
+# containers-config column layout, by header name
+CONTAINERS_RIGHT_ALIGNED = frozenset({"CPU_req_m", "CPU_lim_m", "Mem_req_Mi", "Mem_lim_Mi", "Replicas"})
+CONTAINERS_CENTERED = frozenset({"Kind", "Type"})
+_CONTAINERS_WIDTHS = {
+    **{header: 12 for header in CONTAINERS_CENTERED},
+    **{header: 10 for header in CONTAINERS_RIGHT_ALIGNED},
+    "Node_Selectors": 40, "Pod_Labels": 40, "Java_Parameters": 40,
+    "Image": 45,
+    "Namespace": 20, "Name": 20, "Container": 20,
+}
+
+
+def containers_column_width(header: str) -> int:
+    return _CONTAINERS_WIDTHS.get(header, 15)
+
+
+def containers_column_align(header: str) -> Optional[str]:
+    """Horizontal alignment of a containers-config data column; None for left."""
+    if header in CONTAINERS_RIGHT_ALIGNED:
+        return 'right'
+    if header in CONTAINERS_CENTERED:
+        return 'center'
+    return None
+
+
+if Font is not None:
+    def _solid(color: str) -> PatternFill:
+        return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+    # Generic
+    BOLD_FONT = Font(bold=True)
+    ITALIC_FONT = Font(italic=True)
+    TITLE_FONT = Font(bold=True, size=16)
+    LEGEND_FONT = Font(italic=True, size=10)
+    THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    ALIGN_CENTER = Alignment(horizontal="center")
+    ALIGN_CENTER_MIDDLE = Alignment(horizontal="center", vertical="center")
+    ALIGN_RIGHT = Alignment(horizontal="right")
+    ALIGN_WRAP = Alignment(wrap_text=True)
+
+    # Table headers
+    HEADER_FONT = Font(bold=True, color="FFFFFF")
+    HEADER_FILL = _solid(HEADER_COLOR)
+    CAPACITY_HEADER_FILL = _solid(CAPACITY_HEADER_COLOR)
+    TOTALS_FILL = _solid(TOTALS_COLOR)
+
+    # Rule highlighting
+    ERROR_FILL = _solid(ERROR_BG_COLOR)
+    WARNING_FILL = _solid(WARNING_BG_COLOR)
+    ERROR_FONT = Font(color=ERROR_TEXT_COLOR)
+    WARNING_FONT = Font(color=WARNING_TEXT_COLOR)
+
+    # (fill, font) per rule type, built from RULE_COLORS
+    _FILLS = {ERROR_BG_COLOR: ERROR_FILL, WARNING_BG_COLOR: WARNING_FILL}
+    _FONTS = {ERROR_TEXT_COLOR: ERROR_FONT, WARNING_TEXT_COLOR: WARNING_FONT}
+    STYLE_BY_RULE = {
+        rule_type: (_FILLS.get(fill), _FONTS[font]) for rule_type, (fill, font) in RULE_COLORS.items()
+    }
+
+# Cell comments carrying rule messages
+RULE_COMMENT_AUTHOR = "Copilot"
+
+
+def rule_comment(message: str) -> Comment:
+    """Build the cell comment for a rule message.
+
+    openpyxl copies a Comment that is already attached to another cell, so
+    sharing one instance across cells saves nothing; build one per cell.
+    """
+    return Comment(message, RULE_COMMENT_AUTHOR)
+
+
+def add_named_style(wb, name: str, **attrs) -> str:
+    """Register a NamedStyle on ``wb`` and return its name.
+
+    Assigning the name with ``cell.style = name`` applies font, fill, border
+    and alignment in one step instead of four separate style lookups. Without
+    a ``font`` the workbook default font is used, as for unstyled cells.
+    """
+    attrs.setdefault('font', DEFAULT_FONT)
+    wb.add_named_style(NamedStyle(name=name, **attrs))
+    return name
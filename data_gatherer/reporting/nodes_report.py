@@ -1,45 +1,149 @@
 from __future__ import annotations
 import html
-from typing import Dict, List, Tuple, Optional
+import re
+import sqlite3
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Tuple, Optional
 from .base import ReportGenerator, register
 from ..persistence.db import WorkloadDB
-from .common import wrap_html_document, format_cell_with_condition, build_legend_html
+from .common import (
+    wrap_html_document, make_cell_formatter, get_rule_columns, escape_cell, build_legend_html,
+    write_html_prologue, write_html_epilogue, HTML_WRITE_BUFFER
+)
 
 
-def _parse_resource_value(value: Optional[str]) -> Optional[float]:
-    if not value:
+# Kubernetes quantity: number, optional exponent and optional unit suffix,
+# e.g. "3800m", "16Gi", "129e6"
+_QUANTITY_RE = re.compile(r'\s*((?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)\s*([a-zA-Z]*)\s*')
+_MI = 1024 * 1024
+# Suffix -> multiplier to millicores
+_CPU_SUFFIX = {'': 1000.0, 'm': 1.0, 'u': 1e-3, 'n': 1e-6}
+# Suffix -> multiplier to MiB. Suffixes are case-sensitive as in Kubernetes
+# ("m" is milli, "M" is mega); binary suffixes are also accepted in lowercase.
+_MEM_SUFFIX = {
+    '': 1 / _MI, 'm': 1e-3 / _MI,
+    'k': 1e3 / _MI, 'M': 1e6 / _MI, 'G': 1e9 / _MI, 'T': 1e12 / _MI,
+    'Ki': 1 / 1024, 'Mi': 1.0, 'Gi': 1024.0, 'Ti': 1024.0 * 1024,
+    'ki': 1 / 1024, 'mi': 1.0, 'gi': 1024.0, 'ti': 1024.0 * 1024,
+}
+
+
+def _parse_quantity(value: Optional[str], suffixes: Dict[str, float]) -> Optional[float]:
+    """Scale a quantity by its suffix factor; None for blank or malformed input."""
+    if value is None or value == '':
+        return None
+    match = _QUANTITY_RE.fullmatch(str(value))
+    if match is None:
         return None
-    try:
-        value_str = str(value).lower()
-        if value_str.endswith('m'):
-            return float(value_str[:-1])
-        elif value_str.endswith('n'):
-            return float(value_str[:-1]) / 1_000_000
-        elif value_str.endswith('u'):
-            return float(value_str[:-1]) / 1_000
-        else:
-            return float(value_str) * 1000
-    except (ValueError, AttributeError):
-        try:
-            if value_str.endswith('ki'):
-                return float(value_str[:-2]) / 1024
-            elif value_str.endswith('mi'):
-                return float(value_str[:-2])
-            elif value_str.endswith('gi'):
-                return float(value_str[:-2]) * 1024
-            elif value_str.endswith('ti'):
-                return float(value_str[:-2]) * 1024 * 1024
-            elif value_str.endswith('k'):
-                return float(value_str[:-1]) / 1024
-            elif value_str.endswith('m'):
-                return float(value_str[:-1]) / (1024 * 1024)
-            elif value_str.endswith('g'):
-                return float(value_str[:-1]) * 1024
-            else:
-                return float(value_str) / (1024 * 1024)
-        except (ValueError, AttributeError):
-            return None
-    return None
+    factor = suffixes.get(match.group(2))
+    if factor is None:
+        return None
+    return float(match.group(1)) * factor
+
+
+# Node quantities repeat across nodes of the same instance type
+@lru_cache(maxsize=1024)
+def _parse_cpu(value: Optional[str]) -> Optional[float]:
+    """CPU quantity in millicores, or None when unparsable."""
+    return _parse_quantity(value, _CPU_SUFFIX)
+
+
+@lru_cache(maxsize=1024)
+def _parse_mem(value: Optional[str]) -> Optional[float]:
+    """Memory quantity in MiB, or None when unparsable."""
+    return _parse_quantity(value, _MEM_SUFFIX)
+
+
+class NodeRow(NamedTuple):
+    """One node with capacity parsed to millicores / MiB."""
+    name: str
+    instance_type: str
+    zone: str
+    cpu_capacity_m: float
+    memory_capacity_mi: float
+    cpu_allocatable_m: float
+    memory_allocatable_mi: float
+
+
+def _node_row_factory(cursor: sqlite3.Cursor, row: Tuple) -> Tuple[str, NodeRow]:
+    """Cursor row factory: (role, NodeRow) straight from a node_capacity row."""
+    node_name, node_role, instance_type, zone, cpu_cap, mem_cap, cpu_alloc, mem_alloc = row
+    return node_role or 'unknown', NodeRow(
+        node_name,
+        instance_type or 'unknown',
+        zone or 'unknown',
+        _parse_cpu(cpu_cap) or 0,
+        _parse_mem(mem_cap) or 0,
+        _parse_cpu(cpu_alloc) or 0,
+        _parse_mem(mem_alloc) or 0,
+    )
+
+
+_NODES_CSS = (
+    "table { width: 100%; }"
+    "th { padding: 8px; text-align: left; }"
+    "td { padding: 6px 8px; }"
+    "h1 { color: #333; }"
+    "h2 { color: #555; margin-top: 24px; }"
+    "h3 { color: #777; margin-top: 20px; }"
+    "ul { margin: 8px 0; }"
+    "li { margin: 4px 0; }"
+)
+
+
+_NODES_LEGEND_HTML = build_legend_html([
+    {
+        'title': 'Summary Table Columns',
+        'items': [
+            'Role: Node role grouping',
+            'Count: Number of nodes with that role',
+            'CPU Capacity (cores): Sum of core capacity',
+            'CPU Allocatable (cores): Sum cores allocatable to pods',
+            'Memory Capacity (GiB): Sum memory capacity',
+            'Memory Allocatable (GiB): Sum memory allocatable to pods',
+            'CPU Efficiency: Allocatable / Capacity * 100',
+            'Memory Efficiency: Allocatable / Capacity * 100'
+        ]
+    },
+    {
+        'title': 'Per-Role Table Columns',
+        'items': [
+            'Node Name: Kubernetes node name',
+            'Instance Type: Cloud instance type (or unknown)',
+            'Zone: Availability zone (or unknown)',
+            'CPU Cap (m): CPU capacity in millicores',
+            'CPU Alloc (m): CPU allocatable in millicores',
+            'Mem Cap (Mi): Memory capacity in MiB',
+            'Mem Alloc (Mi): Memory allocatable in MiB',
+            'CPU Util %: Allocatable / Capacity * 100',
+            'Mem Util %: Allocatable / Capacity * 100'
+        ]
+    }
+])
+
+# One line of the per-role table / the summary table, newline included;
+# cell fields are full <td> elements
+_ROLE_ROW_TPL = (
+    '<tr><td>{name}</td><td>{itype}</td><td>{zone}</td>'
+    '{cpu_cap_cell}{cpu_alloc_cell}{mem_cap_cell}{mem_alloc_cell}'
+    '{cpu_util_cell}{mem_util_cell}</tr>\n'
+)
+_SUMMARY_ROW_TPL = (
+    '<tr><td><strong>{role}</strong></td>{count_cell}'
+    '{cpu_cap_cell}{cpu_alloc_cell}{mem_cap_cell}{mem_alloc_cell}'
+    '{cpu_eff_cell}{mem_eff_cell}</tr>\n'
+)
+
+
+# Rule-evaluated value columns of the summary / per-role tables
+_SUMMARY_COLUMNS = [
+    "Count", "CPU_Capacity", "CPU_Allocatable", "Memory_Capacity", "Memory_Allocatable",
+    "CPU_Efficiency", "Memory_Efficiency",
+]
+_ROLE_COLUMNS = [
+    "CPU_Capacity_m", "CPU_Allocatable_m", "Memory_Capacity_Mi", "Memory_Allocatable_Mi",
+    "CPU_Utilization", "Memory_Utilization",
+]
 
 
 @register
@@ -49,8 +153,30 @@ class NodesReport(ReportGenerator):
     filename_prefix = 'nodes-'
 
     def generate(self, db: WorkloadDB, cluster: str, out_path: str) -> None:
+        nodes = self._fetch_nodes(db, cluster)
+        if not nodes:
+            self._generate_empty_report(cluster, out_path)
+            return
+        role_groups = self._group_nodes_by_role(nodes)
+        role_totals = self._role_totals(role_groups)
+        title = f"Nodes resource report: {html.escape(cluster)}"
+
+        with open(out_path, 'w', encoding='utf-8', buffering=HTML_WRITE_BUFFER) as f:
+            write = f.write
+            write_html_prologue(f, title, _NODES_CSS)
+            write(f"<h1>{title}</h1>\n")
+            write(_NODES_LEGEND_HTML)
+            write("\n")
+            self._emit_summary_section(write, role_groups, role_totals)
+            for role, role_nodes in role_groups.items():
+                self._emit_role_section(write, role, role_nodes)
+            self._emit_cluster_totals(write, role_groups, role_totals)
+            write_html_epilogue(f)
+
+    def _fetch_nodes(self, db: WorkloadDB, cluster: str) -> List[Tuple[str, NodeRow]]:
         cur = db._conn.cursor()
-        nodes = cur.execute(
+        cur.row_factory = _node_row_factory
+        return cur.execute(
             """SELECT node_name, node_role, instance_type, zone, 
                       cpu_capacity, memory_capacity, cpu_allocatable, memory_allocatable
                FROM node_capacity 
@@ -58,147 +184,107 @@ class NodesReport(ReportGenerator):
                ORDER BY node_role, node_name""",
             (cluster,)
         ).fetchall()
-        if not nodes:
-            self._generate_empty_report(cluster, out_path)
-            return
-        role_groups = self._group_nodes_by_role(nodes)
-        title = f"Nodes resource report: {html.escape(cluster)}"
-        parts = [f"<h1>{title}</h1>"]
-        legend_sections = [
-            {
-                'title': 'Summary Table Columns',
-                'items': [
-                    'Role: Node role grouping',
-                    'Count: Number of nodes with that role',
-                    'CPU Capacity (cores): Sum of core capacity',
-                    'CPU Allocatable (cores): Sum cores allocatable to pods',
-                    'Memory Capacity (GiB): Sum memory capacity',
-                    'Memory Allocatable (GiB): Sum memory allocatable to pods',
-                    'CPU Efficiency: Allocatable / Capacity * 100',
-                    'Memory Efficiency: Allocatable / Capacity * 100'
-                ]
-            },
-            {
-                'title': 'Per-Role Table Columns',
-                'items': [
-                    'Node Name: Kubernetes node name',
-                    'Instance Type: Cloud instance type (or unknown)',
-                    'Zone: Availability zone (or unknown)',
-                    'CPU Cap (m): CPU capacity in millicores',
-                    'CPU Alloc (m): CPU allocatable in millicores',
-                    'Mem Cap (Mi): Memory capacity in MiB',
-                    'Mem Alloc (Mi): Memory allocatable in MiB',
-                    'CPU Util %: Allocatable / Capacity * 100',
-                    'Mem Util %: Allocatable / Capacity * 100'
-                ]
-            }
-        ]
-        parts.append(build_legend_html(legend_sections))
-        parts.extend(self._generate_summary_section(role_groups))
-        for role in sorted(role_groups.keys()):
-            parts.extend(self._generate_role_section(role, role_groups[role]))
-        parts.extend(self._generate_cluster_totals(role_groups))
-        additional_styles = (
-            "table { width: 100%; }"
-            "th { padding: 8px; text-align: left; }"
-            "td { padding: 6px 8px; }"
-            "h1 { color: #333; }"
-            "h2 { color: #555; margin-top: 24px; }"
-            "h3 { color: #777; margin-top: 20px; }"
-            "ul { margin: 8px 0; }"
-            "li { margin: 4px 0; }"
-        )
-        html_doc = wrap_html_document(title, parts, additional_styles)
-        with open(out_path, 'w', encoding='utf-8') as f:
-            f.write(html_doc)
 
-    def _group_nodes_by_role(self, nodes: List[Tuple]) -> Dict[str, List[Dict]]:
-        role_groups = {}
-        for node_name, node_role, instance_type, zone, cpu_cap, mem_cap, cpu_alloc, mem_alloc in nodes:
-            role = node_role or 'unknown'
-            node_data = {
-                'name': node_name,
-                'instance_type': instance_type or 'unknown',
-                'zone': zone or 'unknown',
-                'cpu_capacity_m': _parse_resource_value(cpu_cap) or 0,
-                'memory_capacity_mi': _parse_resource_value(mem_cap) or 0,
-                'cpu_allocatable_m': _parse_resource_value(cpu_alloc) or 0,
-                'memory_allocatable_mi': _parse_resource_value(mem_alloc) or 0,
-            }
-            if role not in role_groups:
-                role_groups[role] = []
-            role_groups[role].append(node_data)
-        return role_groups
-
-    def _generate_summary_section(self, role_groups: Dict[str, List[Dict]]) -> List[str]:
-        parts = ["<h2>Resource Summary by Node Role</h2>"]
-        parts.append("<table border=1 cellpadding=4 cellspacing=0>")
-        parts.append("<tr><th>Role</th><th>Count</th><th>CPU Capacity (cores)</th><th>CPU Allocatable (cores)</th>"
-                    "<th>Memory Capacity (GiB)</th><th>Memory Allocatable (GiB)</th><th>CPU Efficiency</th><th>Memory Efficiency</th></tr>")
-        for role in sorted(role_groups.keys()):
-            nodes = role_groups[role]
-            count = len(nodes)
-            total_cpu_cap = sum(node['cpu_capacity_m'] for node in nodes) / 1000
-            total_cpu_alloc = sum(node['cpu_allocatable_m'] for node in nodes) / 1000
-            total_mem_cap = sum(node['memory_capacity_mi'] for node in nodes) / 1024
-            total_mem_alloc = sum(node['memory_allocatable_mi'] for node in nodes) / 1024
+    def _group_nodes_by_role(self, nodes: List[Tuple[str, NodeRow]]) -> Dict[str, List[NodeRow]]:
+        """Group (role, node) pairs; the returned dict iterates roles in sorted order."""
+        role_groups: Dict[str, List[NodeRow]] = {}
+        for role, node in nodes:
+            role_groups.setdefault(role, []).append(node)
+        return {role: role_groups[role] for role in sorted(role_groups)}
+
+    def _role_totals(self, role_groups: Dict[str, List[NodeRow]]) -> Dict[str, Tuple[float, float, float, float]]:
+        """(cpu_cap_m, cpu_alloc_m, mem_cap_mi, mem_alloc_mi) per role, from the already parsed nodes."""
+        totals = {}
+        for role, nodes in role_groups.items():
+            cpu_cap_m = cpu_alloc_m = mem_cap_mi = mem_alloc_mi = 0.0
+            for node in nodes:
+                cpu_cap_m += node.cpu_capacity_m
+                cpu_alloc_m += node.cpu_allocatable_m
+                mem_cap_mi += node.memory_capacity_mi
+                mem_alloc_mi += node.memory_allocatable_mi
+            totals[role] = (cpu_cap_m, cpu_alloc_m, mem_cap_mi, mem_alloc_mi)
+        return totals
+
+    def _emit_summary_section(self, write: Callable[[str], object], role_groups: Dict[str, List[NodeRow]],
+                              role_totals: Dict[str, Tuple[float, float, float, float]]) -> None:
+        write("<h2>Resource Summary by Node Role</h2>\n")
+        write("<table border=1 cellpadding=4 cellspacing=0>\n")
+        write("<tr><th>Role</th><th>Count</th><th>CPU Capacity (cores)</th><th>CPU Allocatable (cores)</th>"
+              "<th>Memory Capacity (GiB)</th><th>Memory Allocatable (GiB)</th><th>CPU Efficiency</th><th>Memory Efficiency</th></tr>\n")
+        (fmt_count, fmt_cpu_cap, fmt_cpu_alloc, fmt_mem_cap, fmt_mem_alloc,
+         fmt_cpu_eff, fmt_mem_eff) = make_cell_formatter('nodes', _SUMMARY_COLUMNS).values()
+        for role, role_nodes in role_groups.items():
+            count = len(role_nodes)
+            cpu_cap_m, cpu_alloc_m, mem_cap_mi, mem_alloc_mi = role_totals[role]
+            total_cpu_cap = cpu_cap_m / 1000
+            total_cpu_alloc = cpu_alloc_m / 1000
+            total_mem_cap = mem_cap_mi / 1024
+            total_mem_alloc = mem_alloc_mi / 1024
             cpu_efficiency = (total_cpu_alloc / total_cpu_cap * 100) if total_cpu_cap > 0 else 0
             mem_efficiency = (total_mem_alloc / total_mem_cap * 100) if total_mem_cap > 0 else 0
-            row_cells = [
-                f"<td><strong>{html.escape(role)}</strong></td>",
-                format_cell_with_condition(str(count), "Count", None, 'nodes'),
-                format_cell_with_condition(f"{total_cpu_cap:.1f}", "CPU_Capacity", None, 'nodes'),
-                format_cell_with_condition(f"{total_cpu_alloc:.1f}", "CPU_Allocatable", None, 'nodes'),
-                format_cell_with_condition(f"{total_mem_cap:.1f}", "Memory_Capacity", None, 'nodes'),
-                format_cell_with_condition(f"{total_mem_alloc:.1f}", "Memory_Allocatable", None, 'nodes'),
-                format_cell_with_condition(f"{cpu_efficiency:.1f}%", "CPU_Efficiency", None, 'nodes'),
-                format_cell_with_condition(f"{mem_efficiency:.1f}%", "Memory_Efficiency", None, 'nodes')
-            ]
-            parts.append("<tr>" + "".join(row_cells) + "</tr>")
-        parts.append("</table>")
-        return parts
-
-    def _generate_role_section(self, role: str, nodes: List[Dict]) -> List[str]:
-        parts = [f"<h3>{html.escape(role.title())} Nodes ({len(nodes)})</h3>"]
-        parts.append("<table border=1 cellpadding=4 cellspacing=0>")
-        parts.append("<tr><th>Node Name</th><th>Instance Type</th><th>Zone</th>"
-                    "<th>CPU Cap (m)</th><th>CPU Alloc (m)</th><th>Mem Cap (Mi)</th><th>Mem Alloc (Mi)</th>"
-                    "<th>CPU Util %</th><th>Mem Util %</th></tr>")
-        for node in sorted(nodes, key=lambda n: n['name']):
-            cpu_util = (node['cpu_allocatable_m'] / node['cpu_capacity_m'] * 100) if node['cpu_capacity_m'] > 0 else 0
-            mem_util = (node['memory_allocatable_mi'] / node['memory_capacity_mi'] * 100) if node['memory_capacity_mi'] > 0 else 0
-            node_cells = [
-                f"<td>{html.escape(node['name'])}</td>",
-                f"<td>{html.escape(node['instance_type'])}</td>",
-                f"<td>{html.escape(node['zone'])}</td>",
-                format_cell_with_condition(f"{node['cpu_capacity_m']:.0f}", "CPU_Capacity_m", node, 'nodes'),
-                format_cell_with_condition(f"{node['cpu_allocatable_m']:.0f}", "CPU_Allocatable_m", node, 'nodes'),
-                format_cell_with_condition(f"{node['memory_capacity_mi']:.0f}", "Memory_Capacity_Mi", node, 'nodes'),
-                format_cell_with_condition(f"{node['memory_allocatable_mi']:.0f}", "Memory_Allocatable_Mi", node, 'nodes'),
-                format_cell_with_condition(f"{cpu_util:.1f}%", "CPU_Utilization", node, 'nodes'),
-                format_cell_with_condition(f"{mem_util:.1f}%", "Memory_Utilization", node, 'nodes')
-            ]
-            parts.append("<tr>" + "".join(node_cells) + "</tr>")
-        parts.append("</table>")
-        return parts
-
-    def _generate_cluster_totals(self, role_groups: Dict[str, List[Dict]]) -> List[str]:
-        parts = ["<h2>Cluster Totals</h2>"]
+            write(_SUMMARY_ROW_TPL.format(
+                role=escape_cell(role),
+                count_cell=fmt_count(str(count)),
+                cpu_cap_cell=fmt_cpu_cap(f"{total_cpu_cap:.1f}"),
+                cpu_alloc_cell=fmt_cpu_alloc(f"{total_cpu_alloc:.1f}"),
+                mem_cap_cell=fmt_mem_cap(f"{total_mem_cap:.1f}"),
+                mem_alloc_cell=fmt_mem_alloc(f"{total_mem_alloc:.1f}"),
+                cpu_eff_cell=fmt_cpu_eff(f"{cpu_efficiency:.1f}%"),
+                mem_eff_cell=fmt_mem_eff(f"{mem_efficiency:.1f}%"),
+            ))
+        write("</table>\n")
+
+    def _emit_role_section(self, write: Callable[[str], object], role: str, nodes: List[NodeRow]) -> None:
+        write(f"<h3>{html.escape(role.title())} Nodes ({len(nodes)})</h3>\n")
+        write("<table border=1 cellpadding=4 cellspacing=0>\n")
+        write("<tr><th>Node Name</th><th>Instance Type</th><th>Zone</th>"
+              "<th>CPU Cap (m)</th><th>CPU Alloc (m)</th><th>Mem Cap (Mi)</th><th>Mem Alloc (Mi)</th>"
+              "<th>CPU Util %</th><th>Mem Util %</th></tr>\n")
+        (fmt_cpu_cap, fmt_cpu_alloc, fmt_mem_cap, fmt_mem_alloc,
+         fmt_cpu_util, fmt_mem_util) = make_cell_formatter('nodes', _ROLE_COLUMNS).values()
+        # Rules read row_data as a dict; skip building it when none apply
+        needs_row_data = bool(get_rule_columns('nodes', _ROLE_COLUMNS))
+        for node in sorted(nodes, key=lambda n: n.name):
+            row_data = node._asdict() if needs_row_data else None
+            cpu_util = (node.cpu_allocatable_m / node.cpu_capacity_m * 100) if node.cpu_capacity_m > 0 else 0
+            mem_util = (node.memory_allocatable_mi / node.memory_capacity_mi * 100) if node.memory_capacity_mi > 0 else 0
+            write(_ROLE_ROW_TPL.format(
+                name=html.escape(node.name),
+                itype=escape_cell(node.instance_type),
+                zone=escape_cell(node.zone),
+                cpu_cap_cell=fmt_cpu_cap(f"{node.cpu_capacity_m:.0f}", row_data),
+                cpu_alloc_cell=fmt_cpu_alloc(f"{node.cpu_allocatable_m:.0f}", row_data),
+                mem_cap_cell=fmt_mem_cap(f"{node.memory_capacity_mi:.0f}", row_data),
+                mem_alloc_cell=fmt_mem_alloc(f"{node.memory_allocatable_mi:.0f}", row_data),
+                cpu_util_cell=fmt_cpu_util(f"{cpu_util:.1f}%", row_data),
+                mem_util_cell=fmt_mem_util(f"{mem_util:.1f}%", row_data),
+            ))
+        write("</table>\n")
+
+    def _emit_cluster_totals(self, write: Callable[[str], object], role_groups: Dict[str, List[NodeRow]],
+                             role_totals: Dict[str, Tuple[float, float, float, float]]) -> None:
+        write("<h2>Cluster Totals</h2>\n")
         total_nodes = sum(len(nodes) for nodes in role_groups.values())
-        total_cpu_cap = sum(sum(node['cpu_capacity_m'] for node in nodes) for nodes in role_groups.values()) / 1000
-        total_cpu_alloc = sum(sum(node['cpu_allocatable_m'] for node in nodes) for nodes in role_groups.values()) / 1000
-        total_mem_cap = sum(sum(node['memory_capacity_mi'] for node in nodes) for nodes in role_groups.values()) / 1024
-        total_mem_alloc = sum(sum(node['memory_allocatable_mi'] for node in nodes) for nodes in role_groups.values()) / 1024
+        # Cluster totals are the sum of the per-role sums: O(roles), not O(nodes)
+        cpu_cap_m = cpu_alloc_m = mem_cap_mi = mem_alloc_mi = 0.0
+        for cpu_cap, cpu_alloc, mem_cap, mem_alloc in role_totals.values():
+            cpu_cap_m += cpu_cap
+            cpu_alloc_m += cpu_alloc
+            mem_cap_mi += mem_cap
+            mem_alloc_mi += mem_alloc
+        total_cpu_cap = cpu_cap_m / 1000
+        total_cpu_alloc = cpu_alloc_m / 1000
+        total_mem_cap = mem_cap_mi / 1024
+        total_mem_alloc = mem_alloc_mi / 1024
         overall_cpu_efficiency = (total_cpu_alloc / total_cpu_cap * 100) if total_cpu_cap > 0 else 0
         overall_mem_efficiency = (total_mem_alloc / total_mem_cap * 100) if total_mem_cap > 0 else 0
-        parts.append("<ul>")
-        parts.append(f"<li><strong>Total Nodes:</strong> {total_nodes}</li>")
-        parts.append(f"<li><strong>Total CPU Capacity:</strong> {total_cpu_cap:.1f} cores</li>")
-        parts.append(f"<li><strong>Total CPU Allocatable:</strong> {total_cpu_alloc:.1f} cores ({overall_cpu_efficiency:.1f}% efficiency)</li>")
-        parts.append(f"<li><strong>Total Memory Capacity:</strong> {total_mem_cap:.1f} GiB</li>")
-        parts.append(f"<li><strong>Total Memory Allocatable:</strong> {total_mem_alloc:.1f} GiB ({overall_mem_efficiency:.1f}% efficiency)</li>")
-        parts.append("</ul>")
-        return parts
+        write("<ul>\n")
+        write(f"<li><strong>Total Nodes:</strong> {total_nodes}</li>\n")
+        write(f"<li><strong>Total CPU Capacity:</strong> {total_cpu_cap:.1f} cores</li>\n")
+        write(f"<li><strong>Total CPU Allocatable:</strong> {total_cpu_alloc:.1f} cores ({overall_cpu_efficiency:.1f}% efficiency)</li>\n")
+        write(f"<li><strong>Total Memory Capacity:</strong> {total_mem_cap:.1f} GiB</li>\n")
+        write(f"<li><strong>Total Memory Allocatable:</strong> {total_mem_alloc:.1f} GiB ({overall_mem_efficiency:.1f}% efficiency)</li>\n")
+        write("</ul>\n")
 
     def _generate_empty_report(self, cluster: str, out_path: str) -> None:
         title = f"Nodes resource report: {html.escape(cluster)}"
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 
 class RuleType(Enum):
@@ -15,27 +15,52 @@ class RuleType(Enum):
     NONE = "none"
 
 
-@dataclass
+def column_name_lower(context: Dict[str, Any]) -> str:
+    """Lowercased column name; the engine precomputes it per column."""
+    lowered = context.get('_column_name_lower')
+    if lowered is None:
+        lowered = context.get('column_name', '').lower()
+    return lowered
+
+
+_CSS_CLASS_BY_RULE = {
+    RuleType.ERROR_MISS: "error-miss-cell",
+    RuleType.WARNING_MISS: "warning-miss-cell",
+    RuleType.ERROR_MISCONF: "error-misconf-cell",
+    RuleType.WARNING_MISCONF: "warning-misconf-cell",
+}
+
+
+@dataclass(frozen=True, init=False)
 class RuleResult:
+    """Outcome of evaluating a rule on one cell.
+
+    Slotted and immutable: one is created per rule hit and results are
+    shared through the engine's evaluation cache.
+    """
+    __slots__ = ('rule_type', 'message', 'matched_rule')
     rule_type: RuleType
-    message: Optional[str] = None
-    matched_rule: Optional[str] = None
+    message: Optional[str]
+    matched_rule: Optional[str]
+
+    def __init__(self, rule_type: RuleType, message: Optional[str] = None, matched_rule: Optional[str] = None):
+        object.__setattr__(self, 'rule_type', rule_type)
+        object.__setattr__(self, 'message', message)
+        object.__setattr__(self, 'matched_rule', matched_rule)
 
     @property
     def css_class(self) -> str:
-        mapping = {
-            RuleType.ERROR_MISS: "error-miss-cell",
-            RuleType.WARNING_MISS: "warning-miss-cell",
-            RuleType.ERROR_MISCONF: "error-misconf-cell",
-            RuleType.WARNING_MISCONF: "warning-misconf-cell",
-        }
-        return mapping.get(self.rule_type, "")
+        return _CSS_CLASS_BY_RULE.get(self.rule_type, "")
 
     def __bool__(self) -> bool:
-        return self.rule_type not in (RuleType.NONE,)
+        return self.rule_type is not RuleType.NONE
 
 
 class Rule(ABC):
+    # Keys of row_data that evaluate() reads; None means it may read any.
+    # The engine caches results per (column, cell value, these keys).
+    row_data_keys: Optional[Tuple[str, ...]] = None
+
     def __init__(self, name: str, description: str, enabled: bool = True):
         self.name = name
         self.description = description
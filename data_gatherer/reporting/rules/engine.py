@@ -1,42 +1,131 @@
-from typing import Dict, Any, Optional
-from .base import RuleResult, RuleType
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from .base import Rule, RuleResult, RuleType
 from .registry import RuleRegistry
 
 
+# Ordering across rule categories; higher wins
+_SEVERITY_ORDER = {
+    RuleType.NONE: 0,
+    RuleType.INFO: 1,
+    RuleType.WARNING_MISS: 2,
+    RuleType.WARNING_MISCONF: 3,
+    RuleType.ERROR_MISS: 4,
+    RuleType.ERROR_MISCONF: 5,
+}
+# Early exit once any ERROR category matches
+_TOP_SEVERITY = _SEVERITY_ORDER[RuleType.ERROR_MISS]
+# Shared result for cells no rule flags; RuleResult is immutable
+_NONE_RESULT = RuleResult(RuleType.NONE)
+
+
 class RulesEngine:
     def __init__(self, registry: Optional[RuleRegistry] = None):
         self.registry = registry or RuleRegistry()
         self._cache_enabled = True
-        self._evaluation_cache: Dict[str, RuleResult] = {}
+        self._evaluation_cache: Dict[Tuple, RuleResult] = {}
+        self._rules_by_column: Dict[Tuple[str, str], Tuple[List[Rule], Optional[Tuple[str, ...]]]] = {}
+        self._rules_version = self.registry.version
+
+    def rules_for_column(self, report_type: str, column_name: str) -> List[Rule]:
+        """Enabled rules that apply to ``column_name`` in ``report_type``."""
+        self._sync_registry()
+        return [r for r in self._column_rules(report_type, column_name)[0] if r.enabled]
+
+    def _sync_registry(self) -> None:
+        # Drop everything derived from the rule set once the registry changes
+        if self.registry.version != self._rules_version:
+            self._rules_by_column.clear()
+            self._evaluation_cache.clear()
+            self._rules_version = self.registry.version
+
+    def _column_rules(self, report_type: str, column_name: str) -> Tuple[List[Rule], Optional[Tuple[str, ...]]]:
+        # Applicability depends on the column name and report type only, so
+        # it is decided once per column rather than once per cell. Also
+        # returns the row_data keys those rules read (None: the whole row).
+        key = (report_type, column_name)
+        entry = self._rules_by_column.get(key)
+        if entry is None:
+            probe = {
+                'cell_value': '', 'column_name': column_name, 'row_data': {}, 'report_type': report_type,
+                '_column_name_lower': column_name.lower(),
+            }
+            rules = [r for r in self.registry.get_rules() if r.applies_to(probe)]
+            row_keys: Optional[set] = set()
+            for rule in rules:
+                if rule.row_data_keys is None:
+                    row_keys = None
+                    break
+                row_keys.update(rule.row_data_keys)
+            entry = (rules, None if row_keys is None else tuple(sorted(row_keys)))
+            self._rules_by_column[key] = entry
+        return entry
 
     def evaluate_cell(self, context: Dict[str, Any]) -> RuleResult:
+        self._sync_registry()
+        applicable_rules, row_keys = self._column_rules(context.get('report_type', ''), context.get('column_name', ''))
+        if not applicable_rules:
+            return _NONE_RESULT
         cache_key = None
         if self._cache_enabled:
-            cache_key = self._generate_cache_key(context)
-            if cache_key in self._evaluation_cache:
-                return self._evaluation_cache[cache_key]
-        applicable_rules = self.registry.get_applicable_rules(context)
-        if not applicable_rules:
-            result = RuleResult(RuleType.NONE)
-            if cache_key:
-                self._evaluation_cache[cache_key] = result
-            return result
-        highest_result = RuleResult(RuleType.NONE)
+            cache_key = self._generate_cache_key(context, row_keys)
+            cached = self._evaluation_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        highest_result = None
+        highest_severity = 0
+        severity_of = _SEVERITY_ORDER.get
         for rule in applicable_rules:
+            if not rule.enabled:
+                continue
             try:
                 rule_result = rule.evaluate(context)
-                if rule_result and self._is_higher_severity(rule_result.rule_type, highest_result.rule_type):
+                if not rule_result:
+                    continue
+                severity = severity_of(rule_result.rule_type, 0)
+                if severity > highest_severity:
                     highest_result = rule_result
-                    # Early exit if we hit top severity (any ERROR category)
-                    if rule_result.rule_type in (RuleType.ERROR_MISS, RuleType.ERROR_MISCONF):
+                    highest_severity = severity
+                    if severity >= _TOP_SEVERITY:
                         break
             except Exception as e:  # pragma: no cover
                 print(f"Warning: Rule '{rule.name}' failed to evaluate: {e}")
                 continue
-        if cache_key:
+        if highest_result is None:
+            highest_result = _NONE_RESULT
+        if cache_key is not None:
             self._evaluation_cache[cache_key] = highest_result
         return highest_result
 
+    def evaluate_column(self, report_type: str, column_name: str, values: Sequence[Any],
+                        rows: Optional[Sequence[Dict[str, Any]]] = None) -> List[RuleResult]:
+        """Evaluate every cell of one column, returning one result per value.
+
+        Rules are resolved once for the column. When they read the cell value
+        alone, each distinct value is evaluated once and its result reused;
+        otherwise each cell is evaluated with its row taken from ``rows``.
+        """
+        self._sync_registry()
+        rules, row_keys = self._column_rules(report_type, column_name)
+        if not rules:
+            return [_NONE_RESULT] * len(values)
+        context = {'cell_value': None, 'column_name': column_name, 'row_data': {}, 'report_type': report_type}
+        if row_keys == ():
+            by_value: Dict[Any, RuleResult] = {}
+            results = []
+            for value in values:
+                result = by_value.get(value)
+                if result is None:
+                    context['cell_value'] = value
+                    result = by_value[value] = self.evaluate_cell(context)
+                results.append(result)
+            return results
+        results = []
+        for index, value in enumerate(values):
+            context['cell_value'] = value
+            context['row_data'] = rows[index] if rows is not None else {}
+            results.append(self.evaluate_cell(context))
+        return results
+
     def clear_cache(self) -> None:
         self._evaluation_cache.clear()
 
@@ -45,27 +134,25 @@ class RulesEngine:
         if not enabled:
             self.clear_cache()
 
-    def _generate_cache_key(self, context: Dict[str, Any]) -> str:
-        row_data = context.get('row_data', {})
-        column_name = context.get('column_name', '')
-        cell_value = context.get('cell_value', '')
-        report_type = context.get('report_type', '')
-        key_parts = [
-            report_type,
-            column_name,
-            str(cell_value),
-            str(hash(frozenset(row_data.items()) if isinstance(row_data, dict) else str(row_data)))
-        ]
-        return '|'.join(key_parts)
+    def _generate_cache_key(self, context: Dict[str, Any], row_keys: Optional[Tuple[str, ...]] = None) -> Tuple:
+        """Tuple key over the context fields the column's rules can read.
+
+        Only the ``row_keys`` entries of row_data take part, so a column whose
+        rules look at the cell value alone shares results across rows.
+        """
+        row_data = context.get('row_data') or {}
+        if not isinstance(row_data, dict):
+            row_part: Any = str(row_data)
+        elif row_keys is None:
+            row_part = frozenset(row_data.items())
+        else:
+            row_part = tuple([row_data.get(k) for k in row_keys])
+        return (
+            context.get('report_type', ''),
+            context.get('column_name', ''),
+            context.get('cell_value', ''),
+            row_part,
+        )
 
     def _is_higher_severity(self, new_type: RuleType, current_type: RuleType) -> bool:
-        # Define ordering across new categories
-        severity_order = {
-            RuleType.NONE: 0,
-            RuleType.INFO: 1,
-            RuleType.WARNING_MISS: 2,
-            RuleType.WARNING_MISCONF: 3,
-            RuleType.ERROR_MISS: 4,
-            RuleType.ERROR_MISCONF: 5,
-        }
-        return severity_order.get(new_type, 0) > severity_order.get(current_type, 0)
+        return _SEVERITY_ORDER.get(new_type, 0) > _SEVERITY_ORDER.get(current_type, 0)
@@ -1,66 +1,97 @@
-from typing import Dict, Any
-from .base import Rule, RuleResult, RuleType
+import re
+from typing import Dict, Any, Pattern
+from .base import Rule, RuleResult, RuleType, column_name_lower
 from typing import Optional
 
 
-class MissingCpuRequestRule(Rule):
+# Placeholders rendered for absent values; zero is an explicit value
+_MISSING_VALUES = frozenset(('', '-', 'N/A', 'None'))
+_MISSING_PROBE_VALUES = frozenset(('-', 'N/A', 'None', 'No', 'False', 'Missing', 'Not configured'))
+_NO_LIMIT_VALUES = frozenset((None, '', '-', 'N/A'))
+
+
+# Request column -> (request key, limit key) in row_data
+_SKEW_PAIRS = {
+    'CPU_req_m': ('CPU_req_m', 'CPU_lim_m'),
+    'Mem_req_Mi': ('Mem_req_Mi', 'Mem_lim_Mi'),
+}
+
+
+def _as_int(value: Any) -> int:
+    # Whole-number cell value, 0 for blanks and anything non-numeric
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return 0
+
+
+def _all_words(*words: str) -> Pattern:
+    # Matches a lowercased column name containing every word, in any order
+    return re.compile(''.join(f'(?=.*{re.escape(w)})' for w in words), re.DOTALL)
+
+
+class _ColumnPatternRule(Rule):
+    """Rule applying to columns whose lowercased name matches ``column_pattern``."""
+    column_pattern: Pattern
+
+    def applies_to(self, context: Dict[str, Any]) -> bool:
+        return self.column_pattern.match(column_name_lower(context)) is not None
+
+
+class MissingCpuRequestRule(_ColumnPatternRule):
+    row_data_keys = ()
+    column_pattern = _all_words('cpu', 'req')
     def __init__(self):
         super().__init__(name="missing_cpu_request", description="Missing value for CPU requests: ERROR_MISS")
-    def applies_to(self, context: Dict[str, Any]) -> bool:
-        column_name = context.get('column_name', '')
-        return 'CPU_req' in column_name or ('cpu' in column_name.lower() and 'req' in column_name.lower())
     def evaluate(self, context: Dict[str, Any]) -> RuleResult:
         cell_value = context.get('cell_value', '')
-        if not cell_value or str(cell_value).strip() in ['', '-', 'N/A', 'None']:
+        if cell_value is None or str(cell_value).strip() in _MISSING_VALUES:
             return RuleResult(RuleType.ERROR_MISS, message="Missing CPU request value", matched_rule=self.name)
         return RuleResult(RuleType.NONE)
 
 
-class MissingMemoryRequestRule(Rule):
+class MissingMemoryRequestRule(_ColumnPatternRule):
+    row_data_keys = ()
+    column_pattern = _all_words('mem', 'req')
     def __init__(self):
         super().__init__(name="missing_memory_request", description="Missing value for Memory requests: ERROR_MISS")
-    def applies_to(self, context: Dict[str, Any]) -> bool:
-        column_name = context.get('column_name', '')
-        return 'Mem_req' in column_name or ('mem' in column_name.lower() and 'req' in column_name.lower())
     def evaluate(self, context: Dict[str, Any]) -> RuleResult:
         cell_value = context.get('cell_value', '')
-        if not cell_value or str(cell_value).strip() in ['', '-', 'N/A', 'None']:
+        if cell_value is None or str(cell_value).strip() in _MISSING_VALUES:
             return RuleResult(RuleType.ERROR_MISS, message="Missing Memory request value", matched_rule=self.name)
         return RuleResult(RuleType.NONE)
 
 
-class MissingCpuLimitRule(Rule):
+class MissingCpuLimitRule(_ColumnPatternRule):
+    row_data_keys = ()
+    column_pattern = _all_words('cpu', 'lim')
     def __init__(self):
         super().__init__(name="missing_cpu_limit", description="Missing value for CPU limits: WARNING_MISS")
-    def applies_to(self, context: Dict[str, Any]) -> bool:
-        column_name = context.get('column_name', '')
-        return 'CPU_lim' in column_name or ('cpu' in column_name.lower() and 'lim' in column_name.lower())
     def evaluate(self, context: Dict[str, Any]) -> RuleResult:
         cell_value = context.get('cell_value', '')
-        if not cell_value or str(cell_value).strip() in ['', '-', 'N/A', 'None']:
+        if cell_value is None or str(cell_value).strip() in _MISSING_VALUES:
             return RuleResult(RuleType.WARNING_MISS, message="Missing CPU limit value", matched_rule=self.name)
         return RuleResult(RuleType.NONE)
 
 
-class MissingMemoryLimitRule(Rule):
+class MissingMemoryLimitRule(_ColumnPatternRule):
+    row_data_keys = ()
+    column_pattern = _all_words('mem', 'lim')
     def __init__(self):
         super().__init__(name="missing_memory_limit", description="Missing value for Memory limits: WARNING_MISS")
-    def applies_to(self, context: Dict[str, Any]) -> bool:
-        column_name = context.get('column_name', '')
-        return 'Mem_lim' in column_name or ('mem' in column_name.lower() and 'lim' in column_name.lower())
     def evaluate(self, context: Dict[str, Any]) -> RuleResult:
         cell_value = context.get('cell_value', '')
-        if not cell_value or str(cell_value).strip() in ['', '-', 'N/A', 'None']:
+        if cell_value is None or str(cell_value).strip() in _MISSING_VALUES:
             return RuleResult(RuleType.WARNING_MISS, message="Missing Memory limit value", matched_rule=self.name)
         return RuleResult(RuleType.NONE)
 
 
-class ImagePullPolicyAlwaysRule(Rule):
+class ImagePullPolicyAlwaysRule(_ColumnPatternRule):
+    row_data_keys = ()
+    column_pattern = _all_words('image', 'pull', 'policy')
     def __init__(self):
         super().__init__(name="image_pull_policy_always", description="ImagePullPolicy set to Always: WARNING_MISCONF")
-    def applies_to(self, context: Dict[str, Any]) -> bool:
-        column_name = context.get('column_name', '').lower()
-        return 'image' in column_name and 'pull' in column_name and 'policy' in column_name
     def evaluate(self, context: Dict[str, Any]) -> RuleResult:
         cell_value = context.get('cell_value', '')
         if cell_value == 'Always':
@@ -68,44 +99,40 @@ class ImagePullPolicyAlwaysRule(Rule):
         return RuleResult(RuleType.NONE)
 
 
-class MissingReadinessProbeRule(Rule):
+class MissingReadinessProbeRule(_ColumnPatternRule):
+    row_data_keys = ()
+    column_pattern = _all_words('readiness', 'probe')
     def __init__(self):
         super().__init__(name="missing_readiness_probe", description="ReadinessProbe missing: ERROR_MISS")
-    def applies_to(self, context: Dict[str, Any]) -> bool:
-        column_name = context.get('column_name', '').lower()
-        return 'readiness' in column_name and 'probe' in column_name
     def evaluate(self, context: Dict[str, Any]) -> RuleResult:
         cell_value = context.get('cell_value', '')
-        if not cell_value or cell_value in ['-', 'N/A', 'None', 'No', 'False', 'Missing', 'Not configured']:
+        if not cell_value or cell_value in _MISSING_PROBE_VALUES:
             return RuleResult(RuleType.ERROR_MISS, message="ReadinessProbe missing", matched_rule=self.name)
         return RuleResult(RuleType.NONE)
 
 
 class RequestLimitSkewRule(Rule):
+    row_data_keys = tuple(key for pair in _SKEW_PAIRS.values() for key in pair)
     def __init__(self, threshold: float = 0.2):
         super().__init__(name="request_limit_skew", description=f"Request <= {int(threshold*100)}% of limit: WARNING_MISCONF")
         self.threshold = threshold
     def applies_to(self, context: Dict[str, Any]) -> bool:
         # Apply only once per resource type for CPU & Memory request columns (avoid duplicate on limit columns)
-        col = context.get('column_name','')
-        return col in ("CPU_req_m", "Mem_req_Mi")
+        return context.get('column_name') in _SKEW_PAIRS
     def evaluate(self, context: Dict[str, Any]) -> RuleResult:
-        row = context.get('row_data', {})
-        try:
-            if context.get('column_name') == 'CPU_req_m':
-                req = int(row.get('CPU_req_m') or 0)
-                lim = int(row.get('CPU_lim_m') or 0)
-            else:
-                req = int(row.get('Mem_req_Mi') or 0)
-                lim = int(row.get('Mem_lim_Mi') or 0)
-            if lim > 0 and req > 0 and req/lim <= self.threshold:
-                return RuleResult(RuleType.WARNING_MISCONF, message=f"Request <= {int(self.threshold*100)}% of limit", matched_rule=self.name)
-        except Exception:
-            pass
+        pair = _SKEW_PAIRS.get(context.get('column_name'))
+        if pair is None:
+            return RuleResult(RuleType.NONE)
+        row = context.get('row_data') or {}
+        req = _as_int(row.get(pair[0]))
+        lim = _as_int(row.get(pair[1]))
+        if lim > 0 and req > 0 and req/lim <= self.threshold:
+            return RuleResult(RuleType.WARNING_MISCONF, message=f"Request <= {int(self.threshold*100)}% of limit", matched_rule=self.name)
         return RuleResult(RuleType.NONE)
 
 
 class LimitExceedsSmallestNodeRule(Rule):
+    row_data_keys = ()
     def __init__(self, smallest_cpu_m: Optional[int] = None, smallest_mem_mi: Optional[int] = None):
         super().__init__(name="limit_exceeds_smallest_node", description="Limit >= smallest node size: ERROR_MISCONF")
         self.smallest_cpu_m = smallest_cpu_m
@@ -116,7 +143,7 @@ class LimitExceedsSmallestNodeRule(Rule):
         val = context.get('cell_value')
         col = context.get('column_name')
         try:
-            ival = int(val) if val not in (None, '', '-', 'N/A') else 0
+            ival = int(val) if val not in _NO_LIMIT_VALUES else 0
         except Exception:
             return RuleResult(RuleType.NONE)
         if col == 'CPU_lim_m' and self.smallest_cpu_m and ival >= self.smallest_cpu_m:
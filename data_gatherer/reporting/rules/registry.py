@@ -7,9 +7,20 @@ class RuleRegistry:
 
     def __init__(self):
         self._rules: List[Rule] = []
+        self._by_name: Dict[str, Rule] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever rules are added, removed, enabled or disabled."""
+        return self._version
 
     def register(self, rule: Rule):
+        if rule.name in self._by_name:
+            raise ValueError(f"Rule already registered: {rule.name}")
+        self._by_name[rule.name] = rule
         self._rules.append(rule)
+        self._version += 1
 
     def get_rules(self) -> List[Rule]:  # pragma: no cover - trivial
         return list(self._rules)
@@ -19,30 +30,26 @@ class RuleRegistry:
 
     # Extended API for tests / management
     def get_rule(self, name: str) -> Rule:
-        for r in self._rules:
-            if r.name == name:
-                return r
-        raise KeyError(name)
+        return self._by_name[name]
 
     def unregister(self, name: str) -> bool:
-        for i, r in enumerate(self._rules):
-            if r.name == name:
-                self._rules.pop(i)
-                return True
-        return False
+        rule = self._by_name.pop(name, None)
+        if rule is None:
+            return False
+        self._rules.remove(rule)
+        self._version += 1
+        return True
 
     def enable_rule(self, name: str) -> bool:
-        try:
-            r = self.get_rule(name)
-            r.enabled = True
-            return True
-        except KeyError:
-            return False
+        return self._set_enabled(name, True)
 
     def disable_rule(self, name: str) -> bool:
-        try:
-            r = self.get_rule(name)
-            r.enabled = False
-            return True
-        except KeyError:
+        return self._set_enabled(name, False)
+
+    def _set_enabled(self, name: str, enabled: bool) -> bool:
+        rule = self._by_name.get(name)
+        if rule is None:
             return False
+        rule.enabled = enabled
+        self._version += 1
+        return True
@@ -1,10 +1,78 @@
 from __future__ import annotations
 import html
-import json
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, TextIO, Tuple
 from .base import ReportGenerator, register
 from ..persistence.db import WorkloadDB
-from .common import wrap_html_document, format_cell_with_condition
+from .common import (
+    make_cell_formatter, escape_cell, write_html_prologue, write_html_epilogue, HTML_WRITE_BUFFER
+)
 from ..persistence.workload_queries import WorkloadQueries
+from ..util.jsonfmt import pretty_json
+
+# Constant text so sqlite3's per-connection statement cache reuses the plan;
+# served in order by the node_capacity_role index
+_NODES_SQL = (
+    "SELECT node_name, node_role, instance_type, zone, cpu_capacity, memory_capacity "
+    "FROM node_capacity WHERE cluster=? ORDER BY node_role, node_name"
+)
+
+_SUMMARY_CSS = "pre { background: #f7f7f7; padding: 8px; overflow: auto; }"
+
+_SUMMARY_LEGEND_HTML = (
+    '<details class="legend">'
+    '<summary>Legend</summary>'
+    '<div class="legend-body">'
+    '<div class="legend-section">'
+    '<h4>Summary Items</h4>'
+    '<ul>'
+    '<li><strong>Total workloads</strong>: Count of all rows in snapshot</li>'
+    '<li><strong>Active workloads</strong>: Same as total (snapshot only, non-deleted)</li>'
+    '</ul>'
+    '</div>'
+    '<div class="legend-section">'
+    '<h4>By Kind Table Columns</h4>'
+    '<ul>'
+    '<li><strong>Kind</strong>: Workload controller kind</li>'
+    '<li><strong>Count</strong>: Number of workloads of that kind</li>'
+    '</ul>'
+    '</div>'
+    '<div class="legend-section">'
+    '<h4>Nodes Table Columns</h4>'
+    '<ul>'
+    '<li><strong>Name</strong>: Node name</li>'
+    '<li><strong>Role</strong>: master / infra / worker (or other)</li>'
+    '<li><strong>Instance</strong>: Instance type</li>'
+    '<li><strong>Zone</strong>: Availability zone / failure domain</li>'
+    '<li><strong>CPU</strong>: Node CPU capacity (raw value)</li>'
+    '<li><strong>Memory</strong>: Node Memory capacity (raw value)</li>'
+    '</ul>'
+    '</div>'
+    '<div class="legend-section">'
+    '<h4>Workloads (Namespace Section)</h4>'
+    '<ul>'
+    '<li><strong>details blocks</strong>: Expand to view full manifest JSON per workload</li>'
+    '</ul>'
+    '</div>'
+    '</div>'
+    '</details>'
+)
+
+_NODES_HEADERS = ["Name", "Role", "Instance", "Zone", "CPU", "Memory"]
+_NODES_TABLE_HEADER = (
+    "<table border=1 cellpadding=4 cellspacing=0>\n"
+    "<tr>" + "".join(f"<th>{header}</th>" for header in _NODES_HEADERS) + "</tr>"
+)
+
+
+def _namespace_label(rec: Dict[str, Any]) -> str:
+    return rec['namespace'] or '(cluster-scoped)'
+
+
+def _pretty_json(manifest) -> str:
+    """Indented, key-sorted JSON for a manifest."""
+    return pretty_json(manifest, sort_keys=True)
 
 
 @register
@@ -14,116 +82,75 @@ class SummaryReport(ReportGenerator):
     filename_prefix = 'summary-'
 
     def generate(self, db: WorkloadDB, cluster: str, out_path: str) -> None:  # pragma: no cover
-        cur = db._conn.cursor()
         summary = db.summary(cluster)
         wq = WorkloadQueries(db)
-        workloads = wq.list_all(cluster)
-        nodes = cur.execute(
-            """SELECT node_name, node_role, instance_type, zone, cpu_capacity, memory_capacity
-                FROM node_capacity WHERE cluster=? ORDER BY node_role, node_name""",
-            (cluster,)
-        ).fetchall()
+        workloads = wq.iter_by_namespace(cluster)
+        nodes = db._conn.execute(_NODES_SQL, (cluster,)).fetchall()
         title = f"Cluster report: {html.escape(cluster)}"
-        parts = [f"<h1>{title}</h1>"]
-        legend_html = (
-            '<details class="legend">'
-            '<summary>Legend</summary>'
-            '<div class="legend-body">'
-            '<div class="legend-section">'
-            '<h4>Summary Items</h4>'
-            '<ul>'
-            '<li><strong>Total workloads</strong>: Count of all rows in snapshot</li>'
-            '<li><strong>Active workloads</strong>: Same as total (snapshot only, non-deleted)</li>'
-            '</ul>'
-            '</div>'
-            '<div class="legend-section">'
-            '<h4>By Kind Table Columns</h4>'
-            '<ul>'
-            '<li><strong>Kind</strong>: Workload controller kind</li>'
-            '<li><strong>Count</strong>: Number of workloads of that kind</li>'
-            '</ul>'
-            '</div>'
-            '<div class="legend-section">'
-            '<h4>Nodes Table Columns</h4>'
-            '<ul>'
-            '<li><strong>Name</strong>: Node name</li>'
-            '<li><strong>Role</strong>: master / infra / worker (or other)</li>'
-            '<li><strong>Instance</strong>: Instance type</li>'
-            '<li><strong>Zone</strong>: Availability zone / failure domain</li>'
-            '<li><strong>CPU</strong>: Node CPU capacity (raw value)</li>'
-            '<li><strong>Memory</strong>: Node Memory capacity (raw value)</li>'
-            '</ul>'
-            '</div>'
-            '<div class="legend-section">'
-            '<h4>Workloads (Namespace Section)</h4>'
-            '<ul>'
-            '<li><strong>details blocks</strong>: Expand to view full manifest JSON per workload</li>'
-            '</ul>'
-            '</div>'
-            '</div>'
-            '</details>'
-        )
-        parts.append(legend_html)
-        parts.append("<h2>Summary</h2>")
-        parts.append("<ul>")
-        parts.append(f"<li>Total workloads: {summary.get('total', 0)}</li>")
-        parts.append(f"<li>Active workloads: {summary.get('active', 0)}</li>")
-        parts.append("</ul>")
-        parts.append("<h2>By kind</h2>")
-        parts.append("<table border=1 cellpadding=4 cellspacing=0>")
-        parts.append("<tr><th>Kind</th><th>Count</th></tr>")
+        with open(out_path, 'w', encoding='utf-8', buffering=HTML_WRITE_BUFFER) as f:
+            self._write_html(f, title, summary, nodes, workloads)
+
+    def _write_html(self, fp: TextIO, title: str, summary: Dict[str, Any], nodes: List[Tuple],
+                    workloads: Iterable[Dict[str, Any]]) -> None:
+        """Stream the report body to ``fp``, one block at a time."""
+        def emit(line: str) -> None:
+            fp.write(line)
+            fp.write('\n')
+
+        write_html_prologue(fp, title, _SUMMARY_CSS)
+        emit(f"<h1>{title}</h1>")
+        emit(_SUMMARY_LEGEND_HTML)
+        emit("<h2>Summary</h2>")
+        emit("<ul>")
+        emit(f"<li>Total workloads: {summary.get('total', 0)}</li>")
+        emit(f"<li>Active workloads: {summary.get('active', 0)}</li>")
+        emit("</ul>")
+        emit("<h2>By kind</h2>")
+        emit("<table border=1 cellpadding=4 cellspacing=0>")
+        emit("<tr><th>Kind</th><th>Count</th></tr>")
+        fmt_count = make_cell_formatter('summary', ['Count'])['Count']
         for k, c in (summary.get('by_kind') or {}).items():
-            kind_cells = [
-                f"<td>{html.escape(k)}</td>",
-                format_cell_with_condition(str(c), "Count", None, 'summary')
-            ]
-            parts.append("<tr>" + "".join(kind_cells) + "</tr>")
-        parts.append("</table>")
-        parts.append("<h2>Nodes</h2>")
+            emit(f"<tr><td>{escape_cell(k)}</td>{fmt_count(str(c), None)}</tr>")
+        emit("</table>")
+        emit("<h2>Nodes</h2>")
         if nodes:
-            parts.append("<table border=1 cellpadding=4 cellspacing=0>")
-            parts.append("<tr><th>Name</th><th>Role</th><th>Instance</th><th>Zone</th><th>CPU</th><th>Memory</th></tr>")
-            headers = ["Name", "Role", "Instance", "Zone", "CPU", "Memory"]
+            emit(_NODES_TABLE_HEADER)
+            headers = _NODES_HEADERS
+            # Resolve rule applicability once per column, not per cell
+            formatters = list(make_cell_formatter('summary', headers).values())
             for n in nodes:
-                node_cells = []
-                for i, x in enumerate(n):
-                    if i < len(headers):
-                        row_data = {headers[j]: n[j] for j in range(min(len(headers), len(n)))}
-                        node_cells.append(format_cell_with_condition(str(x) if x is not None else '', headers[i], row_data, 'summary'))
-                    else:
-                        node_cells.append(f"<td>{html.escape(str(x) if x is not None else '')}</td>")
-                parts.append("<tr>" + "".join(node_cells) + "</tr>")
-            parts.append("</table>")
-        else:
-            parts.append('<p>No node data available.</p>')
-        parts.append("<h2>Workloads (by namespace)</h2>")
-        if workloads:
-            ns_map = {}
-            for rec in workloads:
-                kind = rec['kind']
-                namespace = rec['namespace']
-                name = rec['name']
-                manifest = rec['manifest']
-                ns_key = namespace or '(cluster-scoped)'
-                ns_entry = ns_map.setdefault(ns_key, {})
-                ns_entry.setdefault(kind, []).append((name, manifest, namespace))
-            for ns in sorted(ns_map.keys()):
-                parts.append(f'<h3>Namespace: {html.escape(ns)}</h3>')
-                parts.append('<div>')
-                for kind in sorted(ns_map[ns].keys()):
-                    parts.append(f'<h4>{html.escape(kind)}</h4>')
-                    for name, manifest, namespace in sorted(ns_map[ns][kind], key=lambda x: x[0]):
-                        title_item = f"{kind} {namespace}/{name}" if namespace else f"{kind} {name}"
-                        safe_title = html.escape(title_item)
-                        try:
-                            pretty = json.dumps(manifest, indent=2, sort_keys=True)
-                        except Exception:
-                            pretty = html.escape(str(manifest))
-                        parts.append(f'<details><summary>{safe_title}</summary><pre>{html.escape(pretty)}</pre></details>')
-                parts.append('</div>')
+                row_data = dict(zip(headers, n))
+                emit("<tr>" + "".join([
+                    fmt(str(x) if x is not None else '', row_data) for fmt, x in zip(formatters, n)
+                ]) + "</tr>")
+            emit("</table>")
         else:
-            parts.append('<p>No workloads found.</p>')
-        additional_styles = ("pre { background: #f7f7f7; padding: 8px; overflow: auto; }")
-        html_doc = wrap_html_document(title, parts, additional_styles)
-        with open(out_path, 'w', encoding='utf-8') as f:
-            f.write(html_doc)
+            emit('<p>No node data available.</p>')
+        emit("<h2>Workloads (by namespace)</h2>")
+        has_workloads = False
+        # Rows arrive ordered by namespace, kind, name: group consecutive runs
+        for ns, ns_rows in groupby(workloads, key=_namespace_label):
+            has_workloads = True
+            emit(f'<h3>Namespace: {escape_cell(ns)}</h3>')
+            emit('<div>')
+            for kind, items in groupby(ns_rows, key=itemgetter('kind')):
+                safe_kind = escape_cell(kind)
+                emit(f'<h4>{safe_kind}</h4>')
+                for rec in items:
+                    name = rec['name']
+                    namespace = rec['namespace']
+                    manifest = rec['manifest']
+                    # Kind and namespace repeat across workloads; only the name is unique
+                    if namespace:
+                        safe_title = f"{safe_kind} {escape_cell(namespace)}/{html.escape(name)}"
+                    else:
+                        safe_title = f"{safe_kind} {html.escape(name)}"
+                    try:
+                        pretty = _pretty_json(manifest)
+                    except Exception:
+                        pretty = html.escape(str(manifest))
+                    emit(f'<details><summary>{safe_title}</summary><pre>{html.escape(pretty)}</pre></details>')
+            emit('</div>')
+        if not has_workloads:
+            emit('<p>No workloads found.</p>')
+        write_html_epilogue(fp)
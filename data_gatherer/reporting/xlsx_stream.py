@@ -0,0 +1,203 @@
+"""Minimal streaming .xlsx writer with no third-party dependencies.
+
+Rows are serialized straight to the worksheet XML inside the zip archive, so
+no per-cell Python objects are created and memory stays flat however many
+rows are written. Only what the report writers need is supported: a single
+sheet, fixed column widths, merged ranges, inline strings, numbers and a small
+table of cell styles. There are no formulas, comments or shared strings.
+"""
+from __future__ import annotations
+import re
+import zipfile
+from typing import Any, Dict, IO, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+)
+
+# Characters XML 1.0 does not allow, even escaped
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def column_letter(index: int) -> str:
+    """Spreadsheet column letter for a 1-based column index."""
+    letters = ''
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+class XlsxSheetWriter:
+    """Write a one-sheet workbook row by row.
+
+    Styles are registered with add_style() and referenced by the returned
+    index; index 0 is the default unstyled cell. Column widths must be set
+    before the first row is written. Call close() to finish the file.
+    """
+
+    def __init__(self, path: str, sheet_name: str):
+        self._zip = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        self._sheet_name = sheet_name
+        self._sheet: Optional[IO[bytes]] = None
+        self._widths: List[Tuple[int, float]] = []
+        self._merged: List[str] = []
+        self._row = 0
+        self._letters: List[str] = []
+        self._fonts: Dict[Tuple, int] = {(False, None, None): 0}
+        self._fills: Dict[Optional[str], int] = {None: 0, 'gray125': 1}
+        self._xfs: Dict[Tuple, int] = {(0, 0, False, None, None): 0}
+
+    def add_style(self, bold: bool = False, font_color: Optional[str] = None, font_size: Optional[int] = None,
+                  fill: Optional[str] = None, border: bool = False, align: Optional[str] = None,
+                  valign: Optional[str] = None) -> int:
+        """Register a cell style and return its index; colors are RRGGBB hex."""
+        font_id = self._fonts.setdefault((bold, font_color, font_size), len(self._fonts))
+        fill_id = self._fills.setdefault(fill, len(self._fills))
+        return self._xfs.setdefault((font_id, fill_id, border, align, valign), len(self._xfs))
+
+    def set_column_width(self, index: int, width: float) -> None:
+        if self._sheet is not None:
+            raise RuntimeError("column widths must be set before the first row is written")
+        self._widths.append((index, width))
+
+    def merge(self, cell_range: str) -> None:
+        self._merged.append(cell_range)
+
+    def write_row(self, values: Sequence[Any], styles: Any = 0) -> None:
+        """Append a row; ``styles`` is one style index or one per value.
+
+        None and '' are written as empty (but styled) cells.
+        """
+        if self._sheet is None:
+            self._start_sheet()
+        self._row += 1
+        row = str(self._row)
+        if len(values) > len(self._letters):
+            self._letters = [column_letter(i) for i in range(1, len(values) + 1)]
+        if isinstance(styles, int):
+            styles = [styles] * len(values)
+        parts = [f'<row r="{row}">']
+        for letter, value, style in zip(self._letters, values, styles):
+            attrs = f' r="{letter}{row}" s="{style}"' if style else f' r="{letter}{row}"'
+            if value is None or value == '':
+                if style:
+                    parts.append(f'<c{attrs}/>')
+            elif isinstance(value, str):
+                text = escape(_ILLEGAL_XML_CHARS.sub('', value))
+                parts.append(f'<c{attrs} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+            elif isinstance(value, bool):
+                parts.append(f'<c{attrs} t="b"><v>{int(value)}</v></c>')
+            else:
+                parts.append(f'<c{attrs}><v>{value}</v></c>')
+        parts.append('</row>')
+        self._sheet.write(''.join(parts).encode('utf-8'))
+
+    def skip_row(self) -> None:
+        """Leave the next row empty."""
+        self._row += 1
+
+    def close(self) -> None:
+        if self._sheet is None:
+            self._start_sheet()
+        tail = '</sheetData>'
+        if self._merged:
+            tail += f'<mergeCells count="{len(self._merged)}">'
+            tail += ''.join(f'<mergeCell ref="{ref}"/>' for ref in self._merged)
+            tail += '</mergeCells>'
+        tail += '</worksheet>'
+        self._sheet.write(tail.encode('utf-8'))
+        self._sheet.close()
+        self._zip.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        self._zip.writestr('_rels/.rels', _ROOT_RELS)
+        self._zip.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS)
+        self._zip.writestr('xl/workbook.xml', self._workbook_xml())
+        self._zip.writestr('xl/styles.xml', self._styles_xml())
+        self._zip.close()
+
+    def __enter__(self) -> 'XlsxSheetWriter':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._zip.fp is not None:
+            self.close()
+
+    def _start_sheet(self) -> None:
+        self._sheet = self._zip.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True)
+        head = _SHEET_START
+        if self._widths:
+            head += '<cols>' + ''.join(
+                f'<col min="{i}" max="{i}" width="{w}" customWidth="1"/>' for i, w in sorted(self._widths)
+            ) + '</cols>'
+        head += '<sheetData>'
+        self._sheet.write(head.encode('utf-8'))
+
+    def _workbook_xml(self) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name={quoteattr(self._sheet_name)} sheetId="1" r:id="rId1"/></sheets>'
+            '</workbook>'
+        )
+
+    def _styles_xml(self) -> str:
+        fonts = []
+        for bold, color, size in self._fonts:
+            font = '<font>' + ('<b/>' if bold else '')
+            font += f'<sz val="{size or 11}"/>'
+            if color:
+                font += f'<color rgb="FF{color}"/>'
+            fonts.append(font + '<name val="Calibri"/></font>')
+        fills = ['<fill><patternFill patternType="none"/></fill>', '<fill><patternFill patternType="gray125"/></fill>']
+        for color in list(self._fills)[2:]:
+            fills.append(f'<fill><patternFill patternType="solid"><fgColor rgb="FF{color}"/>'
+                         f'<bgColor rgb="FF{color}"/></patternFill></fill>')
+        thin = '<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+        xfs = []
+        for font_id, fill_id, border, align, valign in self._xfs:
+            xf = (f'<xf numFmtId="0" fontId="{font_id}" fillId="{fill_id}" borderId="{int(border)}" xfId="0"'
+                  + (' applyFont="1"' if font_id else '') + (' applyFill="1"' if fill_id else '')
+                  + (' applyBorder="1"' if border else ''))
+            if align or valign:
+                attrs = (f' horizontal="{align}"' if align else '') + (f' vertical="{valign}"' if valign else '')
+                xf += f' applyAlignment="1"><alignment{attrs}/></xf>'
+            else:
+                xf += '/>'
+            xfs.append(xf)
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f'<fonts count="{len(fonts)}">{"".join(fonts)}</fonts>'
+            f'<fills count="{len(fills)}">{"".join(fills)}</fills>'
+            f'<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>{thin}</borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        )
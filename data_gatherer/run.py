@@ -1,25 +1,46 @@
 from __future__ import annotations
 import click
 import os
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from .config import load_config
 from .persistence.db import WorkloadDB
 from .cluster.context import get_cluster_cfg, get_cluster_paths, open_cluster_db
 from .persistence.queries import NodeQueries
 from .export.manifest import ManifestExporter
-from .sync.engine import SyncEngine
-from .kube.client import load_kubeconfig, configure_from_credentials, resolve_kinds, list_resources, list_namespaced_resources
+from .sync.engine import SyncEngine, make_serialize_pool
+from .kube.client import load_kubeconfig, configure_from_credentials, enable_tcp_keepalive, resolve_kinds, list_resources, list_namespaced_resources
 from .util import logging as log
+from .util.jsonfmt import pretty_json, compact_json
 from kubernetes import client as k8s_client
 from typing import Any
 
 DEFAULT_DATA_DIR = 'clusters'
 DB_FILENAME = 'data.db'
+# Clusters reported concurrently by a multi-cluster `report` run
+REPORT_PARALLELISM = 4
+
+@lru_cache(maxsize=4)
+def _load_config_snapshot(path: str, mtime_ns: int, size: int):
+    return load_config(path)
+
+def _load_cli_config(path: str):
+    """Load the config file, reusing the parsed result while the file is unchanged.
+
+    Keyed on the absolute path plus modification time and size, so commands
+    run repeatedly in one process (tests, library use) parse the YAML once.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return load_config(path)
+    return _load_config_snapshot(os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
 def _get_file_extension(format_name: str, generator: Any) -> str:
     """Get appropriate file extension based on format."""
-    if format_name == 'excel':
+    if format_name in ('excel', 'excel-fast'):
         return '.xlsx'
     elif format_name == 'html':
         return '.html'
@@ -27,6 +48,19 @@ def _get_file_extension(format_name: str, generator: Any) -> str:
         # Fallback to generator's default extension
         return getattr(generator, 'file_extension', '.html')
 
+# Shared by the commands that print one JSON result per cluster
+output_format_option = click.option(
+    '--output-format', type=click.Choice(['json', 'ndjson']), default='json', show_default=True,
+    help='json: one indented document once every cluster is done; '
+         'ndjson: one line per cluster, printed as soon as it is done')
+
+def _emit_cluster_result(output_format: str, results: dict, cluster: str, result: dict) -> None:
+    """Print ``result`` as an NDJSON line now, or keep it for the final JSON document."""
+    if output_format == 'ndjson':
+        click.echo(compact_json({'cluster': cluster, **result}))
+    else:
+        results[cluster] = result
+
 @click.group()
 @click.option('--config', default='config/config.yaml', help='Config file path')
 @click.pass_context
@@ -42,7 +76,7 @@ def cli(ctx, config):
 def init(ctx, clusters, all_clusters):
     """Initialize storage for one or more clusters."""
     config = ctx.obj['config']
-    cfg = load_config(config)
+    cfg = _load_cli_config(config)
     log.configure_logging(cfg.logging.level, cfg.logging.format)
     if not clusters and not all_clusters:
         raise click.ClickException('Must specify at least one --cluster or use --all-clusters')
@@ -59,16 +93,17 @@ def init(ctx, clusters, all_clusters):
         results.append({'cluster': cluster, 'db': paths.db_path})
         click.echo(f'Initialized storage for {cluster} at {paths.db_path}')
     if len(results) > 1:
-        click.echo(json.dumps(results, indent=2))
+        click.echo(pretty_json(results))
 
 @cli.command()
 @click.option('--cluster', 'clusters', multiple=True, help='Cluster name(s) to check status for')
 @click.option('--all-clusters', is_flag=True, help='Show status for all configured clusters')
+@output_format_option
 @click.pass_context
-def status(ctx, clusters, all_clusters):
+def status(ctx, clusters, all_clusters, output_format):
     """Show summary status for one or more clusters."""
     config = ctx.obj['config']
-    cfg = load_config(config)
+    cfg = _load_cli_config(config)
     log.configure_logging(cfg.logging.level, cfg.logging.format)
     if not clusters and not all_clusters:
         raise click.ClickException('Must specify at least one --cluster or use --all-clusters')
@@ -81,11 +116,15 @@ def status(ctx, clusters, all_clusters):
             raise click.ClickException(str(e))
         paths = get_cluster_paths(cfg, cluster)
         if not os.path.exists(paths.db_path):
-            out[cluster] = {'error': 'not initialized'}
+            _emit_cluster_result(output_format, out, cluster, {'error': 'not initialized'})
             continue
-        db = WorkloadDB(paths.db_path)
-        out[cluster] = db.summary(cluster)
-    click.echo(json.dumps(out if len(out) > 1 else next(iter(out.values())), indent=2))
+        db = WorkloadDB(paths.db_path, read_only=True)
+        try:
+            _emit_cluster_result(output_format, out, cluster, db.summary(cluster))
+        finally:
+            db._conn.close()
+    if out:
+        click.echo(pretty_json(out if len(out) > 1 else next(iter(out.values()))))
 
 def _fetch_kind_items(api_client, kind, api_version, plural, target, namespaced, namespace: str | None = None):
     if namespace:
@@ -95,15 +134,16 @@ def _fetch_kind_items(api_client, kind, api_version, plural, target, namespaced,
     items = []
     try:
         if namespace:
-            for item in list_namespaced_resources(api_client, api_version, plural, namespace):
-                items.append(item)
-        else:
+            items.extend(list_namespaced_resources(api_client, api_version, plural, namespace))
+        elif namespaced:
+            # Runs for every listed item: keep the lookups in locals
+            is_excluded = target.is_namespace_excluded
+            append = items.append
             for item in list_resources(api_client, api_version, plural):
-                if namespaced:
-                    ns = item.get('metadata', {}).get('namespace', 'default')
-                    if target.is_namespace_excluded(ns):
-                        continue
-                items.append(item)
+                if not is_excluded((item.get('metadata') or {}).get('namespace', 'default')):
+                    append(item)
+        else:
+            items.extend(list_resources(api_client, api_version, plural))
         return kind, items, None
     except Exception as e:
         log.error('failed to fetch kind', kind=kind, namespace=namespace, error=str(e))
@@ -113,16 +153,21 @@ def _fetch_kind_items(api_client, kind, api_version, plural, target, namespaced,
 @click.option('--cluster', 'clusters', multiple=True, help='Cluster name(s) to sync')
 @click.option('--all-clusters', is_flag=True, help='Sync all configured clusters')
 @click.option('--kind', multiple=True, help='Limit to specific kinds')
+@output_format_option
 @click.pass_context
-def sync(ctx, clusters, all_clusters, kind):
+def sync(ctx, clusters, all_clusters, kind, output_format):
     """Synchronize workload manifests for one or more clusters."""
     config = ctx.obj['config']
-    cfg = load_config(config)
+    cfg = _load_cli_config(config)
     log.configure_logging(cfg.logging.level, cfg.logging.format)
     if not clusters and not all_clusters:
         raise click.ClickException('Must specify at least one --cluster or use --all-clusters')
     cluster_list = [c.name for c in cfg.clusters] if all_clusters else list(clusters)
     aggregate = {}
+    # One pool for the whole run, shut down when the command finishes
+    serialize_pool = make_serialize_pool()
+    if serialize_pool is not None:
+        ctx.call_on_close(serialize_pool.shutdown)
     for cluster in cluster_list:
         try:
             target = get_cluster_cfg(cfg, cluster)
@@ -132,19 +177,25 @@ def sync(ctx, clusters, all_clusters, kind):
         if not os.path.exists(paths.db_path):
             raise click.ClickException(f'Cluster {cluster} not initialized. Run init first.')
         db = WorkloadDB(paths.db_path)
-        engine = SyncEngine(db, cluster)
+        engine = SyncEngine(db, cluster, serialize_pool=serialize_pool)
         include = list(kind) if kind else target.include_kinds
         kind_map = resolve_kinds(include)
         if not kind_map:
             raise click.ClickException(f'No resolvable kinds requested for cluster {cluster}.')
         if target.kubeconfig:
             load_kubeconfig(target.kubeconfig)
-            api_client = k8s_client.ApiClient()
+            config_obj = k8s_client.Configuration.get_default_copy()
         elif target.credentials:
             config_obj = configure_from_credentials(target.credentials)
-            api_client = k8s_client.ApiClient(configuration=config_obj)
         else:
             raise click.ClickException(f'Cluster {cluster} has no kubeconfig or credentials configured')
+        # Keep one pooled connection per fetch worker so keep-alive connections
+        # are reused across kinds instead of being discarded and re-handshaked
+        config_obj.connection_pool_maxsize = max(config_obj.connection_pool_maxsize or 0, target.parallelism)
+        api_client = k8s_client.ApiClient(configuration=config_obj)
+        # TCP keepalive stops pooled connections that sit idle between kinds
+        # from being dropped silently by load balancers
+        enable_tcp_keepalive(api_client)
         all_alive = []
         successful_kinds = []
         manifests_dir = paths.manifests_dir
@@ -169,82 +220,115 @@ def sync(ctx, clusters, all_clusters, kind):
             max_workers = min(target.parallelism, len(tasks))
             log.info('starting parallel fetch (namespace-scoped)', cluster=cluster, max_workers=max_workers, total_tasks=len(tasks))
         else:
+            # One cluster-wide list per kind
+            tasks = [(k, None) for k in kind_map.keys()]
             max_workers = min(target.parallelism, len(kind_map))
             log.info('starting parallel fetch', cluster=cluster, max_workers=max_workers, total_kinds=len(kind_map))
-        from .persistence.db import WorkloadDB as _DBFactory
-        def _fetch_and_sync_cluster(single_kind: str):
+
+        def _fetch(single_kind: str, ns: str | None):
             api_version, plural, namespaced = kind_map[single_kind]
-            _, items, error = _fetch_kind_items(api_client, single_kind, api_version, plural, target, namespaced)
-            if error:
-                return {'kind': single_kind, 'error': error}
-            thread_db = _DBFactory(paths.db_path)
-            thread_engine = SyncEngine(thread_db, cluster)
-            alive_keys = thread_engine.sync_kind(api_version, single_kind, items)
-            thread_db._conn.close()
-            return {'kind': single_kind, 'items': items, 'alive': alive_keys}
+            _, items, error = _fetch_kind_items(api_client, single_kind, api_version, plural, target, namespaced, namespace=ns)
+            return items, error
 
-        def _fetch_and_sync_namespaced(single_kind: str, ns: str):
-            api_version, plural, _ = kind_map[single_kind]
-            _, items, error = _fetch_kind_items(api_client, single_kind, api_version, plural, target, True, namespace=ns)
-            if error:
-                return {'kind': single_kind, 'namespace': ns, 'error': error}
-            thread_db = _DBFactory(paths.db_path)
-            thread_engine = SyncEngine(thread_db, cluster)
-            alive_keys = thread_engine.sync_kind(api_version, single_kind, items)
-            thread_db._conn.close()
-            return {'kind': single_kind, 'namespace': ns, 'items': items, 'alive': alive_keys}
+        # Fetch workers never touch the database: fetched kinds are queued to
+        # one writer thread that owns the connection. None on the queue tells
+        # it to stop. The whole sync, including the deletions below, is one
+        # transaction; each kind is written under a savepoint so a failed
+        # write only drops that kind.
+        write_queue = queue.Queue(maxsize=2 * max_workers)
+        write_failures = {}
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            if namespace_mode:
-                future_map = {executor.submit(_fetch_and_sync_namespaced, k, ns): (k, ns) for k, ns in tasks}
-            else:
-                future_map = {executor.submit(_fetch_and_sync_cluster, k): (k, None) for k in kind_map.keys()}
-            for fut in as_completed(future_map):
-                result = fut.result()
-                kind_name = result['kind']
-                ns = result.get('namespace')
-                key_for_errors = f"{kind_name}/{ns}" if ns else kind_name
-                if 'error' in result:
-                    errors[key_for_errors] = result['error']
-                    if not namespace_mode:
-                        skipped.append(kind_name)
+        def _write_kinds():
+            while True:
+                task = write_queue.get()
+                if task is None:
+                    return
+                api_version, kind_name, items, error_key = task
+                try:
+                    with db.savepoint('sync_kind'):
+                        alive_keys = engine.sync_kind(api_version, kind_name, items)
+                except Exception as e:
+                    log.error('failed to write fetched kind', cluster=cluster, kind=kind_name, error=str(e))
+                    write_failures[error_key] = (kind_name, str(e))
                     continue
-                items = result['items']
-                alive = result['alive']
-                fetched_per_kind[kind_name] = fetched_per_kind.get(kind_name, 0) + len(items)
-                all_alive.extend(alive)
-                if kind_name not in successful_kinds:
-                    successful_kinds.append(kind_name)
-                if not items and not namespace_mode:
-                    existing_dir = os.path.join(manifests_dir, kind_name)
-                    if not (os.path.exists(existing_dir) and any(os.scandir(existing_dir))):
-                        skipped.append(kind_name)
-                if items:
-                    # Get the actual namespaced flag for this kind
-                    _, _, is_namespaced = kind_map[kind_name]
-                    exporter.export_kind(kind_name, items, is_namespaced)
-        removed = engine.finalize(all_alive, kinds_scope=successful_kinds)
-        configured_kinds = set(target.include_kinds)
-        current_summary = db.summary(cluster)
-        existing_kinds = set(current_summary.get('by_kind', {}).keys())
-        obsolete_kinds = existing_kinds - configured_kinds
-        if obsolete_kinds:
-            obsolete_removed = engine.cleanup_kinds(cluster, list(obsolete_kinds))
-            removed += obsolete_removed
+                all_alive.extend(alive_keys)
+
+        with db.batch():
+            writer = threading.Thread(target=_write_kinds, name=f'sync-writer-{cluster}')
+            writer.start()
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    future_map = {executor.submit(_fetch, k, ns): (k, ns) for k, ns in tasks}
+                    for fut in as_completed(future_map):
+                        kind_name, ns = future_map[fut]
+                        items, error = fut.result()
+                        key_for_errors = f"{kind_name}/{ns}" if ns else kind_name
+                        if error:
+                            errors[key_for_errors] = error
+                            if not namespace_mode:
+                                skipped.append(kind_name)
+                            continue
+                        # Get the actual api version and namespaced flag for this kind
+                        api_version, _, is_namespaced = kind_map[kind_name]
+                        write_queue.put((api_version, kind_name, items, key_for_errors))
+                        fetched_per_kind[kind_name] = fetched_per_kind.get(kind_name, 0) + len(items)
+                        if kind_name not in successful_kinds:
+                            successful_kinds.append(kind_name)
+                        if not items and not namespace_mode:
+                            existing_dir = os.path.join(manifests_dir, kind_name)
+                            if not (os.path.exists(existing_dir) and any(os.scandir(existing_dir))):
+                                skipped.append(kind_name)
+                        if items:
+                            exporter.export_kind(kind_name, items, is_namespaced)
+            finally:
+                write_queue.put(None)
+                writer.join()
+            # A kind whose rows could not be written must not have its
+            # existing rows treated as deleted
+            for key_for_errors, (kind_name, message) in write_failures.items():
+                errors[key_for_errors] = message
+                if kind_name in successful_kinds:
+                    successful_kinds.remove(kind_name)
+            removed = engine.finalize(all_alive, kinds_scope=successful_kinds)
+            configured_kinds = set(target.include_kinds)
+            current_summary = db.summary(cluster)
+            existing_kinds = set(current_summary.get('by_kind', {}).keys())
+            obsolete_kinds = existing_kinds - configured_kinds
+            if obsolete_kinds:
+                obsolete_removed = engine.cleanup_kinds(cluster, list(obsolete_kinds))
+                removed += obsolete_removed
         summary = db.summary(cluster)
+        db._conn.close()
         summary['removed'] = removed
         summary['skipped_kinds'] = skipped
         summary['fetched_per_kind'] = fetched_per_kind
         if errors:
             summary['errors'] = errors
-        aggregate[cluster] = summary
-    click.echo(json.dumps(aggregate if len(aggregate) > 1 else next(iter(aggregate.values())), indent=2))
+        _emit_cluster_result(output_format, aggregate, cluster, summary)
+    if aggregate:
+        click.echo(pretty_json(aggregate if len(aggregate) > 1 else next(iter(aggregate.values()))))
+
+def _run_generator(generator, db: WorkloadDB, cluster: str, out_path: str, format_to_use: str) -> None:
+    # Only multi-format generators take the format argument
+    if hasattr(generator, 'supported_formats') and len(generator.supported_formats) > 1:
+        generator.generate(db, cluster, out_path, format_to_use)
+    else:
+        generator.generate(db, cluster, out_path)
+
+def _generate_report_file(db_path: str, cluster: str, report_type: str, out_path: str, format_to_use: str) -> None:
+    """Generate one report from its own connection; the `report --all` process pool entry point."""
+    from .reporting.base import get_generator
+    db = WorkloadDB(db_path, read_only=True)
+    try:
+        _run_generator(get_generator(report_type), db, cluster, out_path, format_to_use)
+    finally:
+        db._conn.close()
 
 @cli.command()
 @click.option('--cluster', 'clusters', multiple=True, help='Cluster name(s) to report on')
 @click.option('--all-clusters', is_flag=True, help='Generate reports for all configured clusters')
 @click.option('--type', 'report_type', default='summary', help='Report type (default: summary). Use --list-types to view all.')
-@click.option('--format', 'output_format', default='html', help='Output format (html, excel). Default: html')
+@click.option('--format', 'output_format', default='html', help='Output format (html, excel, excel-fast). Default: html')
 @click.option('--out', required=False, help='Explicit output file path or directory (single-cluster only). If a directory is given, a default filename will be generated inside it.')
 @click.option('--all', is_flag=True, help='Generate all available report types')
 @click.option('--list-types', is_flag=True, help='List available report types and exit')
@@ -253,10 +337,6 @@ def report(ctx, clusters, all_clusters, report_type, output_format, out, all, li
     """Generate reports for one or more clusters."""
     from datetime import datetime
     from .reporting.base import get_report_types, get_generator
-    from .reporting import summary_report  # noqa: F401
-    from .reporting import containers_config_report  # noqa: F401
-    from .reporting import nodes_report  # noqa: F401
-    from .reporting import cluster_capacity_report  # noqa: F401 registers 'cluster-capacity'
     if list_types:
         click.echo('Available report types:')
         for t in get_report_types():
@@ -269,7 +349,7 @@ def report(ctx, clusters, all_clusters, report_type, output_format, out, all, li
     if all and report_type != 'summary':
         raise click.ClickException('Cannot specify --type with --all flag.')
     config = ctx.obj['config']
-    cfg = load_config(config)
+    cfg = _load_cli_config(config)
     log.configure_logging(cfg.logging.level, cfg.logging.format)
     if not clusters and not all_clusters and not list_types:
         raise click.ClickException('Specify at least one --cluster or --all-clusters')
@@ -284,7 +364,6 @@ def report(ctx, clusters, all_clusters, report_type, output_format, out, all, li
         paths = get_cluster_paths(cfg, cluster)
         if not os.path.exists(paths.db_path):
             raise click.ClickException('Cluster not initialized. Run init first.')
-        db = WorkloadDB(paths.db_path)
         if all:
             # Use --out as reports_dir if provided and is a directory
             if out and os.path.isdir(out):
@@ -295,6 +374,9 @@ def report(ctx, clusters, all_clusters, report_type, output_format, out, all, li
             ts = datetime.now().strftime('%Y%m%dT%H%M%S')
             generated_reports = []
             available_types = get_report_types()
+            # (report type, output path, format, progress lines); steps with an
+            # output path still have to be generated
+            steps = []
             for current_type in available_types:
                 try:
                     generator = get_generator(current_type)
@@ -307,19 +389,56 @@ def report(ctx, clusters, all_clusters, report_type, output_format, out, all, li
                         format_to_use = 'html' if 'html' in supported_formats else supported_formats[0]
                     file_ext = _get_file_extension(format_to_use, generator)
                     current_out = os.path.join(reports_dir, f'{prefix}{ts}{file_ext}')
-                    click.echo(f'Generating {current_type} report...')
+                    lines = [f'Generating {current_type} report...']
                     if format_to_use != output_format:
-                        click.echo(f'  Skipping {current_type}: does not support {output_format} format')
-                        continue
-                    if hasattr(generator, 'supported_formats') and len(generator.supported_formats) > 1:
-                        generator.generate(db, cluster, current_out, format_to_use)
-                    else:
-                        generator.generate(db, cluster, current_out)
-                    generated_reports.append(current_out)
-                    click.echo(f'  ✓ Wrote {current_type} report to {current_out}')
+                        lines.append(f'  Skipping {current_type}: does not support {output_format} format')
+                        current_out = None
+                    steps.append((current_type, current_out, format_to_use, lines))
                 except Exception as e:
-                    click.echo(f'  ✗ Failed to generate {current_type} report: {e}')
-                    continue
+                    steps.append((current_type, None, None, [f'  ✗ Failed to generate {current_type} report: {e}']))
+
+            def _echo_outcome(t: str, job_out: str, error: Exception | None) -> None:
+                if error is None:
+                    generated_reports.append(job_out)
+                    click.echo(f'  ✓ Wrote {t} report to {job_out}')
+                else:
+                    click.echo(f'  ✗ Failed to generate {t} report: {error}')
+
+            jobs = [step for step in steps if step[1]]
+            # Report types are independent and CPU-bound, so with several cores
+            # each runs in its own process on its own connection
+            workers = min(len(jobs), os.cpu_count() or 1)
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    future_map = {executor.submit(_generate_report_file, paths.db_path, cluster, t, job_out, fmt): (t, job_out)
+                                  for t, job_out, fmt, _ in jobs}
+                    for _, _, _, lines in steps:
+                        for line in lines:
+                            click.echo(line)
+                    # Outcomes are printed as each report finishes
+                    for fut in as_completed(future_map):
+                        try:
+                            fut.result()
+                            error = None
+                        except Exception as e:
+                            error = e
+                        _echo_outcome(*future_map[fut], error)
+            else:
+                db = WorkloadDB(paths.db_path, read_only=True)
+                try:
+                    for t, job_out, fmt, lines in steps:
+                        for line in lines:
+                            click.echo(line)
+                        if not job_out:
+                            continue
+                        try:
+                            _run_generator(get_generator(t), db, cluster, job_out, fmt)
+                            error = None
+                        except Exception as e:
+                            error = e
+                        _echo_outcome(t, job_out, error)
+                finally:
+                    db._conn.close()
             click.echo(f'\nGenerated {len(generated_reports)} reports successfully.')
             return
         try:
@@ -347,11 +466,11 @@ def report(ctx, clusters, all_clusters, report_type, output_format, out, all, li
                 prefix = getattr(generator, 'filename_prefix', 'report-')
                 file_ext = _get_file_extension(output_format, generator)
                 out = os.path.join(out, f'{prefix}{ts}{file_ext}')
-        # Call generate with format parameter if supported
-        if hasattr(generator, 'supported_formats') and len(generator.supported_formats) > 1:
-            generator.generate(db, cluster, out, output_format)
-        else:
-            generator.generate(db, cluster, out)
+        db = WorkloadDB(paths.db_path, read_only=True)
+        try:
+            _run_generator(generator, db, cluster, out, output_format)
+        finally:
+            db._conn.close()
         click.echo(f'Wrote {report_type} report to {out}')
         return
     # multi-cluster path
@@ -362,45 +481,54 @@ def report(ctx, clusters, all_clusters, report_type, output_format, out, all, li
             get_cluster_cfg(cfg, cluster)
         except ValueError as e:
             raise click.ClickException(str(e))
+    types = get_report_types() if all else [report_type]
+
+    def _report_cluster(cluster: str) -> None:
+        """Generate every requested report for one cluster, echoing progress as it goes."""
         paths = get_cluster_paths(cfg, cluster)
         if not os.path.exists(paths.db_path):
-            click.echo(f'Skipping {cluster}: not initialized')
-            continue
-        db = WorkloadDB(paths.db_path)
-        reports_dir = os.path.join(cfg.storage.base_dir, cluster, 'reports')
-        os.makedirs(reports_dir, exist_ok=True)
-        ts = datetime.now().strftime('%Y%m%dT%H%M%S')
-        if all:
-            types = get_report_types()
-        else:
-            types = [report_type]
-        for t in types:
-            try:
-                generator = get_generator(t)
-            except ValueError as e:
-                click.echo(f'Skipping {cluster} report {t}: {e}')
-                continue
-            prefix = getattr(generator, 'filename_prefix', 'report-')
-            # For multi-cluster, use specified format or default to HTML
-            format_to_use = output_format if hasattr(generator, 'supported_formats') and output_format in generator.supported_formats else 'html'
-            file_ext = _get_file_extension(format_to_use, generator)
-            current_out = os.path.join(reports_dir, f'{prefix}{ts}{file_ext}')
-            click.echo(f'[{cluster}] Generating {t} report...')
-            try:
-                if hasattr(generator, 'supported_formats') and len(generator.supported_formats) > 1:
-                    generator.generate(db, cluster, current_out, format_to_use)
-                else:
-                    generator.generate(db, cluster, current_out)
-                click.echo(f'[{cluster}] ✓ {t} -> {current_out}')
-            except Exception as e:
-                click.echo(f'[{cluster}] ✗ Failed {t}: {e}')
+            click.echo(f'[{cluster}] Skipping: not initialized')
+            return
+        # Each cluster has its own database file and connection
+        db = WorkloadDB(paths.db_path, read_only=True)
+        try:
+            reports_dir = os.path.join(cfg.storage.base_dir, cluster, 'reports')
+            os.makedirs(reports_dir, exist_ok=True)
+            ts = datetime.now().strftime('%Y%m%dT%H%M%S')
+            for t in types:
+                try:
+                    generator = get_generator(t)
+                except ValueError as e:
+                    click.echo(f'[{cluster}] Skipping report {t}: {e}')
+                    continue
+                prefix = getattr(generator, 'filename_prefix', 'report-')
+                # For multi-cluster, use specified format or default to HTML
+                format_to_use = output_format if hasattr(generator, 'supported_formats') and output_format in generator.supported_formats else 'html'
+                file_ext = _get_file_extension(format_to_use, generator)
+                current_out = os.path.join(reports_dir, f'{prefix}{ts}{file_ext}')
+                click.echo(f'[{cluster}] Generating {t} report...')
+                try:
+                    _run_generator(generator, db, cluster, current_out, format_to_use)
+                    click.echo(f'[{cluster}] ✓ {t} -> {current_out}')
+                except Exception as e:
+                    click.echo(f'[{cluster}] ✗ Failed {t}: {e}')
+        finally:
+            db._conn.close()
+
+    # Clusters are independent (separate database and report files), so they
+    # are reported concurrently; every progress line carries its cluster name
+    # because lines of different clusters interleave
+    with ThreadPoolExecutor(max_workers=min(REPORT_PARALLELISM, len(cluster_list))) as executor:
+        futures = [executor.submit(_report_cluster, cluster) for cluster in cluster_list]
+        for fut in as_completed(futures):
+            fut.result()
 
 @cli.command()
 @click.pass_context
 def kinds(ctx):
     """List supported workload kinds and their API versions."""
     config = ctx.obj['config']
-    cfg = load_config(config)
+    cfg = _load_cli_config(config)
     log.configure_logging(cfg.logging.level, cfg.logging.format)
     from .kube.client import STATIC_KIND_MAP
     click.echo('Available workload kinds:')
@@ -411,11 +539,12 @@ def kinds(ctx):
 @cli.command()
 @click.option('--cluster', 'clusters', multiple=True, help='Cluster name(s) to list nodes for')
 @click.option('--all-clusters', is_flag=True, help='Show nodes for all configured clusters')
+@output_format_option
 @click.pass_context
-def nodes(ctx, clusters, all_clusters):
+def nodes(ctx, clusters, all_clusters, output_format):
     """List node capacity info for one or more clusters."""
     config = ctx.obj['config']
-    cfg = load_config(config)
+    cfg = _load_cli_config(config)
     log.configure_logging(cfg.logging.level, cfg.logging.format)
     if not clusters and not all_clusters:
         raise click.ClickException('Must specify at least one --cluster or use --all-clusters')
@@ -428,13 +557,23 @@ def nodes(ctx, clusters, all_clusters):
             raise click.ClickException(str(e))
         paths = get_cluster_paths(cfg, cluster)
         if not os.path.exists(paths.db_path):
-            click.echo(f'Skipping {cluster}: not initialized')
+            if output_format == 'ndjson':
+                click.echo(compact_json({'cluster': cluster, 'error': 'not initialized'}))
+            else:
+                click.echo(f'Skipping {cluster}: not initialized')
             continue
-        db = WorkloadDB(paths.db_path)
-        nq = NodeQueries(db)
-        node_records = nq.list_active_nodes(cluster)
-        aggregate.append({'cluster': cluster, 'nodes': [n.to_dict() for n in node_records]})
-    click.echo(json.dumps(aggregate if len(aggregate) > 1 else aggregate[0], indent=2))
+        db = WorkloadDB(paths.db_path, read_only=True)
+        try:
+            node_records = NodeQueries(db).list_active_nodes(cluster)
+        finally:
+            db._conn.close()
+        entry = {'cluster': cluster, 'nodes': [n.to_dict() for n in node_records]}
+        if output_format == 'ndjson':
+            click.echo(compact_json(entry))
+        else:
+            aggregate.append(entry)
+    if aggregate:
+        click.echo(pretty_json(aggregate if len(aggregate) > 1 else aggregate[0]))
 
 if __name__ == '__main__':
     cli()
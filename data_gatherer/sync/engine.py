@@ -1,9 +1,37 @@
 from __future__ import annotations
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, Iterable, Tuple, List
+from typing import Dict, Any, Iterable, Tuple, List, Optional
 from ..persistence.db import WorkloadDB
 from .normalize import normalize_manifest
-from ..util.hash import sha256_of_manifest
+from ..util.hash import canonical_json, sha256_of_json
+
+# Kinds with at least this many items serialize and hash their manifests in a
+# process pool; below it, shipping them to the workers costs more than it saves.
+PARALLEL_SERIALIZE_MIN_ITEMS = 2000
+PARALLEL_SERIALIZE_CHUNKSIZE = 64
+
+
+def _serialize_manifest(norm: Dict[str, Any]) -> Tuple[str, str]:
+    """Canonical JSON of a normalized manifest and its hash; runs in pool workers."""
+    manifest_json = canonical_json(norm)
+    return manifest_json, sha256_of_json(manifest_json)
+
+
+def make_serialize_pool() -> Optional[ProcessPoolExecutor]:
+    """Process pool for SyncEngine to serialize large kinds, or None on one CPU.
+
+    Create one per sync run and shut it down afterwards. Workers come from a
+    forkserver (spawned where that is unavailable), so starting them from the
+    sync writer thread never forks the multithreaded sync process.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2:
+        return None
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
 
 
 class SyncStats:
@@ -18,41 +46,46 @@ class SyncStats:
 
 
 class SyncEngine:
-    def __init__(self, db: WorkloadDB, cluster: str):
+    def __init__(self, db: WorkloadDB, cluster: str, serialize_pool: Optional[ProcessPoolExecutor] = None):
         self.db = db
         self.cluster = cluster
+        # Owned by the caller; see make_serialize_pool()
+        self.serialize_pool = serialize_pool
 
     def sync_kind(self, api_version: str, kind: str, items: Iterable[Dict[str, Any]]):
         alive_keys: List[Tuple[str, str, str]] = []
         alive_nodes: List[str] = []
+        rows = []
+        keys = []
+        normalized = []
         now = datetime.now(timezone.utc)
+        stored = self.db.load_resource_versions(self.cluster, kind)
 
         for item in items:
             meta = item.get('metadata', {})
             namespace = meta.get('namespace', '')  # Empty for cluster-scoped
             name = meta['name']
+            resource_version = meta.get('resourceVersion')
 
             # Handle nodes separately for capacity tracking
             if kind == 'Node':
                 self.db.upsert_node_capacity(self.cluster, name, item, now)
                 alive_nodes.append(name)
 
-            # Always store the full manifest for all kinds including nodes
-            norm = normalize_manifest(item)
-            h = sha256_of_manifest(norm)
-            status, changed = self.db.upsert_workload(
-                cluster=self.cluster,
-                api_version=api_version,
-                kind=kind,
-                namespace=namespace,
-                name=name,
-                resource_version=meta.get('resourceVersion'),
-                uid=meta.get('uid'),
-                manifest=norm,
-                manifest_hash=h,
-                now=now
-            )
             alive_keys.append((kind, namespace, name))
+            # The API server bumps resourceVersion on every change, so an
+            # object still at its stored version keeps its stored manifest
+            cached = stored.get((namespace, name))
+            if resource_version and cached and cached[0] == resource_version:
+                rows.append((namespace, name, resource_version, meta.get('uid'), None, cached[1]))
+                continue
+            # Always store the full manifest for all kinds including nodes
+            normalized.append(normalize_manifest(item))
+            keys.append((namespace, name, resource_version, meta.get('uid')))
+
+        # Serialized once: the same text is hashed and stored
+        rows.extend(key + serialized for key, serialized in zip(keys, self._serialize_all(normalized)))
+        self.db.upsert_workloads(self.cluster, api_version, kind, rows, now, stored=stored)
 
         # Mark deleted nodes if this was a Node sync
         if kind == 'Node' and alive_nodes:
@@ -60,6 +93,15 @@ class SyncEngine:
 
         return alive_keys
 
+    def _serialize_all(self, normalized: List[Dict[str, Any]]) -> Iterable[Tuple[str, str]]:
+        # Serializing and hashing are pure CPU work that holds the GIL, so the
+        # fetch threads cannot overlap it; large kinds fan out to the pool.
+        # Manifests are normalized first so status and managedFields are not
+        # pickled across.
+        if self.serialize_pool is None or len(normalized) < PARALLEL_SERIALIZE_MIN_ITEMS:
+            return map(_serialize_manifest, normalized)
+        return list(self.serialize_pool.map(_serialize_manifest, normalized, chunksize=PARALLEL_SERIALIZE_CHUNKSIZE))
+
     def finalize(self, alive_keys: Iterable[Tuple[str, str, str]], kinds_scope: Iterable[str] | None = None):
         """Finalize a sync operation.
 
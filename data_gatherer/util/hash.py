@@ -5,5 +5,13 @@ from typing import Any
 def canonical_json(data: Any) -> str:
     return json.dumps(data, sort_keys=True, separators=(',', ':'))
 
+# Stored manifest hashes are compared across runs, so the algorithm must not
+# change or depend on optional packages. hashlib's sha256 is OpenSSL's, which
+# uses the CPU's SHA extensions where present and costs a small fraction of
+# the canonical_json() call that precedes it.
+def sha256_of_json(text: str) -> str:
+    """Hash of already serialized canonical JSON, for callers that also store the text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
 def sha256_of_manifest(manifest: Any) -> str:
-    return hashlib.sha256(canonical_json(manifest).encode('utf-8')).hexdigest()
+    return sha256_of_json(canonical_json(manifest))
@@ -0,0 +1,34 @@
+from __future__ import annotations
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional; the json module is used instead
+    orjson = None
+
+_ORJSON_INDENT = orjson.OPT_INDENT_2 if orjson is not None else 0
+_ORJSON_INDENT_SORTED = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if orjson is not None else 0
+
+def pretty_json(data: Any, sort_keys: bool = False) -> str:
+    """Same layout as json.dumps(data, indent=2), serialized by orjson when installed.
+
+    orjson writes non-ASCII characters as-is rather than as \\uXXXX escapes and
+    may spell some floats differently; values it cannot encode (ints beyond
+    64 bits, non-string keys) go through the json module.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_INDENT_SORTED if sort_keys else _ORJSON_INDENT).decode('utf-8')
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return json.dumps(data, indent=2, sort_keys=sort_keys)
+
+def compact_json(data: Any) -> str:
+    """Single-line JSON, e.g. one NDJSON record; through orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data).decode('utf-8')
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return json.dumps(data, separators=(',', ':'))
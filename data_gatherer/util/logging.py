@@ -3,34 +3,46 @@ import json, sys, time
 from typing import Any
 _LOG_LEVEL = 'INFO'
 _LOG_FORMAT = 'json'
+_LEVELS = {'DEBUG': 0, 'INFO': 1, 'WARN': 2, 'ERROR': 3}
+# Threshold of _LOG_LEVEL, resolved once so each call costs one int compare
+_LEVEL_NUM = _LEVELS['INFO']
 
 def configure_logging(level: str = 'INFO', format: str = 'json'):
-    global _LOG_LEVEL, _LOG_FORMAT
+    global _LOG_LEVEL, _LOG_FORMAT, _LEVEL_NUM
     _LOG_LEVEL = level.upper()
     _LOG_FORMAT = format.lower()
+    _LEVEL_NUM = _LEVELS.get(_LOG_LEVEL, 1)
 
-def _should_log(level: str) -> bool:
-    levels = {'DEBUG': 0, 'INFO': 1, 'WARN': 2, 'ERROR': 3}
-    return levels.get(level.upper(), 1) >= levels.get(_LOG_LEVEL, 1)
+def is_enabled(level: str) -> bool:
+    """Whether ``level`` is emitted; lets callers skip building costly fields."""
+    return _LEVELS.get(level.upper(), 1) >= _LEVEL_NUM
+
+_should_log = is_enabled
 
 def log(level: str, message: str, **fields: Any):
-    if not _should_log(level):
-        return
+    if is_enabled(level):
+        _emit(level.upper(), message, fields)
+
+def _emit(lvl: str, message: str, fields: dict):
     ts = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
-    lvl = level.upper()
     if _LOG_FORMAT == 'json':
         rec = {'ts': ts, 'level': lvl, 'msg': message}
         if fields: rec.update(fields)
-        print(json.dumps(rec, sort_keys=True), file=sys.stderr)
+        line = json.dumps(rec, sort_keys=True)
     else:
         extra = ' '.join(f'{k}={v}' for k,v in fields.items()) if fields else ''
         line = f"{ts} [{lvl}] {message}" + (f" {extra}" if extra else '')
-        print(line, file=sys.stderr)
+    # One write per line: print() writes the text and the newline separately,
+    # so lines from the sync worker threads could interleave
+    sys.stderr.write(line + '\n')
 
-def debug(message: str, **fields: Any): log('debug', message, **fields)
+def debug(message: str, **fields: Any):
+    if _LEVEL_NUM <= 0: _emit('DEBUG', message, fields)
 
-def info(message: str, **fields: Any): log('info', message, **fields)
+def info(message: str, **fields: Any):
+    if _LEVEL_NUM <= 1: _emit('INFO', message, fields)
 
-def warn(message: str, **fields: Any): log('warn', message, **fields)
+def warn(message: str, **fields: Any):
+    if _LEVEL_NUM <= 2: _emit('WARN', message, fields)
 
-def error(message: str, **fields: Any): log('error', message, **fields)
+def error(message: str, **fields: Any): _emit('ERROR', message, fields)
@@ -5,6 +5,7 @@ This test file validates that Excel reports apply the same rules as HTML reports
 particularly the request/limit ratio rule (20% threshold).
 """
 
+import sys
 import pytest
 from data_gatherer.reporting.containers_config_report import ContainerConfigurationReport
 from data_gatherer.persistence.db import WorkloadDB
@@ -325,3 +326,66 @@ def test_excel_missing_values_formatting(tmp_path):
         f"CPU limit cell should have warning background, got {cpu_lim_cell.fill.start_color.rgb}"
     assert mem_lim_cell.fill.start_color.rgb in WARNING_MISS_BG_COLORS, \
         f"Memory limit cell should have warning background, got {mem_lim_cell.fill.start_color.rgb}"
+
+
+def _write_excel_fast(tmp_path):
+    db = WorkloadDB(str(tmp_path / "test.db"))
+    manifest = {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": "app", "namespace": "ns"},
+        "spec": {
+            "replicas": 2,
+            "template": {"spec": {"containers": [
+                {"name": "c", "image": "img:1", "imagePullPolicy": "Always",
+                 "resources": {"limits": {"cpu": "500m"}}}
+            ]}}
+        }
+    }
+    db.upsert_workload("c1", "apps/v1", "Deployment", "ns", "app", "1", "u", manifest, "h")
+
+    report = ContainerConfigurationReport()
+    report.generate(db, "c1", str(tmp_path / "fast.xlsx"), "excel-fast")
+    ws = load_workbook(str(tmp_path / "fast.xlsx")).active
+
+    headers = [c.value for c in ws[3]][:16]
+    assert headers[:5] == ["Kind", "Namespace", "Name", "Container", "Type"]
+    assert ws.cell(row=4, column=3).value == "app"
+    cpu_req = ws.cell(row=4, column=headers.index("CPU_req_m") + 1)
+    assert cpu_req.value is None
+    assert cpu_req.fill.fgColor.rgb in ERROR_MISS_BG_COLORS
+    pull = ws.cell(row=4, column=headers.index("Image_Pull_Policy") + 1)
+    assert pull.font.color.rgb in WARNING_MISCONF_TEXT_COLORS
+    assert ws.cell(row=6, column=1).value == "Total containers:"
+    assert ws.cell(row=6, column=2).value == 1
+    return ws
+
+
+def test_excel_fast_matches_standard_layout(tmp_path):
+    """excel-fast (xlsxwriter) keeps the layout and rule fills of the openpyxl writer."""
+    pytest.importorskip('xlsxwriter')
+    _write_excel_fast(tmp_path)
+
+
+def test_excel_fast_without_xlsxwriter_writes_xml_directly(tmp_path, monkeypatch):
+    """Without xlsxwriter, excel-fast falls back to the built-in XML writer with the same layout."""
+    monkeypatch.setitem(sys.modules, 'xlsxwriter', None)
+    ws = _write_excel_fast(tmp_path)
+    assert ws.title == "Container Configuration"
+    assert [str(r) for r in ws.merged_cells.ranges] == ["A1:P1"]
+    assert ws.cell(row=1, column=1).font.b
+    assert ws.column_dimensions["F"].width == 45
+
+
+@pytest.mark.parametrize("writer", ["_generate_excel", "_generate_excel_fast", "_generate_excel_xml"])
+def test_layout_follows_the_header_list(tmp_path, writer):
+    """Title merge and column widths come from the headers passed in, not a fixed 16-column layout."""
+    if writer == "_generate_excel_fast":
+        pytest.importorskip('xlsxwriter')
+    out = tmp_path / "narrow.xlsx"
+    getattr(ContainerConfigurationReport(), writer)("Title", ["Kind", "Namespace", "Image"],
+                                                    [("Deployment", "ns", "img:1")], str(out))
+    ws = load_workbook(str(out)).active
+    assert [str(r) for r in ws.merged_cells.ranges] == ["A1:C1"]
+    assert ws.column_dimensions["C"].width == pytest.approx(45, abs=1)
+    assert ws.column_dimensions["A"].width == pytest.approx(12, abs=1)
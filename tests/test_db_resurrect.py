@@ -39,3 +39,63 @@ def test_hard_delete_and_insert_snapshot_mode():
             manifest_hash='hashB', now=later + timedelta(minutes=1)
         )
         assert status3 == 'updated'
+
+
+def test_batch_commits_on_exit_and_rolls_back_on_error():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = WorkloadDB(os.path.join(tmp, 'data.db'))
+        manifest = {'apiVersion': 'apps/v1', 'kind': 'Deployment', 'metadata': {'name': 'a', 'namespace': 'ns'}}
+        with db.batch():
+            db.upsert_workload(cluster='c1', api_version='apps/v1', kind='Deployment', namespace='ns', name='a',
+                               resource_version='1', uid='u1', manifest=manifest, manifest_hash='h1')
+            # Nothing is committed until the batch exits
+            assert db._conn.in_transaction
+        assert db.summary('c1')['by_kind'] == {'Deployment': 1}
+
+        try:
+            with db.batch():
+                db.upsert_workload(cluster='c1', api_version='apps/v1', kind='Deployment', namespace='ns', name='b',
+                                   resource_version='1', uid='u2', manifest=manifest, manifest_hash='h2')
+                raise RuntimeError('write failed')
+        except RuntimeError:
+            pass
+        assert db.summary('c1')['by_kind'] == {'Deployment': 1}
+
+
+def test_read_only_db_reads_but_rejects_writes():
+    import sqlite3
+    import pytest
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'with space', 'data.db')
+        db = WorkloadDB(db_path)
+        manifest = {'apiVersion': 'apps/v1', 'kind': 'Deployment', 'metadata': {'name': 'a', 'namespace': 'ns'}}
+        db.upsert_workload(cluster='c1', api_version='apps/v1', kind='Deployment', namespace='ns', name='a',
+                           resource_version='1', uid='u1', manifest=manifest, manifest_hash='h1')
+        ro = WorkloadDB(db_path, read_only=True)
+        assert ro.summary('c1')['by_kind'] == {'Deployment': 1}
+        with pytest.raises(sqlite3.OperationalError):
+            ro.upsert_workload(cluster='c1', api_version='apps/v1', kind='Deployment', namespace='ns', name='b',
+                               resource_version='1', uid='u2', manifest=manifest, manifest_hash='h2')
+
+
+def test_upsert_workloads_matches_row_by_row_outcomes():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = WorkloadDB(os.path.join(tmp, 'data.db'))
+        first = db.upsert_workloads('c1', 'apps/v1', 'Deployment', [
+            ('ns', 'a', '1', 'u1', '{"a":1}', 'h1'),
+            ('ns', 'b', '1', 'u2', '{"b":1}', 'h2'),
+        ])
+        assert (first.inserted, first.updated, first.unchanged) == (2, 0, 0)
+        db._conn.execute("UPDATE workload SET deleted=1 WHERE name='a'")
+
+        # 'a' comes back unchanged, 'b' changes, a repeated 'c' keeps its last row
+        second = db.upsert_workloads('c1', 'apps/v1', 'Deployment', [
+            ('ns', 'a', '1', 'u1', '{"a":1}', 'h1'),
+            ('ns', 'b', '2', 'u2', '{"b":2}', 'h2b'),
+            ('ns', 'c', '1', 'u3', '{"c":1}', 'h3'),
+            ('ns', 'c', '2', 'u3', '{"c":2}', 'h3b'),
+        ])
+        assert (second.inserted, second.updated, second.unchanged) == (1, 1, 1)
+        rows = db._conn.execute(
+            "SELECT name, resource_version, manifest_json, deleted FROM workload ORDER BY name").fetchall()
+        assert [tuple(r) for r in rows] == [('a', '1', '{"a":1}', 0), ('b', '2', '{"b":2}', 0), ('c', '2', '{"c":2}', 0)]
@@ -165,3 +165,57 @@ def test_java_opts_configmap_scanning():
 
 if __name__ == '__main__':
     test_java_opts_configmap_scanning()
+
+
+def test_load_configmaps_scoped_to_cluster(tmp_path):
+    """ConfigMaps are loaded once per cluster into a (namespace, name) map."""
+    db = WorkloadDB(str(tmp_path / 'test.db'))
+    for cluster, opts in (('a', '-Xmx1g'), ('b', '-Xmx4g')):
+        db.upsert_workload(
+            cluster=cluster, api_version='v1', kind='ConfigMap', namespace='ns',
+            name='java-config', resource_version='1', uid=f'uid-{cluster}',
+            manifest={'kind': 'ConfigMap', 'data': {'JAVA_OPTS': opts}},
+            manifest_hash=f'hash-{cluster}'
+        )
+    report = ContainerConfigurationReport()
+    configmaps = report._load_configmaps(db, 'b')
+    assert configmaps == {('ns', 'java-config'): {'JAVA_OPTS': '-Xmx4g'}}
+
+    container_def = {'envFrom': [{'configMapRef': {'name': 'java-config'}}]}
+    assert report._extract_java_opts(container_def, 'ns', configmaps) == '-Xmx4g'
+    assert report._extract_java_opts(container_def, 'other-ns', configmaps) == 'Not configured'
+
+
+def test_load_configmaps_fetches_only_referenced(tmp_path, monkeypatch):
+    """Referenced ConfigMaps are fetched in batches; others are never loaded."""
+    db = WorkloadDB(str(tmp_path / 'test.db'))
+    for i in range(5):
+        db.upsert_workload(
+            cluster='c', api_version='v1', kind='ConfigMap', namespace='ns',
+            name=f'cm{i}', resource_version='1', uid=f'uid-{i}',
+            manifest={'kind': 'ConfigMap', 'data': {'JAVA_OPTS': f'-Xmx{i}g'}},
+            manifest_hash=f'hash-{i}'
+        )
+    report = ContainerConfigurationReport()
+    refs = {('ns', 'cm1'), ('ns', 'cm3'), ('ns', 'missing'), ('other', 'cm0')}
+    configmaps = report._load_configmaps(db, 'c', refs)
+    assert configmaps == {('ns', 'cm1'): {'JAVA_OPTS': '-Xmx1g'}, ('ns', 'cm3'): {'JAVA_OPTS': '-Xmx3g'}}
+    assert report._load_configmaps(db, 'c', set()) == {}
+    monkeypatch.setattr('data_gatherer.reporting.containers_config_report._CONFIGMAP_BATCH', 1)
+    assert report._load_configmaps(db, 'c', refs) == configmaps
+
+    container_def = {'env': [{'name': 'JAVA_OPTS', 'valueFrom': {'configMapKeyRef': {'name': 'cm2', 'key': 'JAVA_OPTS'}}},
+                             {'name': 'OTHER', 'valueFrom': {'configMapKeyRef': {'name': 'cm4', 'key': 'X'}}}]}
+    assert report._configmap_refs(container_def) == {'cm2'}
+
+
+def test_direct_env_value_wins_regardless_of_order():
+    """A direct value beats a configMapKeyRef for the same name even when listed after it."""
+    report = ContainerConfigurationReport()
+    configmaps = {('ns', 'cm'): {'JAVA_OPTS': '-Xmx1g', 'CATALINA_OPTS': '-Dcat=1'}}
+    container_def = {'env': [
+        {'name': 'JAVA_OPTS', 'valueFrom': {'configMapKeyRef': {'name': 'cm', 'key': 'JAVA_OPTS'}}},
+        {'name': 'CATALINA_OPTS', 'valueFrom': {'configMapKeyRef': {'name': 'cm', 'key': 'CATALINA_OPTS'}}},
+        {'name': 'JAVA_OPTS', 'value': '-Xmx2g'},
+    ]}
+    assert report._extract_java_opts(container_def, 'ns', configmaps) == 'CATALINA_OPTS=-Dcat=1; JAVA_OPTS=-Xmx2g'
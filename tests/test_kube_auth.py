@@ -40,3 +40,51 @@ def test_list_resources_includes_auth_header():
     # And that we parsed items correctly
     assert len(items) == 1
     assert items[0]['metadata']['name'] == 'demo'
+
+
+def test_list_resources_pages_with_limit_and_continue():
+    class PagingApiClient(FakeApiClient):
+        def call_api(self, url, method, response_type=None, _preload_content=None, auth_settings=None, **kwargs):
+            self.calls.append(url)
+            token = 'next=' if len(self.calls) == 1 else ''
+            payload = {'items': [{'metadata': {'name': f'demo-{len(self.calls)}'}}], 'metadata': {'continue': token}}
+            return (SimpleNamespace(data=json.dumps(payload).encode()), 200, {})
+
+    client = PagingApiClient()
+    items = list(list_resources(client, 'apps/v1', 'deployments'))
+    assert [i['metadata']['name'] for i in items] == ['demo-1', 'demo-2']
+    assert client.calls == [
+        '/apis/apps/v1/deployments?limit=500',
+        '/apis/apps/v1/deployments?limit=500&continue=next%3D',
+    ]
+
+
+def test_list_namespaced_resources_retries_transient_errors():
+    from kubernetes.client.exceptions import ApiException
+    from data_gatherer.kube.client import list_namespaced_resources
+
+    class FlakyApiClient(FakeApiClient):
+        def call_api(self, url, method, response_type=None, _preload_content=None, auth_settings=None, **kwargs):
+            self.calls.append(url)
+            if len(self.calls) == 1:
+                raise ApiException(status=503)
+            payload = {'items': [{'metadata': {'name': 'demo', 'namespace': 'ns1'}}], 'metadata': {}}
+            return (SimpleNamespace(data=json.dumps(payload).encode()), 200, {})
+
+    client = FlakyApiClient()
+    items = list(list_namespaced_resources(client, 'v1', 'configmaps', 'ns1', backoff_base=0))
+    assert len(items) == 1
+    assert client.calls == ['/api/v1/namespaces/ns1/configmaps?limit=500'] * 2
+
+
+def test_enable_tcp_keepalive_sets_pool_socket_options():
+    import socket
+    from kubernetes import client as k8s_client
+    from data_gatherer.kube.client import enable_tcp_keepalive
+    api_client = k8s_client.ApiClient(configuration=k8s_client.Configuration())
+    enable_tcp_keepalive(api_client)
+    pool = api_client.rest_client.pool_manager.connection_from_url('https://example.invalid')
+    options = pool.conn_kw['socket_options']
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    # urllib3's defaults (TCP_NODELAY) are kept
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
@@ -74,3 +74,39 @@ def test_logging_format_json():
         
     finally:
         sys.stderr = old_stderr
+
+
+def test_is_enabled_follows_configured_level():
+    try:
+        log.configure_logging('WARN', 'json')
+        assert not log.is_enabled('debug')
+        assert not log.is_enabled('INFO')
+        assert log.is_enabled('warn')
+        assert log.is_enabled('error')
+        log.configure_logging('debug', 'json')
+        assert log.is_enabled('debug')
+    finally:
+        log.configure_logging('INFO', 'json')
+
+
+def test_each_line_is_a_single_write():
+    class RecordingStream:
+        def __init__(self):
+            self.writes = []
+
+        def write(self, text):
+            self.writes.append(text)
+
+    old_stderr = sys.stderr
+    sys.stderr = stream = RecordingStream()
+    try:
+        log.configure_logging('INFO', 'text')
+        log.info('first', key='value')
+        log.configure_logging('INFO', 'json')
+        log.warn('second')
+    finally:
+        sys.stderr = old_stderr
+        log.configure_logging('INFO', 'json')
+    assert len(stream.writes) == 2
+    assert all(w.endswith('\n') and w.count('\n') == 1 for w in stream.writes)
+    assert 'first key=value' in stream.writes[0] and '"msg": "second"' in stream.writes[1]
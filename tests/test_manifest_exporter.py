@@ -41,3 +41,28 @@ def test_export_archive(tmp_path):
         f = tf.extractfile(alpha_member)
         content = json.loads(f.read().decode())
         assert content['spec']['x'] == 1
+
+
+def test_export_skip_if_exists_keeps_existing_file(tmp_path):
+    exporter = ManifestExporter(str(tmp_path), fmt='json', skip_if_exists=True)
+    assert exporter.export_kind('Deployment', SAMPLE_ITEMS, namespaced=True) == 2
+    changed = [{'metadata': {'name': 'alpha', 'namespace': 'default'}, 'spec': {'x': 99}}]
+    assert exporter.export_kind('Deployment', changed, namespaced=True) == 0
+    data = json.loads((tmp_path / 'Deployment' / 'default' / 'alpha.json').read_text())
+    assert data['spec']['x'] == 1
+
+
+def test_export_writes_in_target_path_order(tmp_path):
+    archive_path = tmp_path / 'manifests.tgz'
+    exporter = ManifestExporter(str(tmp_path), fmt='json', archive=str(archive_path))
+    items = [
+        {'metadata': {'name': 'b', 'namespace': 'ns2'}},
+        {'metadata': {'name': 'z', 'namespace': 'ns1'}},
+        {'metadata': {'name': 'a', 'namespace': 'ns2'}},
+    ]
+    exporter.export_kind('Deployment', items, namespaced=True)
+    exporter.close()
+    with tarfile.open(archive_path, 'r:gz') as tf:
+        assert tf.getnames() == ['Deployment/ns1/z.json', 'Deployment/ns2/a.json', 'Deployment/ns2/b.json']
+    # The caller's list is left untouched
+    assert [i['metadata']['name'] for i in items] == ['b', 'z', 'a']
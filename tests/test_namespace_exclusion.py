@@ -11,4 +11,13 @@ def test_namespace_exclusion_patterns():
     assert c.is_namespace_excluded('exact-ns')
     assert c.is_namespace_excluded('temp-123')
     assert c.is_namespace_excluded('scratch1')
-    assert not c.is_namespace_excluded('other')
\ No newline at end of file
+    assert not c.is_namespace_excluded('other')
+
+def test_namespace_exclusion_follows_pattern_changes():
+    c = ClusterConfig(name='demo', include_kinds=[], exclude_namespace_patterns=['temp-*'])
+    assert c.is_namespace_excluded('temp-1')
+    assert not c.is_namespace_excluded('scratch-1')
+    c.exclude_namespace_patterns.append('scratch-*')
+    assert c.is_namespace_excluded('scratch-1')
+    c.exclude_namespace_patterns.clear()
+    assert not c.is_namespace_excluded('temp-1')
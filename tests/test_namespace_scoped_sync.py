@@ -47,4 +47,185 @@ logging:\n  level: INFO\n  format: text\n"""
         assert res.exit_code == 0, res.output
         res = runner.invoke(cli, ['--config', cfg_path, 'sync', '--cluster', 'c1'])
         assert res.exit_code == 0, res.output
-        assert set(calls) == {'ns1', 'ns2'}
\ No newline at end of file
+        assert set(calls) == {'ns1', 'ns2'}
+
+def test_sync_writes_from_single_thread(monkeypatch):
+    import threading
+    def fake_call_api(self, url, method, response_type=None, _preload_content=False, auth_settings=None):
+        namespace = url.split('/namespaces/')[1].split('/')[0]
+        payload = {'items': [{
+            'apiVersion': 'apps/v1',
+            'kind': 'Deployment',
+            'metadata': {'name': f'app-{namespace}', 'namespace': namespace, 'resourceVersion': '1', 'uid': f'uid-{namespace}'},
+            'spec': {'replicas': 1}
+        }]}
+        return (DummyResp(payload), 200, {})
+
+    monkeypatch.setattr('kubernetes.client.ApiClient.call_api', fake_call_api)
+    from data_gatherer.persistence.db import WorkloadDB
+    writer_threads = set()
+    original_upsert = WorkloadDB.upsert_workloads
+
+    def recording_upsert(self, *args, **kwargs):
+        writer_threads.add(threading.get_ident())
+        return original_upsert(self, *args, **kwargs)
+
+    monkeypatch.setattr(WorkloadDB, 'upsert_workloads', recording_upsert)
+
+    cfg_text = """
+clusters:
+  - name: c1
+    credentials:
+      host: https://dummy
+      verify_ssl: false
+    parallelism: 3
+    namespace_scoped: true
+    include_namespaces: [ns1, ns2, ns3]
+    include_kinds: [Deployment]
+storage:\n  base_dir: REPLACEME
+logging:\n  level: INFO\n  format: text\n"""
+    with tempfile.TemporaryDirectory() as td:
+        cfg_path = os.path.join(td, 'cfg.yaml')
+        with open(cfg_path, 'w') as f: f.write(cfg_text.replace('REPLACEME', td))
+        runner = CliRunner()
+        res = runner.invoke(cli, ['--config', cfg_path, 'init', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        res = runner.invoke(cli, ['--config', cfg_path, 'sync', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        # Three fetch workers, but every row is written by the one writer thread
+        assert len(writer_threads) == 1
+        assert threading.get_ident() not in writer_threads
+        assert '"Deployment": 3' in res.output
+
+def test_sync_configures_connection_pool(monkeypatch):
+    pool_sizes = set()
+    def fake_call_api(self, url, method, response_type=None, _preload_content=False, auth_settings=None):
+        import socket
+        socket_options = self.rest_client.pool_manager.connection_pool_kw.get('socket_options') or []
+        pool_sizes.add((self.configuration.connection_pool_maxsize,
+                        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options))
+        return (DummyResp({'items': []}), 200, {})
+
+    monkeypatch.setattr('kubernetes.client.ApiClient.call_api', fake_call_api)
+    cfg_text = """
+clusters:
+  - name: c1
+    credentials:
+      host: https://dummy
+      verify_ssl: false
+    parallelism: 16
+    include_kinds: [Deployment, StatefulSet]
+storage:\n  base_dir: REPLACEME
+logging:\n  level: INFO\n  format: text\n"""
+    with tempfile.TemporaryDirectory() as td:
+        cfg_path = os.path.join(td, 'cfg.yaml')
+        with open(cfg_path, 'w') as f: f.write(cfg_text.replace('REPLACEME', td))
+        runner = CliRunner()
+        res = runner.invoke(cli, ['--config', cfg_path, 'init', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        res = runner.invoke(cli, ['--config', cfg_path, 'sync', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        assert pool_sizes == {(16, True)}
+
+def test_sync_write_failure_only_drops_that_kind(monkeypatch):
+    def fake_call_api(self, url, method, response_type=None, _preload_content=False, auth_settings=None):
+        kind = 'StatefulSet' if '/statefulsets' in url else 'Deployment'
+        payload = {'items': [{
+            'apiVersion': 'apps/v1',
+            'kind': kind,
+            'metadata': {'name': f'{kind.lower()}-a', 'namespace': 'ns1', 'resourceVersion': '1', 'uid': f'uid-{kind}'},
+            'spec': {'replicas': 1}
+        }]}
+        return (DummyResp(payload), 200, {})
+
+    monkeypatch.setattr('kubernetes.client.ApiClient.call_api', fake_call_api)
+    from data_gatherer.sync.engine import SyncEngine
+    original_sync_kind = SyncEngine.sync_kind
+
+    def failing_sync_kind(self, api_version, kind, items):
+        alive = original_sync_kind(self, api_version, kind, items)
+        if kind == 'StatefulSet':
+            raise RuntimeError('disk full')
+        return alive
+
+    cfg_text = """
+clusters:
+  - name: c1
+    credentials:
+      host: https://dummy
+      verify_ssl: false
+    include_kinds: [Deployment, StatefulSet]
+storage:\n  base_dir: REPLACEME\n  write_manifest_files: false
+logging:\n  level: INFO\n  format: text\n"""
+    with tempfile.TemporaryDirectory() as td:
+        cfg_path = os.path.join(td, 'cfg.yaml')
+        with open(cfg_path, 'w') as f: f.write(cfg_text.replace('REPLACEME', td))
+        runner = CliRunner()
+        res = runner.invoke(cli, ['--config', cfg_path, 'init', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        res = runner.invoke(cli, ['--config', cfg_path, 'sync', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        monkeypatch.setattr(SyncEngine, 'sync_kind', failing_sync_kind)
+        res = runner.invoke(cli, ['--config', cfg_path, 'sync', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        out = json.loads(res.output[res.output.index('\n{') + 1:])
+        assert out['errors'] == {'StatefulSet': 'disk full'}
+        # The failed kind keeps the rows of the previous sync
+        assert out['by_kind'] == {'Deployment': 1, 'StatefulSet': 1}
+        assert out['removed'] == 0
+
+def test_sync_shares_one_serialize_pool_per_run(monkeypatch):
+    import threading
+    def fake_call_api(self, url, method, response_type=None, _preload_content=False, auth_settings=None):
+        return (DummyResp({'items': []}), 200, {})
+
+    monkeypatch.setattr('kubernetes.client.ApiClient.call_api', fake_call_api)
+
+    class FakePool:
+        def __init__(self):
+            self.threads_at_start = threading.active_count()
+            self.shutdowns = 0
+
+        def shutdown(self):
+            self.shutdowns += 1
+
+    pools = []
+    monkeypatch.setattr('data_gatherer.run.make_serialize_pool', lambda: pools.append(FakePool()) or pools[-1])
+    engines = []
+    from data_gatherer.sync.engine import SyncEngine
+    original_init = SyncEngine.__init__
+
+    def recording_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        engines.append(self)
+
+    monkeypatch.setattr(SyncEngine, '__init__', recording_init)
+    cfg_text = """
+clusters:
+  - name: c1
+    credentials:
+      host: https://dummy
+      verify_ssl: false
+    include_kinds: [Deployment]
+  - name: c2
+    credentials:
+      host: https://dummy
+      verify_ssl: false
+    include_kinds: [Deployment]
+storage:\n  base_dir: REPLACEME
+logging:\n  level: INFO\n  format: text\n"""
+    with tempfile.TemporaryDirectory() as td:
+        cfg_path = os.path.join(td, 'cfg.yaml')
+        with open(cfg_path, 'w') as f: f.write(cfg_text.replace('REPLACEME', td))
+        runner = CliRunner()
+        for name in ('c1', 'c2'):
+            res = runner.invoke(cli, ['--config', cfg_path, 'init', '--cluster', name])
+            assert res.exit_code == 0, res.output
+        baseline_threads = threading.active_count()
+        res = runner.invoke(cli, ['--config', cfg_path, 'sync', '--all-clusters'])
+        assert res.exit_code == 0, res.output
+    # Created once, before any sync thread started, shared by both clusters and shut down at exit
+    assert len(pools) == 1
+    assert pools[0].threads_at_start == baseline_threads
+    assert [e.serialize_pool for e in engines] == [pools[0], pools[0]]
+    assert pools[0].shutdowns == 1
@@ -130,3 +130,65 @@ logging:
 
     content = files[0].read_text()
     assert 'No node data available for this cluster' in content
+
+
+def test_parse_cpu_and_memory_quantities():
+    from data_gatherer.reporting.nodes_report import _parse_cpu, _parse_mem
+
+    assert _parse_cpu('3800m') == 3800
+    assert _parse_cpu('4') == 4000
+    assert _parse_cpu('0.5') == 500
+    assert _parse_cpu('500000u') == 500
+    assert _parse_cpu('bogus') is None
+    assert _parse_cpu(None) is None
+
+    assert _parse_mem('16Gi') == 16 * 1024
+    assert _parse_mem('512Mi') == 512
+    assert _parse_mem('2048Ki') == 2
+    # Plain byte counts must not be mistaken for CPU cores
+    assert _parse_mem('1073741824') == 1024
+    assert _parse_mem('1.2.3Gi') is None
+    # Decimal suffixes are case-sensitive: "M" is mega, "m" is milli
+    assert _parse_mem('1048576k') == 1000
+    assert _parse_mem('128M') == 128e6 / (1024 * 1024)
+    assert _parse_mem('1048576000m') == 1
+
+
+def test_parse_exponent_quantities():
+    from data_gatherer.reporting.nodes_report import _parse_cpu, _parse_mem
+
+    assert _parse_mem('129e6') == 129e6 / (1024 * 1024)
+    assert _parse_mem('1E9') == 1e9 / (1024 * 1024)
+    assert _parse_mem('2.5e+3Ki') == 2500 / 1024
+    assert _parse_cpu('2e0') == 2000
+    assert _parse_cpu('5e-1') == 500
+    # An exponent needs digits; "E" alone is an (unsupported) suffix
+    assert _parse_mem('1E') is None
+
+
+def test_role_totals_from_parsed_nodes(tmp_path):
+    import sqlite3
+    import pytest
+    from data_gatherer.persistence.db import WorkloadDB
+    from data_gatherer.reporting.nodes_report import NodesReport
+
+    db = WorkloadDB(str(tmp_path / 'data.db'))
+    for name, labels, cpu, mem in [
+        ('master-1', {'node-role.kubernetes.io/master': ''}, '4', '16Gi'),
+        ('worker-1', {}, '8000m', '34359738368'),
+        ('worker-2', {}, 'bogus', '32Gi'),
+    ]:
+        db.upsert_node_capacity('c1', name, {
+            'metadata': {'name': name, 'labels': labels},
+            'status': {'capacity': {'cpu': cpu, 'memory': mem}, 'allocatable': {'cpu': cpu, 'memory': mem}},
+        })
+
+    report = NodesReport()
+    totals = report._role_totals(report._group_nodes_by_role(report._fetch_nodes(db, 'c1')))
+    assert totals == {
+        'master': (4000.0, 4000.0, 16384.0, 16384.0),
+        'worker': (8000.0, 8000.0, 65536.0, 65536.0),
+    }
+    # The report registers nothing on the connection it was handed
+    with pytest.raises(sqlite3.OperationalError):
+        db._conn.execute("SELECT parse_cpu('1')")
@@ -23,3 +23,21 @@ def test_normalize_removes_status_and_metadata_noise():
     assert 'resourceVersion' not in meta
     assert 'managedFields' not in meta
     assert meta['annotations'] == {'user.annotation/key': 'value'}
+
+def test_normalize_leaves_input_untouched():
+    obj = {
+        'kind': 'Deployment',
+        'metadata': {
+            'name': 'demo',
+            'uid': 'u1',
+            'annotations': {'deployment.kubernetes.io/revision': '3'},
+        },
+        'status': {'replicas': 1},
+        'spec': {'replicas': 1},
+    }
+    norm = normalize_manifest(obj)
+    assert norm == {'kind': 'Deployment', 'metadata': {'name': 'demo'}, 'spec': {'replicas': 1}}
+    # Only the parts that change are copied
+    assert obj['metadata'] == {'name': 'demo', 'uid': 'u1', 'annotations': {'deployment.kubernetes.io/revision': '3'}}
+    assert 'status' in obj
+    assert norm['spec'] is obj['spec']
@@ -32,3 +32,64 @@ def test_workload_queries(tmp_path):
     assert len(rows) == 1
     assert rows[0]['name'] == 'cm1'
     assert rows[0]['manifest']['metadata']['name'] == 'cm1'
+
+
+def test_iter_for_kinds_matches_list(tmp_path):
+    db = _make_db(tmp_path)
+    now = datetime.now(timezone.utc)
+    for kind, name in [('Deployment', 'b'), ('Deployment', 'a'), ('StatefulSet', 'c'), ('ConfigMap', 'cm')]:
+        manifest = {'kind': kind, 'metadata': {'name': name, 'namespace': 'ns'}}
+        db.upsert_workload('c1', 'apps/v1', kind, 'ns', name, '1', 'u', manifest, f'h-{name}', now)
+    wq = WorkloadQueries(db)
+    it = wq.iter_for_kinds('c1', ['Deployment', 'StatefulSet'])
+    assert not isinstance(it, list)
+    rows = list(it)
+    assert [(r['kind'], r['name']) for r in rows] == [('Deployment', 'a'), ('Deployment', 'b'), ('StatefulSet', 'c')]
+    assert rows == wq.list_for_kinds('c1', ['Deployment', 'StatefulSet'])
+    assert list(wq.iter_for_kinds('c1', [])) == []
+    it = wq.iter_all('c1')
+    assert not isinstance(it, list)
+    assert list(it) == wq.list_all('c1')
+    assert [(r['kind'], r['name']) for r in wq.list_all('c1')][0] == ('ConfigMap', 'cm')
+
+
+def test_manifests_are_parsed_per_query(tmp_path):
+    db = _make_db(tmp_path)
+    now = datetime.now(timezone.utc)
+    manifest = {'kind': 'Deployment', 'metadata': {'name': 'a'}, 'spec': {'replicas': 1}}
+    db.upsert_workload('c1', 'apps/v1', 'Deployment', 'ns', 'a', '1', 'u', manifest, 'h1', now)
+    first = WorkloadQueries(db).list_for_kinds('c1', ['Deployment'])[0]['manifest']
+    # Callers own the dicts they get back; changing one does not leak into the next query
+    first['spec']['replicas'] = 5
+    assert WorkloadQueries(db).list_all('c1')[0]['manifest']['spec']['replicas'] == 1
+    # An updated manifest is parsed afresh
+    manifest['spec']['replicas'] = 3
+    db.upsert_workload('c1', 'apps/v1', 'Deployment', 'ns', 'a', '2', 'u', manifest, 'h2', now)
+    assert WorkloadQueries(db).list_by_kind('c1', 'Deployment')[0]['manifest']['spec']['replicas'] == 3
+
+
+def test_iter_with_pod_spec_filters_in_sql(tmp_path):
+    db = _make_db(tmp_path)
+    now = datetime.now(timezone.utc)
+    pod = {'containers': [{'name': 'c'}]}
+    manifests = {
+        ('Deployment', 'with-spec'): {'spec': {'template': {'spec': pod}}},
+        ('Deployment', 'no-template'): {'spec': {'replicas': 1}},
+        ('CronJob', 'cron'): {'spec': {'jobTemplate': {'spec': {'template': {'spec': pod}}}}},
+        ('CronJob', 'cron-flat'): {'spec': {'template': {'spec': pod}}},
+    }
+    for (kind, name), manifest in manifests.items():
+        db.upsert_workload('c1', 'apps/v1', kind, 'ns', name, '1', 'u', manifest, f'h-{name}', now)
+    db._conn.execute("UPDATE workload SET manifest_json='not json' WHERE name='cron-flat'")
+    rows = list(WorkloadQueries(db).iter_with_pod_spec('c1', ['Deployment', 'CronJob']))
+    assert [(r['kind'], r['name']) for r in rows] == [('CronJob', 'cron'), ('Deployment', 'with-spec')]
+
+
+def test_iter_by_namespace_order(tmp_path):
+    db = _make_db(tmp_path)
+    now = datetime.now(timezone.utc)
+    rows = [('Deployment', 'b', 'x'), ('ConfigMap', 'b', 'y'), ('ClusterRole', '', 'r'), ('Deployment', 'a', 'z')]
+    for i, (kind, ns, name) in enumerate(rows):
+        db.upsert_workload('c1', 'v1', kind, ns, name, '1', f'u{i}', {'kind': kind}, f'h{i}', now)
+    got = [(r['namespace'], r['kind'], r['name']) for r in WorkloadQueries(db).iter_by_namespace('c1')]
+    assert got == [('', 'ClusterRole', 'r'), ('a', 'Deployment', 'z'), ('b', 'ConfigMap', 'y'), ('b', 'Deployment', 'x')]
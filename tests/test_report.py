@@ -79,4 +79,124 @@ def test_report_explicit_out():
     assert os.path.exists(out_file)
     content = open(out_file, 'r', encoding='utf-8').read()
     assert '<table' in content  # at least one table rendered
-    assert 'Deployment' in content
\ No newline at end of file
+    assert 'Deployment' in content
+
+def test_summary_manifest_json_matches_json_module():
+    import json
+    from data_gatherer.reporting.summary_report import _pretty_json
+    manifest = {
+        'kind': 'Deployment',
+        'metadata': {'name': 'web', 'labels': {'b': '2', 'a': '1'}},
+        'spec': {'replicas': 3, 'paused': False, 'template': {'spec': {'containers': []}}},
+        'status': {},
+    }
+    assert _pretty_json(manifest) == json.dumps(manifest, indent=2, sort_keys=True)
+    # Values orjson cannot encode go through the json module
+    big = {'value': 2 ** 70}
+    assert _pretty_json(big) == json.dumps(big, indent=2, sort_keys=True)
+
+
+def test_cli_json_output_keeps_key_order():
+    import json
+    from data_gatherer.util.jsonfmt import pretty_json
+    summary = {'by_kind': {'StatefulSet': 1, 'Deployment': 2}, 'removed': 0, 'skipped_kinds': [], 'nodes': {}}
+    assert pretty_json(summary) == json.dumps(summary, indent=2)
+    assert pretty_json({1: 'a'}) == json.dumps({1: 'a'}, indent=2)
+
+
+def test_report_multiple_clusters():
+  with tempfile.TemporaryDirectory() as tmp:
+    config_path = os.path.join(tmp, 'config.yaml')
+    base_dir = os.path.join(tmp, 'clusters')
+    _write_config(config_path, base_dir)
+    with open(config_path, encoding='utf-8') as f:
+        config = f.read()
+    # Second cluster c2, configured but never initialized
+    config = config.replace('\nstorage:', '  - name: c2\n    credentials:\n      host: https://dummy2\n\nstorage:')
+    with open(config_path, 'w', encoding='utf-8') as f:
+        f.write(config)
+    _seed_db(base_dir)
+    runner = CliRunner()
+    result = runner.invoke(cli, ['--config', config_path, 'report', '--all-clusters'])
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    # Clusters run concurrently, so their lines may interleave; each names its cluster
+    assert '[c1] Generating summary report...' in lines
+    assert '[c2] Skipping: not initialized' in lines
+    assert all(line.startswith(('[c1] ', '[c2] ')) for line in lines)
+    assert len(glob.glob(os.path.join(base_dir, 'c1', 'reports', 'summary-*.html'))) == 1
+
+
+def test_cli_reuses_parsed_config_until_file_changes(monkeypatch):
+    import data_gatherer.run as run_module
+    loads = []
+    real_load = run_module.load_config
+
+    def counting_load(path):
+        loads.append(path)
+        return real_load(path)
+
+    monkeypatch.setattr(run_module, 'load_config', counting_load)
+    with tempfile.TemporaryDirectory() as td:
+        cfg_path = os.path.join(td, 'config.yaml')
+        _write_config(cfg_path, td)
+        _seed_db(td)
+        runner = CliRunner()
+        for _ in range(2):
+            res = runner.invoke(cli, ['--config', cfg_path, 'status', '--cluster', 'c1'])
+            assert res.exit_code == 0, res.output
+        assert len(loads) == 1
+        with open(cfg_path, 'a', encoding='utf-8') as f:
+            f.write('\n# edited\n')
+        res = runner.invoke(cli, ['--config', cfg_path, 'status', '--cluster', 'c1'])
+        assert res.exit_code == 0, res.output
+        assert len(loads) == 2
+
+
+def test_report_all_uses_process_pool_with_several_cores(monkeypatch):
+    import data_gatherer.run as run_module
+    monkeypatch.setattr(run_module.os, 'cpu_count', lambda: 2)
+    opened = []
+    real_db = run_module.WorkloadDB
+    monkeypatch.setattr(run_module, 'WorkloadDB', lambda *a, **kw: opened.append(a) or real_db(*a, **kw))
+    with tempfile.TemporaryDirectory() as td:
+        cfg_path = os.path.join(td, 'config.yaml')
+        _write_config(cfg_path, td)
+        _seed_db(td)
+        out_dir = os.path.join(td, 'out')
+        os.makedirs(out_dir)
+        runner = CliRunner()
+        res = runner.invoke(cli, ['--config', cfg_path, 'report', '--cluster', 'c1', '--all', '--out', out_dir])
+        assert res.exit_code == 0, res.output
+        assert '✗' not in res.output
+        written = [line for line in res.output.splitlines() if '✓ Wrote' in line]
+        assert written and all(os.path.exists(line.split(' to ', 1)[1]) for line in written)
+        assert f'Generated {len(written)} reports successfully.' in res.output
+        # Workers open their own connections; the parent process opens none
+        assert opened == []
+
+
+def test_status_and_nodes_ndjson_output():
+    import json
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, 'config.yaml')
+        base_dir = os.path.join(tmp, 'clusters')
+        _write_config(config_path, base_dir)
+        with open(config_path, encoding='utf-8') as f:
+            config = f.read()
+        config = config.replace('\nstorage:', '  - name: c2\n    credentials:\n      host: https://dummy2\n\nstorage:')
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.write(config)
+        _seed_db(base_dir)
+        runner = CliRunner()
+        result = runner.invoke(cli, ['--config', config_path, 'status', '--all-clusters', '--output-format', 'ndjson'])
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r['cluster'] for r in records] == ['c1', 'c2']
+        assert records[0]['by_kind']['Deployment'] == 1
+        assert records[1] == {'cluster': 'c2', 'error': 'not initialized'}
+        result = runner.invoke(cli, ['--config', config_path, 'nodes', '--all-clusters', '--output-format', 'ndjson'])
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r['cluster'] for r in records] == ['c1', 'c2']
+        assert 'nodes' in records[0] and records[1]['error'] == 'not initialized'
@@ -2,6 +2,7 @@ from click.testing import CliRunner
 from data_gatherer.run import cli
 import json
 import os
+import pytest
 
 
 def test_list_report_types(tmp_path):
@@ -62,3 +63,32 @@ def test_summary_report_and_removed_json(tmp_path):
     assert res2.exit_code != 0
 
 
+
+
+def test_register_rejects_duplicate_type_name():
+    from data_gatherer.reporting.base import ReportGenerator, register, get_generator
+    import data_gatherer.reporting.summary_report  # noqa: F401  (registers 'summary')
+
+    class OtherSummary(ReportGenerator):
+        type_name = 'summary'
+        file_extension = '.html'
+
+        def generate(self, db, cluster, out_path, format='html'):
+            pass
+
+    with pytest.raises(ValueError):
+        register(OtherSummary)
+    assert type(get_generator('summary')).__name__ == 'SummaryReport'
+
+
+def test_get_generator_imports_only_requested_module():
+    import subprocess
+    import sys
+    code = (
+        "import sys\n"
+        "from data_gatherer.reporting.base import get_generator\n"
+        "get_generator('nodes')\n"
+        "print(sorted(m for m in sys.modules if m.startswith('data_gatherer.reporting.') and m.endswith('_report')))\n"
+    )
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "['data_gatherer.reporting.nodes_report']"
@@ -46,6 +46,13 @@ class TestRuleRegistry:
         assert registry.disable_rule('nonexistent') is False
         assert registry.enable_rule('nonexistent') is False
 
+    def test_register_duplicate_name_raises(self):
+        registry = RuleRegistry()
+        registry.register(MissingCpuRequestRule())
+        with pytest.raises(ValueError):
+            registry.register(MissingCpuRequestRule())
+        assert len(registry.get_rules()) == 1
+
 
 class TestRulesEngine:
     def test_engine_with_empty_registry(self):
@@ -220,3 +227,98 @@ class TestRulesEngineIntegration:
         engine.clear_cache()
         r3 = engine.evaluate_cell(context)
         assert r3.rule_type == r1.rule_type
+
+
+class TestCellFormatter:
+    def test_make_cell_formatter_matches_generic_formatting(self):
+        from data_gatherer.reporting.common import make_cell_formatter, format_cell_with_condition
+        columns = ['Name', 'CPU_req_m', 'Image_Pull_Policy']
+        formatters = make_cell_formatter('containers', columns)
+        row = {'Name': 'a<b', 'CPU_req_m': '', 'Image_Pull_Policy': 'Always'}
+        for column in columns:
+            expected = format_cell_with_condition(row[column], column, row, 'containers')
+            assert formatters[column](row[column], row) == expected
+        assert formatters['Name']('a<b', row) == '<td>a&lt;b</td>'
+
+
+class TestColumnRuleDispatch:
+    def test_rules_resolved_once_per_column(self):
+        calls = []
+
+        class CountingRule(MissingCpuRequestRule):
+            def applies_to(self, context):
+                calls.append(context['column_name'])
+                return super().applies_to(context)
+
+        registry = RuleRegistry()
+        registry.register(CountingRule())
+        engine = RulesEngine(registry)
+        for value in ['', '100m', '200m']:
+            engine.evaluate_cell({'cell_value': value, 'column_name': 'CPU_req_m', 'row_data': {}, 'report_type': 'containers'})
+        assert calls == ['CPU_req_m']
+
+    def test_registry_changes_invalidate_column_rules(self):
+        registry = RuleRegistry()
+        register_official_rules(registry)
+        engine = RulesEngine(registry)
+        context = {'cell_value': '', 'column_name': 'CPU_req_m', 'row_data': {}, 'report_type': 'containers'}
+        assert engine.evaluate_cell(context).rule_type == RuleType.ERROR_MISS
+        registry.disable_rule('missing_cpu_request')
+        assert engine.evaluate_cell(context).rule_type == RuleType.NONE
+        assert all(r.name != 'missing_cpu_request' for r in engine.rules_for_column('containers', 'CPU_req_m'))
+
+    def test_cache_key_uses_only_row_keys_rules_read(self):
+        registry = RuleRegistry()
+        register_official_rules(registry)
+        engine = RulesEngine(registry)
+        # Image pull policy rule reads the cell value only: rows share one result
+        a = engine.evaluate_cell({'cell_value': 'Always', 'column_name': 'Image_Pull_Policy',
+                                  'row_data': {'Name': 'a'}, 'report_type': 'containers'})
+        b = engine.evaluate_cell({'cell_value': 'Always', 'column_name': 'Image_Pull_Policy',
+                                  'row_data': {'Name': 'b'}, 'report_type': 'containers'})
+        assert a is b
+        # Request/limit skew reads the limit from the row, so rows must not collide
+        row = {'CPU_req_m': '100', 'CPU_lim_m': '1000'}
+        skewed = engine.evaluate_cell({'cell_value': '100', 'column_name': 'CPU_req_m',
+                                       'row_data': row, 'report_type': 'containers'})
+        row = {'CPU_req_m': '100', 'CPU_lim_m': '200'}
+        balanced = engine.evaluate_cell({'cell_value': '100', 'column_name': 'CPU_req_m',
+                                         'row_data': row, 'report_type': 'containers'})
+        assert skewed.rule_type == RuleType.WARNING_MISCONF
+        assert balanced.rule_type == RuleType.NONE
+
+    def test_numeric_zero_is_not_missing(self):
+        registry = RuleRegistry()
+        register_official_rules(registry)
+        engine = RulesEngine(registry)
+        for value in ['0', 0]:
+            result = engine.evaluate_cell({'cell_value': value, 'column_name': 'CPU_req_m',
+                                           'row_data': {}, 'report_type': 'containers'})
+            assert result.rule_type == RuleType.NONE
+
+    def test_columns_without_rules_return_shared_none_result(self):
+        registry = RuleRegistry()
+        register_official_rules(registry)
+        engine = RulesEngine(registry)
+        a = engine.evaluate_cell({'cell_value': 'x', 'column_name': 'Name', 'row_data': {}, 'report_type': 'containers'})
+        b = engine.evaluate_cell({'cell_value': 'y', 'column_name': 'Name', 'row_data': {}, 'report_type': 'containers'})
+        assert a is b
+        assert not a
+        assert engine._evaluation_cache == {}
+
+    def test_evaluate_column_matches_per_cell(self):
+        registry = RuleRegistry()
+        register_official_rules(registry)
+        engine = RulesEngine(registry)
+        rows = [
+            {'CPU_req_m': 100, 'CPU_lim_m': 1000},
+            {'CPU_req_m': '', 'CPU_lim_m': 1000},
+            {'CPU_req_m': 100, 'CPU_lim_m': 200},
+        ]
+        for column in ['CPU_req_m', 'CPU_lim_m', 'Name']:
+            values = [row.get(column, 'x') for row in rows]
+            expected = [
+                engine.evaluate_cell({'cell_value': v, 'column_name': column, 'row_data': r, 'report_type': 'containers'})
+                for v, r in zip(values, rows)
+            ]
+            assert engine.evaluate_column('containers', column, values, rows) == expected
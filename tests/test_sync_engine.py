@@ -0,0 +1,77 @@
+import json
+from data_gatherer.persistence.db import WorkloadDB
+from data_gatherer.sync import engine
+from data_gatherer.sync.engine import SyncEngine
+from data_gatherer.sync.normalize import normalize_manifest
+from data_gatherer.util.hash import sha256_of_manifest
+
+
+def test_sync_stores_the_hashed_canonical_json(tmp_path):
+    db = WorkloadDB(str(tmp_path / 'data.db'))
+    item = {'kind': 'Deployment', 'metadata': {'name': 'web', 'namespace': 'ns', 'uid': 'u1'}, 'spec': {'x': 'é'}}
+    SyncEngine(db, 'c1').sync_kind('apps/v1', 'Deployment', [item])
+    stored_json, stored_hash = db._conn.execute('SELECT manifest_json, manifest_hash FROM workload').fetchone()
+    norm = normalize_manifest(item)
+    assert stored_json == json.dumps(norm, separators=(',', ':'), sort_keys=True)
+    assert stored_hash == sha256_of_manifest(norm)
+
+
+def test_serialize_pool_never_forks_the_sync_process(monkeypatch):
+    monkeypatch.setattr(engine.os, 'cpu_count', lambda: 1)
+    assert engine.make_serialize_pool() is None
+    monkeypatch.setattr(engine.os, 'cpu_count', lambda: 2)
+    pool = engine.make_serialize_pool()
+    try:
+        assert pool._max_workers == 2
+        assert pool._mp_context.get_start_method() in ('forkserver', 'spawn')
+        assert list(pool.map(engine._serialize_manifest, [{'b': 1, 'a': 2}])) == [
+            ('{"a":2,"b":1}', sha256_of_manifest({'a': 2, 'b': 1}))
+        ]
+    finally:
+        pool.shutdown()
+
+
+def test_sync_serializes_large_kinds_in_the_given_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine, 'PARALLEL_SERIALIZE_MIN_ITEMS', 10)
+    monkeypatch.setattr(engine, 'PARALLEL_SERIALIZE_CHUNKSIZE', 4)
+
+    class RecordingPool:
+        def __init__(self):
+            self.calls = []
+
+        def map(self, fn, items, chunksize):
+            self.calls.append((len(items), chunksize))
+            return map(fn, items)
+
+    pool = RecordingPool()
+    items = [{'kind': 'ConfigMap', 'metadata': {'name': f'cm{i}', 'namespace': 'ns', 'resourceVersion': str(i)},
+              'data': {'k': 'v' * i}} for i in range(12)]
+    db = WorkloadDB(str(tmp_path / 'data.db'))
+    sync = SyncEngine(db, 'c1', serialize_pool=pool)
+    sync.sync_kind('v1', 'ConfigMap', items)
+    # Small kinds stay in-process
+    sync.sync_kind('v1', 'Secret', [{'kind': 'Secret', 'metadata': {'name': 's', 'namespace': 'ns'}}])
+    assert pool.calls == [(12, 4)]
+    stored = db._conn.execute("SELECT name, resource_version, manifest_hash FROM workload WHERE kind='ConfigMap' ORDER BY id").fetchall()
+    assert [tuple(r) for r in stored] == [
+        (f'cm{i}', str(i), sha256_of_manifest(normalize_manifest(item))) for i, item in enumerate(items)
+    ]
+
+
+def test_sync_skips_serializing_items_at_stored_resource_version(tmp_path, monkeypatch):
+    db = WorkloadDB(str(tmp_path / 'data.db'))
+    sync = SyncEngine(db, 'c1')
+    items = [{'kind': 'ConfigMap', 'metadata': {'name': name, 'namespace': 'ns', 'resourceVersion': '1'},
+              'data': {'k': name}} for name in ('a', 'b')]
+    sync.sync_kind('v1', 'ConfigMap', items)
+
+    serialized = []
+    real_normalize = engine.normalize_manifest
+    monkeypatch.setattr(engine, 'normalize_manifest',
+                        lambda item: serialized.append(item['metadata']['name']) or real_normalize(item))
+    items[0]['metadata']['resourceVersion'] = '2'
+    items[0]['data']['k'] = 'changed'
+    assert sync.sync_kind('v1', 'ConfigMap', items) == [('ConfigMap', 'ns', 'a'), ('ConfigMap', 'ns', 'b')]
+    assert serialized == ['a']
+    stored = db._conn.execute('SELECT name, resource_version, manifest_json FROM workload ORDER BY name').fetchall()
+    assert [(name, rv, '"changed"' in manifest) for name, rv, manifest in stored] == [('a', '2', True), ('b', '1', False)]